@@ -0,0 +1,259 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+BENCHMARK_DIR: str = ".benchmarks"
+BENCHMARK_RESULTS_PATH: str = os.path.join(BENCHMARK_DIR, "current.json")
+BENCHMARK_BASELINE_PATH: str = os.path.join(BENCHMARK_DIR, "baseline.json")
+BENCHMARK_BACKENDS: List[str] = ["one_max_genetic_algorithm_numpy", "one_max_genetic_algorithm_vanilla"]
+MICRO_POPULATION_SIZE: int = 100
+MICRO_GENOME_LENGTH: int = 100
+MICRO_REPEATS: int = 15
+MACRO_POPULATION_SIZES: List[int] = [50, 100, 200]
+MACRO_GENOME_LENGTHS: List[int] = [50, 200, 1000]
+MACRO_GENERATIONS: int = 50
+MACRO_REPEATS: int = 5
+MIN_TIME: float = 0.05  # Minimum seconds of every repeat, fast functions are called in a loop to reach it
+REGRESSION_THRESHOLD: float = 0.1
+MUTATION_RATE: float = 0.01
+CROSSOVER_RATE: float = 0.7
+SEED: int = 0
+
+Benchmark = Callable[[], Any]
+
+
+def get_number(func: Benchmark, min_time: float = MIN_TIME) -> int:
+    # Calls per repeat, doubled until one repeat takes at least min_time
+    number = 1
+    while True:
+        start_time = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start_time >= min_time:
+            return number
+        number *= 2
+
+
+def measure(func: Benchmark, repeats: int, min_time: float = MIN_TIME) -> Tuple[List[float], int]:
+    # Seconds per call of every repeat, the calibration doubles as warm up
+    number = get_number(func, min_time)
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start_time) / number)
+    return times, number
+
+
+def summarize(times: List[float], number: int) -> Dict[str, float]:
+    # Median and interquartile range are robust to the occasional slow repeat
+    first_quartile, median, third_quartile = statistics.quantiles(times, n=4) if len(times) > 1 else times * 3
+    return {
+        "median": median,
+        "q1": first_quartile,
+        "q3": third_quartile,
+        "iqr": third_quartile - first_quartile,
+        "min": min(times),
+        "max": max(times),
+        "repeats": len(times),
+        "number": number,
+    }
+
+
+def get_build(backend: ModuleType) -> str:
+    # Modules compiled with mypyc are extension modules instead of python sources
+    return "python" if (backend.__file__ or "").endswith(".py") else "mypyc"
+
+
+def get_backend_label(backend: ModuleType) -> str:
+    return f"{backend.__name__.rsplit('.', 1)[-1].replace('one_max_genetic_algorithm_', '')}/{get_build(backend)}"
+
+
+def get_micro_benchmarks(backend: ModuleType, population_size: int, genome_length: int) -> Dict[str, Benchmark]:
+    # Every operator runs on the same seeded population, so the results only change when the code does
+    backend.set_seed(SEED)
+    population = backend.init_population(population_size, genome_length)
+    fitness_values = backend.calculate_population_fitnesses(population)
+    parent1, parent2 = population[0], population[1]
+    genome = backend.init_population(1, genome_length)[0]  # Mutated in place on every call
+    return {
+        "init_population": lambda: backend.init_population(population_size, genome_length),
+        "select_parent_tournament": lambda: backend.select_parent(population, fitness_values, "tournament"),
+        "select_parent_roulette": lambda: backend.select_parent(population, fitness_values, "roulette"),
+        "crossover": lambda: backend.crossover(parent1, parent2, 1.0),
+        "mutate": lambda: backend.mutate(genome, MUTATION_RATE),
+        "calculate_population_fitnesses": lambda: backend.calculate_population_fitnesses(population),
+        "create_new_population": lambda: backend.create_new_population(
+            population_size, population, fitness_values, "tournament", CROSSOVER_RATE, MUTATION_RATE
+        ),
+    }
+
+
+def get_macro_benchmarks(
+    backend: ModuleType, population_sizes: List[int], genome_lengths: List[int], generations: int
+) -> Dict[str, Benchmark]:
+    # The target generation fitness is out of reach, so every run evolves all the generations
+    def get_run(population_size: int, genome_length: int) -> Benchmark:
+        return lambda: backend.genetic_algorithm(
+            population_size,
+            genome_length,
+            generations,
+            MUTATION_RATE,
+            CROSSOVER_RATE,
+            "tournament",
+            target_generation_fitness=1.1,
+            seed=SEED,
+        )
+
+    return {
+        f"genetic_algorithm[population_size={population_size},genome_length={genome_length}]": get_run(
+            population_size, genome_length
+        )
+        for population_size in population_sizes
+        for genome_length in genome_lengths
+    }
+
+
+def run_benchmarks(
+    backend_names: List[str],
+    suites: List[str],
+    micro_population_size: int = MICRO_POPULATION_SIZE,
+    micro_genome_length: int = MICRO_GENOME_LENGTH,
+    micro_repeats: int = MICRO_REPEATS,
+    macro_population_sizes: List[int] = MACRO_POPULATION_SIZES,
+    macro_genome_lengths: List[int] = MACRO_GENOME_LENGTHS,
+    macro_generations: int = MACRO_GENERATIONS,
+    macro_repeats: int = MACRO_REPEATS,
+    min_time: float = MIN_TIME,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    benchmarks: Dict[str, Dict[str, float]] = {}
+    for backend_name in backend_names:
+        backend = import_module(backend_name)
+        label = get_backend_label(backend)
+        suite_benchmarks: List[Tuple[str, Dict[str, Benchmark], int]] = []
+        if "micro" in suites:
+            micro_benchmarks = get_micro_benchmarks(backend, micro_population_size, micro_genome_length)
+            suite_benchmarks.append(("micro", micro_benchmarks, micro_repeats))
+        if "macro" in suites:
+            macro_benchmarks = get_macro_benchmarks(
+                backend, macro_population_sizes, macro_genome_lengths, macro_generations
+            )
+            suite_benchmarks.append(("macro", macro_benchmarks, macro_repeats))
+
+        for suite, suite_functions, repeats in suite_benchmarks:
+            for name, func in suite_functions.items():
+                times, number = measure(func, repeats, min_time)
+                full_name = f"{label}/{suite}/{name}"
+                benchmarks[full_name] = summarize(times, number)
+                if verbose:
+                    print(f"{full_name:<76} {benchmarks[full_name]['median'] * 1e6:>14.2f} us")
+
+    return {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "micro_population_size": micro_population_size,
+            "micro_genome_length": micro_genome_length,
+            "macro_generations": macro_generations,
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = REGRESSION_THRESHOLD
+) -> List[Tuple[str, float, float, str]]:
+    # A benchmark regressed when its median grew by more than threshold plus the noise of both runs (their IQRs), and
+    # improved in the symmetric case. Benchmarks missing from either file are reported but never fail the comparison.
+    rows = []
+    for name in sorted(set(baseline["benchmarks"]) | set(current["benchmarks"])):
+        if name not in baseline["benchmarks"]:
+            rows.append((name, 0.0, current["benchmarks"][name]["median"], "new"))
+            continue
+        if name not in current["benchmarks"]:
+            rows.append((name, baseline["benchmarks"][name]["median"], 0.0, "missing"))
+            continue
+        baseline_stats = baseline["benchmarks"][name]
+        current_stats = current["benchmarks"][name]
+        tolerance = threshold * baseline_stats["median"] + max(baseline_stats["iqr"], current_stats["iqr"])
+        difference = current_stats["median"] - baseline_stats["median"]
+        status = "regression" if difference > tolerance else "improvement" if -difference > tolerance else "ok"
+        rows.append((name, baseline_stats["median"], current_stats["median"], status))
+    return rows
+
+
+def print_comparison(rows: List[Tuple[str, float, float, str]]) -> None:
+    print(f"{'Benchmark':<76} {'Baseline (us)':>14} {'Current (us)':>14} {'Change':>8}  Status")
+    for name, baseline_median, current_median, status in rows:
+        change = f"{current_median / baseline_median - 1:+.1%}" if baseline_median and current_median else ""
+        print(f"{name:<76} {baseline_median * 1e6:>14.2f} {current_median * 1e6:>14.2f} {change:>8}  {status}")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the genetic algorithm operators and full runs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and write their statistics as JSON")
+    run_parser.add_argument("--output", default=BENCHMARK_RESULTS_PATH, help="Path of the JSON results")
+    run_parser.add_argument("--suite", choices=["micro", "macro", "all"], default="all")
+    run_parser.add_argument("--backends", nargs="+", default=BENCHMARK_BACKENDS, help="Backend modules to benchmark")
+    run_parser.add_argument("--quick", action="store_true", help="Fewer repeats and a single macro configuration")
+    compare_parser = subparsers.add_parser("compare", help="Flag the regressions of a run against a baseline")
+    compare_parser.add_argument("baseline", nargs="?", default=BENCHMARK_BASELINE_PATH)
+    compare_parser.add_argument("current", nargs="?", default=BENCHMARK_RESULTS_PATH)
+    compare_parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Allowed slowdown")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+        print_comparison(rows)
+        regressions = [row for row in rows if row[3] == "regression"]
+        print(f"{len(regressions)} regression(s) out of {len(rows)} benchmarks.")
+        return 1 if regressions else 0
+
+    suites = ["micro", "macro"] if args.suite == "all" else [args.suite]
+    if args.quick:
+        results = run_benchmarks(
+            args.backends,
+            suites,
+            micro_repeats=5,
+            macro_population_sizes=MACRO_POPULATION_SIZES[:1],
+            macro_genome_lengths=MACRO_GENOME_LENGTHS[:1],
+            macro_repeats=3,
+            min_time=0.01,
+            verbose=True,
+        )
+    else:
+        results = run_benchmarks(args.backends, suites, verbose=True)
+    save_results(results, args.output)
+    print(f"Saved {len(results['benchmarks'])} benchmarks to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+import json
+import os
+import shutil
+from typing import Any, Dict
+
+CHECKPOINT_DIR: str = ".checkpoints"
+SWEEP_CHECKPOINT_PATH: str = os.path.join(CHECKPOINT_DIR, "sweep.json")
+RUN_CHECKPOINT_DIR: str = os.path.join(CHECKPOINT_DIR, "runs")
+
+
+def save_sweep_checkpoint(state: Dict[str, Any], path: str = SWEEP_CHECKPOINT_PATH) -> None:
+    # Written to a temporary file first so a crash while saving never corrupts the previous checkpoint
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as checkpoint_file:
+        json.dump(state, checkpoint_file)
+    os.replace(temp_path, path)
+
+
+def load_sweep_checkpoint(path: str = SWEEP_CHECKPOINT_PATH) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"There is no sweep checkpoint to resume at {path}.")
+    with open(path) as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def clear_checkpoints(checkpoint_dir: str = CHECKPOINT_DIR) -> None:
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
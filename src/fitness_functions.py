@@ -0,0 +1,185 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol
+
+import numpy as np
+
+FITNESS_FUNCTIONS: List[str] = ["onemax", "trap", "nk", "knapsack"]
+TRAP_BLOCK_SIZE: int = 5
+NK_K: int = 3  # Neighbors of every locus in NK landscapes
+NK_RESOLUTION: int = 2**16  # Contributions are integers so the fitness of the optimum is exactly its target
+KNAPSACK_MAX_WEIGHT: int = 100
+KNAPSACK_MAX_VALUE: int = 100
+KNAPSACK_CAPACITY_RATIO: float = 0.5  # Share of the total weight of the items that fits in the knapsack
+FITNESS_CACHE_SIZE: int = 2**16  # Genomes remembered by a fitness cache
+
+
+class FitnessFunction(Protocol):
+    # Any object with these members can replace the built-in One Max fitness of the numpy and vanilla backends. It
+    # evaluates the whole (population, genome) matrix in one call, scaled so that target is its optimum.
+    name: str
+    target: float
+
+    def evaluate(self, population: Any) -> np.ndarray: ...
+
+
+class OneMax:
+    # The fitness the backends use when no fitness function is given, the share of ones of each genome
+    def __init__(self) -> None:
+        self.name: str = "onemax"
+        self.target: float = 1.0
+
+    def evaluate(self, population: Any) -> np.ndarray:
+        return np.mean(population, axis=-1)
+
+
+class DeceptiveTrap:
+    # Splits the genome into blocks of block_size bits. A block of only ones scores block_size, any other block
+    # scores more the fewer ones it has, which leads hill climbers away from the optimum of all ones.
+    def __init__(self, genome_length: int, block_size: int = 4) -> None:
+        if block_size < 2 or genome_length % block_size != 0:
+            raise ValueError(f"The genome length {genome_length} must be a multiple of a block size of at least 2.")
+        self.name: str = f"trap(block_size={block_size})"
+        self.target: float = 1.0
+        self.genome_length: int = genome_length
+        self.block_size: int = block_size
+
+    def evaluate(self, population: Any) -> np.ndarray:
+        population = np.asarray(population)
+        ones = population.reshape(*population.shape[:-1], -1, self.block_size).sum(axis=-1)
+        traps = np.where(ones == self.block_size, self.block_size, self.block_size - 1 - ones)
+        return traps.sum(axis=-1) / self.genome_length
+
+
+class NKLandscape:
+    # Every locus contributes a random integer looked up by its own bit and the k bits that follow it, so k tunes how
+    # rugged the landscape is. Neighborhoods are adjacent and do not wrap around, which lets dynamic programming
+    # find the optimum exactly. The fitness is the sum of contributions divided by the optimum.
+    def __init__(self, genome_length: int, k: int = 3, seed: Optional[int] = None) -> None:
+        if not 0 <= k < genome_length:
+            raise ValueError(f"k must be between 0 and the genome length minus 1, got {k}.")
+        self.name: str = f"nk(k={k},seed={seed})"
+        self.target: float = 1.0
+        self.genome_length: int = genome_length
+        self.k: int = k
+        # One row per locus indexed by its window of bits. The windows of the last k loci run past the genome and are
+        # padded with zeros.
+        self.tables = np.random.default_rng(seed).integers(0, NK_RESOLUTION, size=(genome_length, 2 ** (k + 1)))
+        self.optimum: int = self.get_optimum()
+
+    def get_contributions(self, population: Any) -> np.ndarray:
+        population = np.asarray(population, dtype=np.int64)
+        padded = np.concatenate([population, np.zeros((*population.shape[:-1], self.k), dtype=np.int64)], axis=-1)
+        windows = sum(
+            padded[..., offset : offset + self.genome_length] << (self.k - offset) for offset in range(self.k + 1)
+        )
+        return self.tables[np.arange(self.genome_length), windows].sum(axis=-1)
+
+    def get_optimum(self) -> int:
+        # best[state] is the highest sum of the completed loci when the last k bits chosen are state. Every new bit
+        # completes the locus k bits before it, the last k loci are completed by the final state.
+        states = 2**self.k
+        windows = np.arange(2 * states)  # The bit of a locus followed by its k neighbors
+        best = np.zeros(states, dtype=np.int64)
+        for locus in range(self.genome_length - self.k):
+            best = (best[windows >> 1] + self.tables[locus, windows]).reshape(2, states).max(axis=0)
+        for locus in range(self.genome_length - self.k, self.genome_length):
+            remaining_bits = self.genome_length - locus
+            windows = (np.arange(states) & (2**remaining_bits - 1)) << (self.k + 1 - remaining_bits)
+            best = best + self.tables[locus, windows]
+        return int(best.max())
+
+    def evaluate(self, population: Any) -> np.ndarray:
+        return self.get_contributions(population) / self.optimum
+
+
+class Knapsack:
+    # Every bit packs one item with a random integer weight and value. The fitness is the total value divided by the
+    # best one that fits, found by dynamic programming over the capacity. Overweight genomes lose the best value per
+    # weight of any item for their excess weight plus the heaviest item, so they never beat the best subset that fits.
+    def __init__(
+        self, genome_length: int, seed: Optional[int] = None, capacity_ratio: float = KNAPSACK_CAPACITY_RATIO
+    ) -> None:
+        rng = np.random.default_rng(seed)
+        self.name: str = f"knapsack(seed={seed},capacity_ratio={capacity_ratio})"
+        self.target: float = 1.0
+        self.weights = rng.integers(1, KNAPSACK_MAX_WEIGHT + 1, size=genome_length)
+        self.values = rng.integers(1, KNAPSACK_MAX_VALUE + 1, size=genome_length)
+        self.capacity: int = int(self.weights.sum() * capacity_ratio)
+        self.penalty_rate: float = float(np.max(self.values / self.weights))
+        self.max_weight: int = int(self.weights.max())
+        self.optimum: int = self.get_optimum()
+
+    def get_optimum(self) -> int:
+        best = np.zeros(self.capacity + 1, dtype=np.int64)  # Highest value of the items seen so far for each capacity
+        for weight, value in zip(self.weights, self.values):
+            if weight <= self.capacity:
+                best[weight:] = np.maximum(best[weight:], best[:-weight] + value)
+        return int(best[-1])
+
+    def evaluate(self, population: Any) -> np.ndarray:
+        population = np.asarray(population, dtype=np.int64)
+        excess = np.maximum(population @ self.weights - self.capacity, 0)
+        penalty = np.where(excess > 0, self.penalty_rate * (excess + self.max_weight), 0.0)
+        return np.maximum(population @ self.values - penalty, 0.0) / self.optimum
+
+
+class CachedFitnessFunction:
+    # Remembers the fitness of the last maxsize genomes evaluated, so clones and survivors are not evaluated again.
+    # Genomes are keyed by their packed bits, and the least recently used one is evicted when the cache is full.
+    # Only the distinct genomes missing from the cache reach the wrapped fitness function, in a single call.
+    def __init__(self, fitness_function: FitnessFunction, maxsize: int = FITNESS_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("The fitness cache must hold at least 1 genome.")
+        self.fitness_function: FitnessFunction = fitness_function
+        self.name: str = fitness_function.name  # Cached fitness values are the same, so are the results
+        self.target: float = fitness_function.target
+        self.maxsize: int = maxsize
+        self.cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def evaluate(self, population: Any) -> np.ndarray:
+        population = np.asarray(population)
+        keys = [key.tobytes() for key in np.packbits(population, axis=-1)]
+        fitness_values = np.empty(len(keys))
+        missing: Dict[bytes, List[int]] = {}  # Indices of every copy of each genome missing from the cache
+        for index, key in enumerate(keys):
+            fitness = self.cache.get(key)
+            if fitness is None:
+                missing.setdefault(key, []).append(index)
+            else:
+                self.cache.move_to_end(key)
+                fitness_values[index] = fitness
+        if missing:
+            missing_fitness = self.fitness_function.evaluate(population[[indices[0] for indices in missing.values()]])
+            for (key, indices), fitness in zip(missing.items(), missing_fitness):
+                fitness_values[indices] = fitness
+                self.cache[key] = float(fitness)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+                self.stats["evictions"] += 1
+        self.stats["hits"] += len(keys) - len(missing)
+        self.stats["misses"] += len(missing)
+        return fitness_values
+
+    def get_hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+
+def get_fitness_function(
+    name: str, genome_length: int, seed: Optional[int] = None, cache_size: int = 0
+) -> Optional[FitnessFunction]:
+    # None for One Max, which the backends compute themselves. The seed picks the instance of the random problems,
+    # and a cache_size above 0 puts a cache of that many genomes in front of the fitness function.
+    if name not in FITNESS_FUNCTIONS:
+        raise ValueError(f"Unknown fitness function {name}, use one of {FITNESS_FUNCTIONS}.")
+    fitness_function: Optional[FitnessFunction] = None
+    if name == "trap":
+        fitness_function = DeceptiveTrap(genome_length, TRAP_BLOCK_SIZE)
+    elif name == "nk":
+        fitness_function = NKLandscape(genome_length, NK_K, seed)
+    elif name == "knapsack":
+        fitness_function = Knapsack(genome_length, seed)
+    if cache_size > 0:  # One Max is cheaper than the lookups, it is only cached to measure how often genomes repeat
+        return CachedFitnessFunction(fitness_function or OneMax(), cache_size)
+    return fitness_function
@@ -0,0 +1,92 @@
+from time import perf_counter_ns
+from typing import Any, Dict, List, Tuple
+
+CURVE_POINTS: int = 10  # Generations of the fitness curves shown when printing
+PHASES: Tuple[str, ...] = ("selection", "crossover", "mutation", "fitness", "bookkeeping")
+PhaseCounters = Dict[str, List[int]]  # Nanoseconds spent in each phase and how many times it was entered
+
+
+def get_phase_counters() -> PhaseCounters:
+    return {phase: [0, 0] for phase in PHASES}
+
+
+def add_phase_time(phase_counters: PhaseCounters, phase: str, start: int) -> int:
+    # Charges the time since start to the phase and returns the current time, where the next phase starts
+    now = perf_counter_ns()
+    counter = phase_counters[phase]
+    counter[0] += now - start
+    counter[1] += 1
+    return now
+
+
+class Instrumentation:
+    # Sums the phase counters of every instrumented run and averages their best and mean fitness per generation over
+    # the runs that reached that generation
+    def __init__(self) -> None:
+        self.runs: int = 0
+        self.phase_times: Dict[str, int] = {}
+        self.phase_calls: Dict[str, int] = {}
+        self.best_fitness_sums: List[float] = []
+        self.mean_fitness_sums: List[float] = []
+        self.generation_runs: List[int] = []
+        self.fitness_cache: Dict[str, int] = {}
+
+    def add_run(self, run_instrumentation: Dict[str, Any]) -> None:
+        self.runs += 1
+        for phase, (phase_time, phase_calls) in run_instrumentation["phases"].items():
+            self.phase_times[phase] = self.phase_times.get(phase, 0) + phase_time
+            self.phase_calls[phase] = self.phase_calls.get(phase, 0) + phase_calls
+        for generation, (best_fitness, mean_fitness) in enumerate(
+            zip(run_instrumentation["best_fitness"], run_instrumentation["mean_fitness"])
+        ):
+            if generation == len(self.generation_runs):
+                self.best_fitness_sums.append(0.0)
+                self.mean_fitness_sums.append(0.0)
+                self.generation_runs.append(0)
+            self.best_fitness_sums[generation] += best_fitness
+            self.mean_fitness_sums[generation] += mean_fitness
+            self.generation_runs[generation] += 1
+        for counter, count in run_instrumentation.get("fitness_cache", {}).items():
+            self.fitness_cache[counter] = self.fitness_cache.get(counter, 0) + count
+
+    def get_total_time(self) -> int:
+        return sum(self.phase_times.values())
+
+    def get_best_fitness_curve(self) -> List[float]:
+        return [total / runs for total, runs in zip(self.best_fitness_sums, self.generation_runs)]
+
+    def get_mean_fitness_curve(self) -> List[float]:
+        return [total / runs for total, runs in zip(self.mean_fitness_sums, self.generation_runs)]
+
+    def get_fitness_cache_hit_rate(self) -> float:
+        lookups = self.fitness_cache.get("hits", 0) + self.fitness_cache.get("misses", 0)
+        return self.fitness_cache.get("hits", 0) / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        total_time = self.get_total_time()
+        lines = [
+            f"Instrumented runs: {self.runs}",
+            f"{'Phase':<12} {'Total (ms)':>12} {'Calls':>10} {'Per call (us)':>14} {'Share':>7}",
+        ]
+        for phase, phase_time in self.phase_times.items():
+            phase_calls = self.phase_calls[phase]
+            lines.append(
+                f"{phase:<12} {phase_time / 1e6:>12.1f} {phase_calls:>10} "
+                f"{phase_time / phase_calls / 1e3 if phase_calls else 0.0:>14.2f} "
+                f"{phase_time / total_time if total_time else 0.0:>7.1%}"
+            )
+        best_fitness_curve = self.get_best_fitness_curve()
+        mean_fitness_curve = self.get_mean_fitness_curve()
+        step = max(len(best_fitness_curve) // CURVE_POINTS, 1)
+        lines.append(f"{'Generation':<12} {'Best fitness':>12} {'Mean fitness':>12} {'Runs':>6}")
+        for generation in list(range(0, len(best_fitness_curve), step))[:CURVE_POINTS]:
+            lines.append(
+                f"{generation:<12} {best_fitness_curve[generation]:>12.3f} {mean_fitness_curve[generation]:>12.3f} "
+                f"{self.generation_runs[generation]:>6}"
+            )
+        if self.fitness_cache:
+            lines.append(
+                f"Fitness cache: {self.fitness_cache['hits']} hits, {self.fitness_cache['misses']} misses, "
+                f"{self.fitness_cache['evictions']} evictions, {self.get_fitness_cache_hit_rate():.1%} hit rate"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,230 @@
+import multiprocessing
+import queue
+from importlib import import_module
+from multiprocessing.synchronize import Event
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+TOPOLOGIES: List[str] = ["ring", "full"]
+POLL_INTERVAL: float = 0.05  # Seconds between checks of the stop event while waiting for migrants or results
+
+
+class IslandResult(NamedTuple):
+    # Islands stopped by another one report the generations they completed and the best values up to then
+    generation: int
+    generation_fitness: float
+    best_fitness: float
+    stopped: bool = False
+
+
+def get_neighbors(island_index: int, num_islands: int, topology: str = "ring") -> List[int]:
+    # Islands the given island sends its migrants to. A ring sends to the next island only, a fully connected
+    # topology sends to every other island.
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology {topology}, use one of {TOPOLOGIES}.")
+    if num_islands < 2:
+        return []
+    if topology == "ring":
+        return [(island_index + 1) % num_islands]
+    return [neighbor for neighbor in range(num_islands) if neighbor != island_index]
+
+
+def get_migration_size(population_size: int, migration_rate: float) -> int:
+    # At least one individual migrates and at least one stays
+    return min(max(round(population_size * migration_rate), 1), population_size - 1)
+
+
+def get_ranking(fitness_values: Any) -> List[int]:
+    # Indices of the population from the fittest to the least fit, works for lists and numpy arrays
+    return sorted(range(len(fitness_values)), key=lambda idx: fitness_values[idx], reverse=True)
+
+
+def receive_migrants(
+    inbox: "multiprocessing.Queue[Tuple[int, int, List[Any], List[float]]]",
+    pending_migrants: Dict[int, List[Tuple[List[Any], List[float]]]],
+    epoch: int,
+    num_senders: int,
+    stop_event: Event,
+) -> Optional[List[Tuple[List[Any], List[float]]]]:
+    # Waits for the migrants of every sender for this epoch. Faster senders may already be epochs ahead, so their
+    # migrants are kept until their epoch comes. Returns None once any island has stopped the archipelago.
+    while len(pending_migrants.get(epoch, [])) < num_senders:
+        try:
+            message_epoch, _, migrants, migrant_fitness = inbox.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            if stop_event.is_set():
+                return None
+            continue
+        pending_migrants.setdefault(message_epoch, []).append((migrants, migrant_fitness))
+    return pending_migrants.pop(epoch)
+
+
+def run_island(
+    backend_name: str,
+    island_index: int,
+    inboxes: List["multiprocessing.Queue[Tuple[int, int, List[Any], List[float]]]"],
+    neighbors: List[int],
+    num_senders: int,
+    result_queue: "multiprocessing.Queue[Tuple[int, IslandResult]]",
+    stop_event: Event,
+    population_size: int,
+    genome_length: int,
+    max_generations: int,
+    mutation_rate: float,
+    crossover_rate: float,
+    select_parent_mode: str,
+    target_generation_fitness: float,
+    migration_interval: int,
+    migration_rate: float,
+    vectorized: bool = False,
+    seed: Optional[int] = None,
+    fitness_function: Optional[Any] = None,
+) -> None:
+    # Evolves one sub-population like genetic_algorithm. Every migration_interval generations its best individuals
+    # are sent to the neighbors' inboxes and the migrants received replace its worst individuals. The first island
+    # to reach the target stops every island, the others report how many generations they completed.
+    backend = import_module(backend_name)
+    backend.set_seed(seed)
+    create_new_population = backend.create_new_population_vectorized if vectorized else backend.create_new_population
+    migration_size = get_migration_size(population_size, migration_rate)
+    target_fitness = backend.get_fitness_target(fitness_function)
+    pending_migrants: Dict[int, List[Tuple[List[Any], List[float]]]] = {}
+
+    population = backend.init_population(population_size, genome_length)
+    fitness_values = backend.evaluate_population(population, fitness_function)
+    result = IslandResult(max_generations, 0.0, 0.0)
+    best_generation_fitness = 0.0
+    best_fitness = 0.0
+
+    for generation in range(max_generations):
+        if stop_event.is_set():  # Another island reached the target, this one completed the previous generations
+            result = IslandResult(generation, best_generation_fitness, best_fitness, stopped=True)
+            break
+        population = create_new_population(
+            population_size, population, fitness_values, select_parent_mode, crossover_rate, mutation_rate
+        )
+        fitness_values = backend.evaluate_population(population, fitness_function)
+
+        if num_senders > 0 and (generation + 1) % migration_interval == 0:
+            epoch = (generation + 1) // migration_interval
+            ranking = get_ranking(fitness_values)
+            emigrants = [population[idx].copy() for idx in ranking[:migration_size]]  # Pickled later by the queue
+            emigrant_fitness = [float(fitness_values[idx]) for idx in ranking[:migration_size]]
+            for neighbor in neighbors:
+                inboxes[neighbor].put((epoch, island_index, emigrants, emigrant_fitness))
+            received = receive_migrants(inboxes[island_index], pending_migrants, epoch, num_senders, stop_event)
+            if received is None:  # Stopped before this generation was completed
+                result = IslandResult(generation, best_generation_fitness, best_fitness, stopped=True)
+                break
+            # The best migrants of every sender replace the worst individuals
+            migrants = sorted(
+                (migrant_fitness, migrant_idx, sender_idx)
+                for sender_idx, (_, sender_fitness) in enumerate(received)
+                for migrant_idx, migrant_fitness in enumerate(sender_fitness)
+            )[-migration_size:]
+            for target_idx, (_, migrant_idx, sender_idx) in zip(ranking[::-1], migrants):
+                population[target_idx] = received[sender_idx][0][migrant_idx]
+            fitness_values = backend.evaluate_population(population, fitness_function)
+
+        generation_fitness = float(backend.get_generation_fitness(fitness_values, population_size))
+        best_gen_fitness = float(backend.get_best_fitness(fitness_values))
+        if generation_fitness >= best_generation_fitness:
+            best_generation_fitness = generation_fitness
+            best_fitness = best_gen_fitness
+        result = IslandResult(max_generations, best_generation_fitness, best_fitness)
+
+        if generation_fitness >= target_generation_fitness and best_gen_fitness == target_fitness:
+            result = IslandResult(generation, generation_fitness, best_gen_fitness)
+            stop_event.set()
+            break
+
+    result_queue.put((island_index, result))
+
+
+def island_genetic_algorithm(
+    backend_name: str,
+    num_islands: int = 4,
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    migration_interval: int = 10,
+    migration_rate: float = 0.1,
+    topology: str = "ring",
+    vectorized: bool = False,
+    seeds: Optional[List[int]] = None,
+    fitness_function: Optional[Any] = None,
+) -> List[IslandResult]:
+    # Evolves num_islands sub-populations of population_size individuals, each in its own process. They exchange
+    # their best migration_rate individuals every migration_interval generations through one queue per island.
+    # Returns the result of every island, and raises if any island process fails.
+    if num_islands < 1:
+        raise ValueError("At least one island is needed.")
+    if migration_interval < 1:
+        raise ValueError("The migration interval must be at least 1 generation.")
+    neighbors = [get_neighbors(island_index, num_islands, topology) for island_index in range(num_islands)]
+    num_senders = [
+        sum(island_index in island_neighbors for island_neighbors in neighbors) for island_index in range(num_islands)
+    ]
+    inboxes: List["multiprocessing.Queue[Tuple[int, int, List[Any], List[float]]]"] = [
+        multiprocessing.Queue() for _ in range(num_islands)
+    ]
+    result_queue: "multiprocessing.Queue[Tuple[int, IslandResult]]" = multiprocessing.Queue()
+    stop_event = multiprocessing.Event()
+
+    islands = [
+        multiprocessing.Process(
+            target=run_island,
+            args=(
+                backend_name,
+                island_index,
+                inboxes,
+                neighbors[island_index],
+                num_senders[island_index],
+                result_queue,
+                stop_event,
+                population_size,
+                genome_length,
+                max_generations,
+                mutation_rate,
+                crossover_rate,
+                select_parent_mode,
+                target_generation_fitness,
+                migration_interval,
+                migration_rate,
+                vectorized,
+                seeds[island_index] if seeds else None,
+                fitness_function,
+            ),
+        )
+        for island_index in range(num_islands)
+    ]
+    for island in islands:
+        island.start()
+    try:
+        results: Dict[int, IslandResult] = {}
+        while len(results) < num_islands:
+            try:
+                island_index, result = result_queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:  # An island that failed never sends its result
+                for island_index, island in enumerate(islands):
+                    if island.exitcode not in (None, 0):
+                        raise RuntimeError(f"Island {island_index} failed with exit code {island.exitcode}.")
+                continue
+            results[island_index] = result
+    finally:
+        stop_event.set()
+        # A process only exits once everything it put in a queue has been read, so the migrants sent to islands that
+        # already stopped are drained here
+        while any(island.is_alive() for island in islands):
+            for inbox in inboxes:
+                try:
+                    while True:
+                        inbox.get_nowait()
+                except queue.Empty:
+                    pass
+            for island in islands:
+                island.join(timeout=POLL_INTERVAL)
+    return [results[island_index] for island_index in range(num_islands)]
@@ -1,21 +1,46 @@
 # One max problem solved with a genetic algorithm
 import argparse
-from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from os import cpu_count
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from tqdm import tqdm
 
+from checkpoint import (
+    RUN_CHECKPOINT_DIR,
+    SWEEP_CHECKPOINT_PATH,
+    clear_checkpoints,
+    load_sweep_checkpoint,
+    save_sweep_checkpoint,
+)
+from fitness_functions import FITNESS_FUNCTIONS, FitnessFunction, get_fitness_function
+from instrumentation import Instrumentation
+from island_model import TOPOLOGIES, island_genetic_algorithm
+from parameter_search import successive_halving, surrogate_search
+from profiling import PROFILE_DIR, get_worker_profiles, prepare_profile_dir, write_profile_report
+from result_cache import RESULT_CACHE_PATH, ResultCache, RunConfig
 from results import Results
-from timeit_functions import timeit
-from utils import generate_equally_spaced_values
+from scheduler import TaskScheduler
+from shared_populations import SharedPopulations, SharedPopulationsHandle
+from timeit_functions import EventLog, registry, timeit
+from utils import generate_equally_spaced_values, spawn_seeds
+from worker import (
+    init_worker,
+    run_genetic_algorithm,
+    run_genetic_algorithm_batch,
+    run_genetic_algorithm_instrumented,
+    run_in_shared_slot,
+    run_with_worker_id,
+)
 
 RUN_TIMES: int = 8
 GENERATIONS: int = 400
 POPULATION_SIZE: int = 50
 GENOME_LENGTH: int = 35
 SELECT_PARENT_MODE: str = (
-    "tournament"  # tournament or roulette. Tournament usually converges faster and yields better results.
+    "tournament"  # tournament, roulette or sus. Tournament usually converges faster and yields better results.
 )
 TARGET_GENERATION_FITNESS: float = (
     0.998  # When a generation is considered fit enough to skip the next iterations. Values close to 1.0 will yield better results.
@@ -27,74 +52,694 @@ MUTATION_RATE_MIN: float = 0.001
 MUTATION_RATE_MAX: float = 0.01
 CROSSOVER_RATE_MIN: float = 0.1
 CROSSOVER_RATE_MAX: float = 0.6
+HALVING_MIN_RUN_TIMES: int = 1  # Runs per candidate in the first successive halving round
+HALVING_MIN_GENERATIONS: int = 50  # Max generations per run in the first successive halving round
+HALVING_REDUCTION_FACTOR: int = 2  # Only 1 / factor of the candidates survive each round
+SURROGATE_BUDGET: int = 20  # Combinations evaluated by the surrogate search, each one RUN_TIMES times
+SURROGATE_INITIAL_POINTS: int = 5  # Random combinations evaluated before the surrogate model proposes the rest
+CHECKPOINT_INTERVAL: int = 100  # Generations between checkpoints of each run when checkpointing is enabled
+ISLAND_POPULATION_SIZE: int = 50  # Individuals of each island
+ISLAND_GENOME_LENGTH: int = 1000
+ISLAND_GENERATIONS: int = 2000
+ISLAND_MUTATION_RATE: float = 0.001
+ISLAND_CROSSOVER_RATE: float = 0.6
+MIGRATION_INTERVAL: int = 10  # Generations between migrations
+MIGRATION_RATE: float = 0.1  # Share of each island sent to its neighbors on every migration
+FITNESS_SEED: int = 0  # Instance of the random fitness functions, the same NK landscape or knapsack on every sweep
 
 
-def process_genetic_algorithm(
-    mutation_rate_values: List[float], crossover_rate_values: List[float], use_numpy: bool = False
-):
-    if use_numpy:
-        print("Running numpy version.")
-        from one_max_genetic_algorithm_numpy import genetic_algorithm
-    else:
-        print("Running vanilla version.")
-        from one_max_genetic_algorithm_vanilla import genetic_algorithm
+def get_backend_name(use_numpy: bool = False, packed: bool = False) -> str:
+    return f"one_max_genetic_algorithm_{'numpy' if use_numpy else 'vanilla'}{'_packed' if packed else ''}"
+
+
+def get_backend_options(
+    vectorized: bool = False,
+    incremental: bool = False,
+    fitness_function: Optional[FitnessFunction] = None,
+    buffered: bool = False,
+) -> Dict[str, Any]:
+    backend_options: Dict[str, Any] = {}
+    if vectorized:
+        backend_options["vectorized"] = True
+    if incremental:
+        backend_options["incremental_fitness"] = True
+    if buffered:
+        backend_options["buffered"] = True
+    if fitness_function is not None:  # Pickled with every task, the backends use One Max without it
+        backend_options["fitness_function"] = fitness_function
+    return backend_options
+
+
+def get_workers() -> int:
+    return max(2, cpu_count() - 2) if cpu_count() is not None else 2  # type: ignore
+
+
+def get_backend_key(backend_name: str, batched: bool = False, backend_options: Optional[Dict[str, Any]] = None) -> str:
+    # Every way of running a backend draws its random numbers differently, so each one is cached on its own. Runs
+    # of another fitness function are told apart by its name, which includes the instance.
+    backend_options = backend_options or {}
+    options = [
+        f"fitness={backend_options[option].name}" if option == "fitness_function" else option
+        for option in sorted(backend_options)
+    ]
+    return "+".join([backend_name, *options, *(["batched"] if batched else [])])
+
+
+def get_run_config(
+    backend_key: str,
+    mutation_rate: float,
+    crossover_rate: float,
+    generations: int = GENERATIONS,
+    master_seed: Optional[int] = None,
+) -> RunConfig:
+    return RunConfig(
+        backend_key,
+        POPULATION_SIZE,
+        GENOME_LENGTH,
+        generations,
+        mutation_rate,
+        crossover_rate,
+        SELECT_PARENT_MODE,
+        TARGET_GENERATION_FITNESS,
+        master_seed,
+    )
+
+
+def get_run_seeds(
+    master_seed: Optional[int], mutation_rate: float, crossover_rate: float, run_times: int = RUN_TIMES
+) -> Optional[List[int]]:
+    # One seed per run of the combination. They follow from the rates instead of the position in the sweep, so a run
+    # gets the same seed in any sweep, search or worker and cached runs stay valid when the grid changes.
+    if master_seed is None:
+        return None
+    return spawn_seeds(master_seed, run_times, (round(mutation_rate * 10**6), round(crossover_rate * 10**6)))
+
+
+def get_population_slot(combination_index: int, run_index: int) -> int:
+    return combination_index * RUN_TIMES + run_index
+
+
+def submit_combination(
+    executor: ProcessPoolExecutor,
+    mutation_rate: float,
+    crossover_rate: float,
+    batched: bool = False,
+    backend_options: Optional[Dict[str, Any]] = None,
+    combination_index: int = 0,
+    run_times: int = RUN_TIMES,
+    generations: int = GENERATIONS,
+    run_checkpoint_dir: Optional[str] = None,
+    first_run: int = 0,
+    seeds: Optional[List[int]] = None,
+    instrument: bool = False,
+    shared_populations: Optional[SharedPopulationsHandle] = None,
+) -> List[Future]:
+    # Submits the runs first_run to first_run + run_times of the combination, the earlier ones are already cached.
+    # With shared populations every run writes its population into the slot of its run index.
+    if run_times == 0:
+        return []
+
+    def submit(task: Callable[..., Any], *args, **kwargs) -> Future:
+        # Every task comes back tagged with the id of the worker that ran it
+        return executor.submit(run_with_worker_id, task, *args, **kwargs)
+
+    def get_run_options(run: int) -> Dict[str, Any]:
+        run_options: Dict[str, Any] = dict(backend_options or {})
+        if seeds is not None:
+            run_options["seed"] = seeds[first_run + run]
+        if run_checkpoint_dir is not None:  # Every run continues from its own checkpoint file if it exists
+            run_options["checkpoint_path"] = os.path.join(
+                run_checkpoint_dir, f"{combination_index}_{first_run + run}.ckpt"
+            )
+            run_options["checkpoint_interval"] = CHECKPOINT_INTERVAL
+        return run_options
+
+    params = (
+        POPULATION_SIZE,
+        GENOME_LENGTH,
+        generations,
+        mutation_rate,
+        crossover_rate,
+        SELECT_PARENT_MODE,
+        TARGET_GENERATION_FITNESS,
+    )
+    batch_options: Dict[str, Any] = {"seeds": seeds[first_run : first_run + run_times]} if seeds is not None else {}
+    if backend_options is not None and "fitness_function" in backend_options:
+        batch_options["fitness_function"] = backend_options["fitness_function"]
+    if batched:  # A single task evolves every run of the combination at once
+        return [submit(run_genetic_algorithm_batch, run_times, *params, **batch_options)]
+    run_function: Callable[..., List[Any]] = run_genetic_algorithm_instrumented if instrument else run_genetic_algorithm
+    if shared_populations is not None:
+        return [
+            submit(
+                run_in_shared_slot,
+                run_function,
+                shared_populations,
+                get_population_slot(combination_index, first_run + run),
+                *params,
+                **get_run_options(run),
+            )
+            for run in range(run_times)
+        ]
+    return [submit(run_function, *params, **get_run_options(run)) for run in range(run_times)]
+
+
+def collect_results(
+    future: Future,
+    instrumentation: Optional[Instrumentation] = None,
+    worker_ids: Optional[List[int]] = None,
+) -> List[Tuple[int, float, float]]:
+    worker_id, task_results = future.result()
+    if worker_ids is not None:
+        worker_ids.append(worker_id)
+    if instrumentation is not None:  # Instrumented runs return their counters alongside each result
+        results = []
+        for result, run_instrumentation in task_results:
+            instrumentation.add_run(run_instrumentation)
+            results.append(result)
+        return results
+    return task_results
+
 
-        # TODO: Use JAX for GPU
+def emit_combination_event(
+    event_log: EventLog,
+    mutation_rate: float,
+    crossover_rate: float,
+    results: Results,
+    new_runs: List[Tuple[int, float, float]],
+    worker_ids: List[int],
+    wall_time: float,
+    **fields: Any,
+) -> None:
+    # Throughput only counts the generations computed for this event, cached runs are free
+    generations_run = sum(generation for generation, _, _ in new_runs)
+    event_log.emit(
+        "combination",
+        mutation_rate=mutation_rate,
+        crossover_rate=crossover_rate,
+        score=results.get_score(),
+        best_fitness=results.best_fitness,
+        avg_generation=results.avg_generation,
+        runs=results.total_generations,
+        cached_runs=results.total_generations - len(new_runs),
+        generations_run=generations_run,
+        wall_time=wall_time,
+        generations_per_second=generations_run / wall_time if wall_time > 0 else 0.0,
+        worker_ids=sorted(set(worker_ids)),
+        **fields,
+    )
+
+
+def evaluate_candidates(
+    executor: ProcessPoolExecutor,
+    candidates: List[Tuple[float, float]],
+    run_times: int,
+    generations: int,
+    batched: bool = False,
+    backend_options: Optional[Dict[str, Any]] = None,
+    evaluated_results: Optional[Dict[Tuple[float, float], Results]] = None,
+    result_cache: Optional[ResultCache] = None,
+    backend_key: str = "",
+    master_seed: Optional[int] = None,
+    event_log: Optional[EventLog] = None,
+) -> List[float]:
+    start_time = time.perf_counter()
+    configs = [get_run_config(backend_key, *candidate, generations, master_seed) for candidate in candidates]
+    cached_runs = [
+        result_cache.get_runs(config, run_times) if result_cache is not None else [] for config in configs
+    ]
+    # Every candidate of the round is queued at once so the pool stays busy until the round ends
+    candidate_tasks = [
+        submit_combination(
+            executor,
+            *candidate,
+            batched,
+            backend_options,
+            run_times=run_times - len(candidate_runs),
+            generations=generations,
+            first_run=len(candidate_runs),
+            seeds=get_run_seeds(master_seed, *candidate, run_times),
+        )
+        for candidate, candidate_runs in zip(candidates, cached_runs)
+    ]
+    scores = []
+    for candidate, config, candidate_runs, future_tasks in zip(candidates, configs, cached_runs, candidate_tasks):
+        results = Results(max_generations=generations, max_fitness=1.0)
+        worker_ids: List[int] = []
+        with registry.scope("candidate"):
+            new_runs = [run for future in future_tasks for run in collect_results(future, worker_ids=worker_ids)]
+        if result_cache is not None:
+            result_cache.add_runs(config, new_runs, first_run_index=len(candidate_runs))
+        for generation, generation_fitness, best_fitness in candidate_runs + new_runs:
+            results.add_result(generation, generation_fitness, best_fitness)
+        if evaluated_results is not None:
+            evaluated_results[candidate] = results
+        if event_log is not None:  # Every candidate of the round was submitted at start_time
+            emit_combination_event(
+                event_log,
+                *candidate,
+                results,
+                new_runs,
+                worker_ids,
+                time.perf_counter() - start_time,
+                generations=generations,
+            )
+        scores.append(results.get_score())
+    return scores
+
+
+def get_combination_rates(
+    mutation_rate_values: List[float], crossover_rate_values: List[float], combination_index: int
+) -> Tuple[float, float]:
+    # Combinations are numbered in sweep order, every mutation rate with each crossover rate
+    return (
+        mutation_rate_values[combination_index // len(crossover_rate_values)],
+        crossover_rate_values[combination_index % len(crossover_rate_values)],
+    )
+
+
+def get_known_runs(
+    combination_index: int,
+    config: RunConfig,
+    sweep_checkpoint: Optional[Dict[str, Any]] = None,
+    result_cache: Optional[ResultCache] = None,
+) -> List[Tuple[int, float, float]]:
+    # Runs of the combination that are not computed again: all of them when a resumed sweep completed it before it
+    # stopped, otherwise the first ones found in the cache
+    if sweep_checkpoint is not None and str(combination_index) in sweep_checkpoint["completed"]:
+        return [tuple(run) for run in sweep_checkpoint["completed"][str(combination_index)]]  # type: ignore
+    return result_cache.get_runs(config, RUN_TIMES) if result_cache is not None else []
+
+
+def record_combination(
+    sweep_checkpoint: Dict[str, Any],
+    combination_index: int,
+    runs: List[Tuple[int, float, float]],
+    best_mutation_rate: float,
+    best_crossover_rate: float,
+    best_score: float,
+) -> None:
+    # Saves the runs of a finished combination and the best one so far, a resumed sweep starts from there
+    sweep_checkpoint["completed"][str(combination_index)] = runs
+    sweep_checkpoint["best"] = {
+        "mutation_rate": best_mutation_rate,
+        "crossover_rate": best_crossover_rate,
+        "score": best_score,
+    }
+    save_sweep_checkpoint(sweep_checkpoint)
+
+
+def process_genetic_algorithm(
+    mutation_rate_values: List[float],
+    crossover_rate_values: List[float],
+    use_numpy: bool = False,
+    vectorized: bool = False,
+    packed: bool = False,
+    batched: bool = False,
+    incremental: bool = False,
+    result_cache: Optional[ResultCache] = None,
+    sweep_checkpoint: Optional[Dict[str, Any]] = None,
+    master_seed: Optional[int] = None,
+    instrument: bool = False,
+    event_log: Optional[EventLog] = None,
+    profile_dir: Optional[str] = None,
+    fitness_function: Optional[FitnessFunction] = None,
+    buffered: bool = False,
+    shared_memory: bool = False,
+) -> Tuple[float, float, Results]:
+    vectorized = vectorized and use_numpy and not packed
+    # Only the single runs of the unpacked backends are instrumented and their counters come back through the pipe
+    instrument = instrument and not packed
+    batched = batched and not instrument
+    # Batched runs always evaluate the whole population
+    incremental = incremental and not packed and not batched
+    # Only the NumPy backend evolves inside buffers, batched runs always evolve as one array and incremental runs
+    # track their own counts
+    buffered = buffered and use_numpy and not packed and not incremental and not batched
+    # Only the single runs of the unpacked NumPy backend evolve a population array that can live in shared memory
+    shared_memory = shared_memory and use_numpy and not packed and not batched
+    backend_name = get_backend_name(use_numpy, packed)
+    print(
+        f"Running {'numpy' if use_numpy else 'vanilla'}{' packed' if packed else ''}"
+        f"{' vectorized' if vectorized else ''}{' incremental' if incremental else ''}{' buffered' if buffered else ''}"
+        f"{' batched' if batched else ''}{' instrumented' if instrument else ''}"
+        f"{' shared memory' if shared_memory else ''} version"
+        f"{f' on {fitness_function.name}' if fitness_function is not None else ''}."
+    )
+    # TODO: Use JAX for GPU
 
-    workers = max(2, cpu_count() - 2) if cpu_count() is not None else 2  # type: ignore
+    backend_options = get_backend_options(vectorized, incremental, fitness_function, buffered)
+    backend_key = get_backend_key(backend_name, batched, backend_options)
+    workers = get_workers()
     total_iterations = len(mutation_rate_values) * len(crossover_rate_values)
     progress_bar = tqdm(total=total_iterations, desc="Processing")
     best_mutation_rate = 0.0
     best_crossover_rate = 0.0
     prev_best_score = 0.0
+    instrumentation = Instrumentation() if instrument else None  # Cached runs are not instrumented
+    sweep_start_time = time.perf_counter()
+    submit_times: Dict[int, float] = {}
+    best_combination_index = 0
+    # Every run of the sweep gets its own slot, the main process reads the populations without any copy through a pipe
+    populations = (
+        SharedPopulations(total_iterations * RUN_TIMES, POPULATION_SIZE, GENOME_LENGTH) if shared_memory else None
+    )
+    population_slots: Dict[int, range] = {}  # Slots of the runs computed by this sweep, cached runs have none
+
+    # Only the single runs of the unpacked backends can checkpoint their own state
+    run_checkpoint_dir = RUN_CHECKPOINT_DIR if sweep_checkpoint is not None and not packed and not batched else None
+    if run_checkpoint_dir is not None:
+        os.makedirs(run_checkpoint_dir, exist_ok=True)
 
-    for mutation_rate in mutation_rate_values:
-
-        prev_local_score = 0.0
-
-        for i, crossover_rate in enumerate(crossover_rate_values):
-            results = Results(max_generations=GENERATIONS, max_fitness=1.0)
-            progress_bar.set_description(f"Score:{prev_best_score:.3f}")
-
-            with ProcessPoolExecutor(max_workers=workers) as executor:
-                future_tasks = [
-                    executor.submit(
-                        genetic_algorithm,
-                        POPULATION_SIZE,
-                        GENOME_LENGTH,
-                        GENERATIONS,
-                        mutation_rate,
-                        crossover_rate,
-                        SELECT_PARENT_MODE,
-                        TARGET_GENERATION_FITNESS,
+    try:
+        # A single pool lives for the whole sweep, every worker imports the backend once when it starts
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(backend_name, profile_dir)
+        ) as executor:
+            # Combinations are queued ahead in sweep order and the queue is topped up as soon as any run finishes, so
+            # workers keep busy across combinations while the scores below are still computed in order
+            num_crossover_rates = len(crossover_rate_values)
+
+            def get_combination_config(combination_index: int) -> RunConfig:
+                return get_run_config(
+                    backend_key,
+                    *get_combination_rates(mutation_rate_values, crossover_rate_values, combination_index),
+                    master_seed=master_seed,
+                )
+
+            def submit(combination_index: int) -> List[Future]:
+                # Only the runs missing from the cache or the checkpoint are computed
+                mutation_rate, crossover_rate = get_combination_rates(
+                    mutation_rate_values, crossover_rate_values, combination_index
+                )
+                num_cached_runs = len(
+                    get_known_runs(
+                        combination_index, get_combination_config(combination_index), sweep_checkpoint, result_cache
                     )
-                    for _ in range(RUN_TIMES)
-                ]
-                for future in future_tasks:
-                    generation, generation_fitness, best_fitness = future.result()
-                    results.add_result(generation, generation_fitness, best_fitness)
-
-            score = results.get_score()
-            # General score check
-            if score >= prev_best_score:
-                best_mutation_rate = mutation_rate
-                best_crossover_rate = crossover_rate
-                best_result = results
-                prev_best_score = score
-
-            if prev_local_score < (score * 0.9) and i != 0:  # Skip this loop since the score is not improving
-                progress_bar.update(len(crossover_rate_values) - i)
-                break
-
-            prev_local_score = score
-            progress_bar.update(1)
-
-        if prev_best_score >= TARGET_PROBLEM_FITNESS:  # Check if perfect score to close the algorithm execution
-            progress_bar.update(total_iterations - progress_bar.n)
-            break
-
-    progress_bar.set_description(f"Score: {best_result.score:.3f}")
-    progress_bar.close()
+                )
+                submit_times[combination_index] = time.perf_counter()
+                population_slots[combination_index] = range(
+                    get_population_slot(combination_index, num_cached_runs),
+                    get_population_slot(combination_index, RUN_TIMES),
+                )
+                return submit_combination(
+                    executor,
+                    mutation_rate,
+                    crossover_rate,
+                    batched,
+                    backend_options,
+                    combination_index,
+                    run_times=RUN_TIMES - num_cached_runs,
+                    run_checkpoint_dir=run_checkpoint_dir,
+                    first_run=num_cached_runs,
+                    seeds=get_run_seeds(master_seed, mutation_rate, crossover_rate),
+                    instrument=instrument,
+                    shared_populations=populations.get_handle() if populations is not None else None,
+                )
+
+            scheduler = TaskScheduler(submit, total_iterations, max_pending=workers)
+
+            for j, mutation_rate in enumerate(mutation_rate_values):
+
+                prev_local_score = 0.0
+
+                for i, crossover_rate in enumerate(crossover_rate_values):
+                    results = Results(max_generations=GENERATIONS, max_fitness=1.0)
+                    progress_bar.set_description(f"Score:{prev_best_score:.3f}")
+
+                    combination_index = j * num_crossover_rates + i
+                    cached_runs = get_known_runs(
+                        combination_index, get_combination_config(combination_index), sweep_checkpoint, result_cache
+                    )
+                    worker_ids: List[int] = []
+                    with registry.scope("combination"):
+                        future_tasks = scheduler.wait(combination_index)
+                        new_runs = [
+                            run
+                            for future in future_tasks
+                            for run in collect_results(future, instrumentation, worker_ids)
+                        ]
+                    if result_cache is not None:
+                        result_cache.add_runs(
+                            get_combination_config(combination_index), new_runs, first_run_index=len(cached_runs)
+                        )
+                    for generation, generation_fitness, best_fitness in cached_runs + new_runs:
+                        results.add_result(generation, generation_fitness, best_fitness)
+
+                    score = results.get_score()
+                    if event_log is not None:
+                        emit_combination_event(
+                            event_log,
+                            mutation_rate,
+                            crossover_rate,
+                            results,
+                            new_runs,
+                            worker_ids,
+                            time.perf_counter() - submit_times[combination_index],
+                            combination_index=combination_index,
+                            generations=GENERATIONS,
+                        )
+                    # General score check
+                    if score >= prev_best_score:
+                        best_mutation_rate = mutation_rate
+                        best_crossover_rate = crossover_rate
+                        best_result = results
+                        best_combination_index = combination_index
+                        prev_best_score = score
+
+                    if sweep_checkpoint is not None:
+                        record_combination(
+                            sweep_checkpoint,
+                            combination_index,
+                            cached_runs + new_runs,
+                            best_mutation_rate,
+                            best_crossover_rate,
+                            prev_best_score,
+                        )
+
+                    if prev_local_score < (score * 0.9) and i != 0:  # Skip this loop since the score is not improving
+                        scheduler.skip_until((j + 1) * num_crossover_rates)
+                        progress_bar.update(len(crossover_rate_values) - i)
+                        break
+
+                    prev_local_score = score
+                    progress_bar.update(1)
+
+                if prev_best_score >= TARGET_PROBLEM_FITNESS:  # Check if perfect score to close the algorithm execution
+                    scheduler.cancel()  # Runs a worker already started still finish before the pool shuts down
+                    progress_bar.update(total_iterations - progress_bar.n)
+                    break
+
+        if sweep_checkpoint is not None:  # Nothing left to resume
+            clear_checkpoints()
+
+        progress_bar.set_description(f"Score: {best_result.score:.3f}")
+        progress_bar.close()
+        if event_log is not None:
+            event_log.emit(
+                "sweep",
+                best_mutation_rate=best_mutation_rate,
+                best_crossover_rate=best_crossover_rate,
+                score=best_result.score,
+                combinations=len(submit_times),
+                wall_time=time.perf_counter() - sweep_start_time,
+                metrics=registry.get_snapshot(),
+            )
+        print_best_results(best_mutation_rate, best_crossover_rate, best_result)
+        if populations is not None:
+            best_slots = population_slots.get(best_combination_index, range(0))
+            if len(best_slots) > 0:
+                best_genome, best_genome_fitness = populations.get_best_genome(best_slots, fitness_function)
+                print(f"Best final genome, read from shared memory: {best_genome} with fitness {best_genome_fitness}")
+        if instrumentation is not None:
+            print("-" * 50)
+            print("\tTime per phase")
+            print("-" * 50)
+            print(instrumentation)
+        return best_mutation_rate, best_crossover_rate, best_result
+
+    finally:  # The workers are gone, the block can be freed
+        if populations is not None:
+            populations.unlink()
+
+
+def search_genetic_algorithm(
+    mutation_rate_values: List[float],
+    crossover_rate_values: List[float],
+    use_numpy: bool = False,
+    vectorized: bool = False,
+    packed: bool = False,
+    batched: bool = False,
+    incremental: bool = False,
+    search: str = "halving",
+    result_cache: Optional[ResultCache] = None,
+    master_seed: Optional[int] = None,
+    event_log: Optional[EventLog] = None,
+    profile_dir: Optional[str] = None,
+    fitness_function: Optional[FitnessFunction] = None,
+    buffered: bool = False,
+):
+    vectorized = vectorized and use_numpy and not packed
+    # Batched runs always evaluate the whole population
+    incremental = incremental and not packed and not batched
+    buffered = buffered and use_numpy and not packed and not incremental and not batched
+    backend_name = get_backend_name(use_numpy, packed)
+    print(
+        f"Searching with {'a surrogate model' if search == 'surrogate' else 'successive halving'}"
+        f" on the {'numpy' if use_numpy else 'vanilla'}{' packed' if packed else ''}"
+        f"{' vectorized' if vectorized else ''}{' incremental' if incremental else ''}{' buffered' if buffered else ''}"
+        f"{' batched' if batched else ''}"
+        f" version{f' on {fitness_function.name}' if fitness_function is not None else ''}."
+    )
+
+    backend_options = get_backend_options(vectorized, incremental, fitness_function, buffered)
+    backend_key = get_backend_key(backend_name, batched, backend_options)
+    candidates = [
+        (mutation_rate, crossover_rate)
+        for mutation_rate in mutation_rate_values
+        for crossover_rate in crossover_rate_values
+    ]
+    evaluated_results: Dict[Tuple[float, float], Results] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=get_workers(), initializer=init_worker, initargs=(backend_name, profile_dir)
+    ) as executor:
+
+        def evaluate(search_candidates: List[Tuple[float, float]], run_times: int, generations: int) -> List[float]:
+            return evaluate_candidates(
+                executor,
+                search_candidates,
+                run_times,
+                generations,
+                batched,
+                backend_options,
+                evaluated_results,
+                result_cache,
+                backend_key,
+                master_seed,
+                event_log,
+            )
+
+        if search == "surrogate":  # Searches the continuous ranges between the rate bounds instead of the grid
+            (best_mutation_rate, best_crossover_rate), _, total_runs = surrogate_search(
+                (MUTATION_RATE_MIN, MUTATION_RATE_MAX),
+                (CROSSOVER_RATE_MIN, CROSSOVER_RATE_MAX),
+                evaluate,
+                budget=SURROGATE_BUDGET,
+                initial_points=SURROGATE_INITIAL_POINTS,
+                run_times=RUN_TIMES,
+                generations=GENERATIONS,
+                seed=master_seed,
+            )
+        else:
+            (best_mutation_rate, best_crossover_rate), _, total_runs = successive_halving(
+                candidates,
+                evaluate,
+                min_run_times=HALVING_MIN_RUN_TIMES,
+                max_run_times=RUN_TIMES,
+                min_generations=HALVING_MIN_GENERATIONS,
+                max_generations=GENERATIONS,
+                reduction_factor=HALVING_REDUCTION_FACTOR,
+            )
+
+    print(f"Ran the genetic algorithm {total_runs} times, the full grid takes up to {len(candidates) * RUN_TIMES}.")
+    best_result = evaluated_results[(best_mutation_rate, best_crossover_rate)]
+    if event_log is not None:
+        event_log.emit(
+            "search",
+            search=search,
+            best_mutation_rate=best_mutation_rate,
+            best_crossover_rate=best_crossover_rate,
+            score=best_result.score,
+            total_runs=total_runs,
+            metrics=registry.get_snapshot(),
+        )
+    print_best_results(best_mutation_rate, best_crossover_rate, best_result)
+
+
+def get_sweep_settings(mutation_rate_values: List[float], crossover_rate_values: List[float]) -> Dict[str, Any]:
+    # A sweep can only be resumed with the same settings it was started with
+    return {
+        "run_times": RUN_TIMES,
+        "generations": GENERATIONS,
+        "population_size": POPULATION_SIZE,
+        "genome_length": GENOME_LENGTH,
+        "select_parent_mode": SELECT_PARENT_MODE,
+        "target_generation_fitness": TARGET_GENERATION_FITNESS,
+        "target_problem_fitness": TARGET_PROBLEM_FITNESS,
+        "mutation_rate_values": mutation_rate_values,
+        "crossover_rate_values": crossover_rate_values,
+    }
+
+
+def create_sweep_checkpoint(settings: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    # Stale run checkpoints of another sweep must never be resumed
+    clear_checkpoints()
+    return {"settings": settings, "options": options, "completed": {}, "best": None}
+
+
+def load_resumable_sweep(settings: Dict[str, Any]) -> Dict[str, Any]:
+    # The stopped sweep, which is resumed with its own options
+    sweep_checkpoint = load_sweep_checkpoint(SWEEP_CHECKPOINT_PATH)
+    if sweep_checkpoint["settings"] != settings:
+        raise ValueError("The sweep checkpoint was written with different settings and cannot be resumed.")
+    return sweep_checkpoint
+
+
+def run_island_model(
+    use_numpy: bool = False,
+    vectorized: bool = False,
+    num_islands: int = 4,
+    topology: str = "ring",
+    migration_interval: int = MIGRATION_INTERVAL,
+    migration_rate: float = MIGRATION_RATE,
+    master_seed: Optional[int] = None,
+    fitness: str = "onemax",
+    fitness_cache: int = 0,
+) -> None:
+    # Scales a single run of a larger problem across processes instead of running independent replicas
+    vectorized = vectorized and use_numpy
+    version = f"{'numpy' if use_numpy else 'vanilla'}{' vectorized' if vectorized else ''}"
+    print(
+        f"""Evolving {num_islands} islands of the {version} version:
+        Generations:{ISLAND_GENERATIONS:>16}
+        Island Population Size:{ISLAND_POPULATION_SIZE:>5}
+        Genome Length:{ISLAND_GENOME_LENGTH:>14}
+        Mutation Rate:{ISLAND_MUTATION_RATE:>14}
+        Crossover Rate:{ISLAND_CROSSOVER_RATE:>13}
+        Fitness Function:{fitness:>11}
+        Migration: {topology} topology, {migration_rate:.0%} of each island every {migration_interval} generations
+        {"-" * 50}"""
+    )
+    island_results = island_genetic_algorithm(
+        get_backend_name(use_numpy),
+        num_islands,
+        ISLAND_POPULATION_SIZE,
+        ISLAND_GENOME_LENGTH,
+        ISLAND_GENERATIONS,
+        ISLAND_MUTATION_RATE,
+        ISLAND_CROSSOVER_RATE,
+        SELECT_PARENT_MODE,
+        TARGET_GENERATION_FITNESS,
+        migration_interval,
+        migration_rate,
+        topology,
+        vectorized,
+        spawn_seeds(master_seed, num_islands) if master_seed is not None else None,
+        get_fitness_function(fitness, ISLAND_GENOME_LENGTH, FITNESS_SEED, fitness_cache),
+    )
+    results = Results(max_generations=ISLAND_GENERATIONS, max_fitness=1.0)
+    for island_index, (generation, generation_fitness, best_fitness, stopped) in enumerate(island_results):
+        progress = f"Stopped after {generation} generations" if stopped else f"Generation {generation}"
+        print(
+            f"Island {island_index}: {progress} Generation Fitness {generation_fitness:.3f} Best Fitness {best_fitness}"
+        )
+        if not stopped:  # Stopped islands did not finish early, the overall results only count the finished ones
+            results.add_result(generation, generation_fitness, best_fitness)
+    print(f"{results}")
+
+
+def print_best_results(best_mutation_rate: float, best_crossover_rate: float, best_result: Results) -> None:
     print("-" * 50)
     print("\tBest results")
     print("-" * 50)
@@ -103,7 +748,35 @@ def process_genetic_algorithm(
 
 
 @timeit
-def main(use_numpy: bool = False) -> None:
+def main(
+    use_numpy: bool = False,
+    vectorized: bool = False,
+    packed: bool = False,
+    batched: bool = False,
+    incremental: bool = False,
+    search: str = "grid",
+    cache: bool = False,
+    checkpoint: bool = False,
+    resume: bool = False,
+    seed: Optional[int] = None,
+    instrument: bool = False,
+    events: Optional[str] = None,
+    profile: bool = False,
+    islands: int = 0,
+    topology: str = "ring",
+    migration_interval: int = MIGRATION_INTERVAL,
+    migration_rate: float = MIGRATION_RATE,
+    fitness: str = "onemax",
+    fitness_cache: int = 0,
+    buffered: bool = False,
+    shared_memory: bool = False,
+) -> None:
+    if islands:  # A single island model run instead of a parameter sweep
+        run_island_model(
+            use_numpy, vectorized, islands, topology, migration_interval, migration_rate, seed, fitness, fitness_cache
+        )
+        return
+
     mutation_rate_values = generate_equally_spaced_values(
         min_val=MUTATION_RATE_MIN, max_val=MUTATION_RATE_MAX, length=8, invert=True
     )
@@ -111,8 +784,51 @@ def main(use_numpy: bool = False) -> None:
         min_val=CROSSOVER_RATE_MIN, max_val=CROSSOVER_RATE_MAX, length=5
     )
 
+    sweep_checkpoint: Optional[Dict[str, Any]] = None
+    if (checkpoint or resume) and search != "grid":
+        raise ValueError("Checkpoints are only supported by the grid sweep.")
+    if instrument and search != "grid":
+        raise ValueError("Instrumentation is only supported by the grid sweep.")
+    if buffered and not use_numpy:
+        raise ValueError("Buffered populations are only supported by the NumPy version.")
+    if shared_memory and search != "grid":
+        raise ValueError("Shared memory populations are only supported by the grid sweep.")
+    if resume:  # Continue the stopped sweep with its own options
+        sweep_checkpoint = load_resumable_sweep(get_sweep_settings(mutation_rate_values, crossover_rate_values))
+        use_numpy, vectorized, packed, batched, incremental, seed = (
+            sweep_checkpoint["options"].get(option)
+            for option in ["use_numpy", "vectorized", "packed", "batched", "incremental", "seed"]
+        )
+        fitness = sweep_checkpoint["options"].get("fitness", "onemax")
+        buffered = sweep_checkpoint["options"].get("buffered", False)
+        shared_memory = sweep_checkpoint["options"].get("shared_memory", False)
+    elif checkpoint:
+        sweep_checkpoint = create_sweep_checkpoint(
+            get_sweep_settings(mutation_rate_values, crossover_rate_values),
+            {
+                "use_numpy": use_numpy,
+                "vectorized": vectorized,
+                "packed": packed,
+                "batched": batched,
+                "incremental": incremental,
+                "seed": seed,
+                "fitness": fitness,
+                "buffered": buffered,
+                "shared_memory": shared_memory,
+            },
+        )
+
+    fitness_function = get_fitness_function(fitness, GENOME_LENGTH, FITNESS_SEED, fitness_cache)
+    if fitness_function is not None and (packed or incremental):
+        raise ValueError(
+            "The packed versions and incremental fitness do not support a fitness cache."
+            if fitness == "onemax"
+            else f"The packed versions and incremental fitness only support one max, not {fitness}."
+        )
+    problem = fitness_function.name if fitness_function is not None else "one max"
+
     print(
-        f"""Running {RUN_TIMES} times the one max problem with genetic algorithms for:
+        f"""Running {RUN_TIMES} times the {problem} problem with genetic algorithms for:
         Generations:{GENERATIONS:>16}
         Population Size:{POPULATION_SIZE:>12}
         Genome Length:{GENOME_LENGTH:>14}
@@ -122,11 +838,155 @@ def main(use_numpy: bool = False) -> None:
         {"-" * 50}"""
     )
 
-    process_genetic_algorithm(mutation_rate_values, crossover_rate_values, use_numpy)
+    result_cache = ResultCache(RESULT_CACHE_PATH) if cache else None
+    event_log = EventLog(events) if events else None
+    profile_dir = prepare_profile_dir(PROFILE_DIR) if profile else None
+    try:
+        if search in ["halving", "surrogate"]:
+            search_genetic_algorithm(
+                mutation_rate_values,
+                crossover_rate_values,
+                use_numpy,
+                vectorized,
+                packed,
+                batched,
+                incremental,
+                search,
+                result_cache,
+                seed,
+                event_log,
+                profile_dir,
+                fitness_function,
+                buffered,
+            )
+        else:
+            process_genetic_algorithm(
+                mutation_rate_values,
+                crossover_rate_values,
+                use_numpy,
+                vectorized,
+                packed,
+                batched,
+                incremental,
+                result_cache,
+                sweep_checkpoint,
+                seed,
+                instrument,
+                event_log,
+                profile_dir,
+                fitness_function,
+                buffered,
+                shared_memory,
+            )
+        if profile_dir is not None and get_worker_profiles(profile_dir):  # Merges the stats written by every worker
+            print(write_profile_report(profile_dir))
+            print(f"Worker profiles and the merged report were written to {profile_dir}.")
+    finally:
+        if result_cache is not None:
+            result_cache.close()
+        if event_log is not None:
+            event_log.close()
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--numpy", action="store_true", help="Specify to include numpy")
+    parser.add_argument(
+        "--vectorized", action="store_true", help="Evolve the whole population with batched numpy operations"
+    )
+    parser.add_argument("--packed", action="store_true", help="Store genomes as bit-packed words")
+    parser.add_argument(
+        "--batched", action="store_true", help="Evolve all the runs of a combination as one batched call"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true", help="Track fitness from parent counts and mutation deltas"
+    )
+    parser.add_argument(
+        "--buffered",
+        action="store_true",
+        help="Evolve every NumPy run inside two population buffers allocated up front",
+    )
+    parser.add_argument(
+        "--search",
+        choices=["grid", "halving", "surrogate"],
+        default="grid",
+        help="Walk the whole parameter grid, race its combinations with successive halving or let a surrogate model "
+        "propose the rates",
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help=f"Reuse the runs stored in {RESULT_CACHE_PATH} and store the new ones"
+    )
+    parser.add_argument(
+        "--checkpoint", action="store_true", help="Save the sweep progress after every combination so it can be resumed"
+    )
+    parser.add_argument("--resume", action="store_true", help="Continue the last checkpointed sweep where it stopped")
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Master seed every run draws its own seed from, for reproducible sweeps"
+    )
+    parser.add_argument(
+        "--instrument", action="store_true", help="Time every phase of the runs and track their fitness per generation"
+    )
+    parser.add_argument(
+        "--events", metavar="PATH", help="Append a JSON line per combination to PATH, or to stdout when PATH is -"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help=f"Profile the tasks of every worker and merge them into {PROFILE_DIR}"
+    )
+    parser.add_argument(
+        "--islands", type=int, default=0, help="Evolve one larger problem on this many islands with migration"
+    )
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="ring", help="Islands the migrants are sent to")
+    parser.add_argument(
+        "--migration-interval", type=int, default=MIGRATION_INTERVAL, help="Generations between migrations"
+    )
+    parser.add_argument(
+        "--migration-rate", type=float, default=MIGRATION_RATE, help="Share of each island sent on every migration"
+    )
+    parser.add_argument(
+        "--fitness", choices=FITNESS_FUNCTIONS, default="onemax", help="Problem the genetic algorithm optimizes"
+    )
+    parser.add_argument(
+        "--fitness-cache",
+        type=int,
+        default=0,
+        metavar="SIZE",
+        help="Remember the fitness of the last SIZE genomes of every run instead of evaluating them again",
+    )
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="Evolve the populations of the NumPy grid sweep in a shared memory block the main process reads",
+    )
     args = parser.parse_args()
-    main(use_numpy=args.numpy)
+    # The packed versions and incremental fitness count the ones of every genome themselves, island runs ignore both
+    if not args.islands and (args.packed or args.incremental):
+        flag = "--packed" if args.packed else "--incremental"
+        if args.fitness != "onemax":
+            parser.error(f"{flag} only supports --fitness onemax, not --fitness {args.fitness}")
+        if args.fitness_cache:
+            parser.error(f"{flag} cannot be combined with --fitness-cache")
+    if not args.islands and args.buffered and not (args.numpy or args.vectorized):
+        parser.error("--buffered requires --numpy or --vectorized")
+    main(
+        use_numpy=args.numpy or args.vectorized,
+        vectorized=args.vectorized,
+        packed=args.packed,
+        batched=args.batched,
+        incremental=args.incremental,
+        search=args.search,
+        cache=args.cache,
+        checkpoint=args.checkpoint,
+        resume=args.resume,
+        seed=args.seed,
+        instrument=args.instrument,
+        events=args.events,
+        profile=args.profile,
+        islands=args.islands,
+        topology=args.topology,
+        migration_interval=args.migration_interval,
+        migration_rate=args.migration_rate,
+        fitness=args.fitness,
+        fitness_cache=args.fitness_cache,
+        buffered=args.buffered,
+        shared_memory=args.shared_memory,
+    )
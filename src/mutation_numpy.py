@@ -0,0 +1,24 @@
+import numpy as np
+
+# Up to this many genes, or from this mutation rate on, drawing one number per gene is faster than skipping to the
+# flipped genes: the geometric draws only pay off for long flattened populations with few flips
+DENSE_MASK_MAX_GENES: int = 1024
+DENSE_MASK_MIN_RATE: float = 0.2
+
+
+def sample_flip_positions(generator: np.random.Generator, total_genes: int, mutation_rate: float) -> np.ndarray:
+    # Sorted positions of the genes to flip, every gene flips independently with probability mutation_rate. Short
+    # genomes compare one draw per gene to the rate, long ones draw the geometric gaps between flips.
+    if mutation_rate <= 0 or total_genes == 0:
+        return np.empty(0, dtype=np.int64)
+    if mutation_rate >= 1:
+        return np.arange(total_genes, dtype=np.int64)
+    if total_genes <= DENSE_MASK_MAX_GENES or mutation_rate >= DENSE_MASK_MIN_RATE:
+        return np.flatnonzero(generator.random(total_genes) < mutation_rate)
+    expected_flips = total_genes * mutation_rate
+    chunk_size = int(expected_flips + 4 * np.sqrt(expected_flips)) + 16
+    positions = np.cumsum(generator.geometric(mutation_rate, size=chunk_size)) - 1
+    while positions[-1] < total_genes:
+        gaps = generator.geometric(mutation_rate, size=chunk_size)
+        positions = np.concatenate((positions, positions[-1] + np.cumsum(gaps)))
+    return positions[: np.searchsorted(positions, total_genes)]
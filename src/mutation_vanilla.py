@@ -0,0 +1,19 @@
+import math
+import random
+from typing import List
+
+
+def sample_flip_positions(generator: random.Random, genome_length: int, mutation_rate: float) -> List[int]:
+    # Sorted positions of the genes to flip, every gene flips independently with probability mutation_rate: the gaps
+    # between flips are geometric, so only the flipped positions are drawn
+    if mutation_rate <= 0:
+        return []
+    if mutation_rate >= 1:
+        return list(range(genome_length))
+    log_no_flip = math.log(1 - mutation_rate)
+    positions = []
+    position = int(math.log(1.0 - generator.random()) / log_no_flip)
+    while position < genome_length:
+        positions.append(position)
+        position += 1 + int(math.log(1.0 - generator.random()) / log_no_flip)
+    return positions
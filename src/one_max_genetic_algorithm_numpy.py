@@ -1,15 +1,49 @@
-from functools import cache
-from typing import Tuple
+import json
+import os
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
+from instrumentation import PhaseCounters, add_phase_time, get_phase_counters
+from mutation_numpy import sample_flip_positions
+from selection_numpy import select_parents, select_parents_roulette, select_parents_sus, select_parents_tournament
+
 # Create a single instance of default_rng
 gen = np.random.default_rng(seed=None)
 
+PopulationBuffers = Dict[str, np.ndarray]  # Arrays a buffered run allocates once and reuses every generation
+
+
+class GenerationSnapshot(NamedTuple):
+    # State of one generation yielded by genetic_algorithm_stream. best_genome is part of the population and only valid
+    # until the stream resumes, population is a copy and stays valid.
+    generation: int
+    best_fitness: float
+    mean_fitness: float
+    best_genome: Optional[np.ndarray] = None
+    population: Optional[np.ndarray] = None
+
+
+class RunGenerators:
+    # Stands in for gen while genetic_algorithm_batch evolves a (runs, population, genome) array. Row i of every draw
+    # comes from the generator of run i, so each run draws exactly what it would draw on its own.
+    def __init__(self, generators: List[np.random.Generator]) -> None:
+        self.generators: List[np.random.Generator] = generators
+
+    def random(self, size: Tuple[int, ...]) -> np.ndarray:
+        return np.stack([generator.random(size[1:]) for generator in self.generators])
 
-def set_seed() -> None:
+    def integers(self, low: int, high: int, size: Tuple[int, ...]) -> np.ndarray:
+        return np.stack([generator.integers(low, high, size=size[1:]) for generator in self.generators])
+
+    def permuted(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return np.stack([generator.permuted(row, axis=axis) for generator, row in zip(self.generators, x)])
+
+
+def set_seed(seed: Optional[int] = None) -> None:
     global gen
-    gen = np.random.default_rng(seed=None)
+    gen = np.random.default_rng(seed=seed)
 
 
 def random_genome(length: int) -> np.ndarray:
@@ -25,13 +59,26 @@ def get_genome_fitness(genome: np.ndarray) -> float:
 
 
 def calculate_population_fitnesses(population: np.ndarray) -> np.ndarray:
-    return np.mean(population, axis=1)
+    return np.mean(population, axis=-1)
 
 
 def get_target_fitness() -> int:
     return 1
 
 
+def evaluate_population(population: np.ndarray, fitness_function: Optional[Any] = None) -> np.ndarray:
+    # One Max unless a fitness function is given, any object with an evaluate method taking the whole population
+    # and a target attribute as in fitness_functions.py. Batched runs reach it as a single population matrix.
+    if fitness_function is None:
+        return calculate_population_fitnesses(population)
+    fitness_values = fitness_function.evaluate(population.reshape(-1, population.shape[-1]))
+    return np.asarray(fitness_values, dtype=np.float64).reshape(population.shape[:-1])
+
+
+def get_fitness_target(fitness_function: Optional[Any] = None) -> float:
+    return get_target_fitness() if fitness_function is None else fitness_function.target
+
+
 def get_best_fitness(fitness_values: np.ndarray) -> float:
     return np.max(fitness_values) if len(fitness_values) > 0 else 0.0
 
@@ -41,31 +88,29 @@ def get_generation_fitness(fitness_values: np.ndarray, population_size: int) ->
 
 
 def select_parent(population: np.ndarray, fitness_values: np.ndarray, mode: str = "tournament") -> np.ndarray:
-    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament"]:
+    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament", "sus"]:
         tournament_size: int = gen.integers(int(len(population) * 0.6), int(len(population) * 0.8) + 1, dtype=int)
         tournament_size = tournament_size if tournament_size > 1 else 1
         return select_parent_tournament(population, fitness_values, tournament_size)
+    elif mode.lower() == "sus":
+        return select_parent_sus(population, fitness_values)
     else:
         return select_parent_roulette(population, fitness_values)
 
 
 def select_parent_tournament(population: np.ndarray, fitness_values: np.ndarray, tournament_size: int) -> np.ndarray:
     # Tournament implementation
-    random_idx = gen.choice(population.shape[0], size=tournament_size, replace=False)
-    selected_idx = random_idx[np.argmax(fitness_values[random_idx])]
-    return population[selected_idx]
+    return population[select_parents_tournament(gen, fitness_values, 1, tournament_size)[0]]
 
 
 def select_parent_roulette(population: np.ndarray, fitness_values: np.ndarray) -> np.ndarray:
     # Roulette wheel implementation
-    total_fitness = np.sum(fitness_values)
-    pick = gen.uniform(0, total_fitness)
-    current = 0
-    for individual, fitness_value in zip(population, fitness_values):
-        current += fitness_value
-        if current > pick:
-            return individual
-    return population[0]
+    return population[select_parents_roulette(gen, fitness_values, 1)[0]]
+
+
+def select_parent_sus(population: np.ndarray, fitness_values: np.ndarray) -> np.ndarray:
+    # A single pointer stochastic universal sampling is a roulette spin
+    return population[select_parents_sus(gen, fitness_values, 1)[0]]
 
 
 def crossover(parent1: np.ndarray, parent2: np.ndarray, crossover_rate: float) -> Tuple[np.ndarray, np.ndarray]:
@@ -80,16 +125,31 @@ def crossover(parent1: np.ndarray, parent2: np.ndarray, crossover_rate: float) -
 
 
 def mutate(genome: np.ndarray, mutation_rate: float) -> np.ndarray:
-    mask = gen.random(size=len(genome)) < mutation_rate
-    genome[mask] = 1 - genome[mask]
+    positions = sample_flip_positions(gen, len(genome), mutation_rate)
+    genome[positions] = 1 - genome[positions]
     return genome
 
 
+def mutate_population(population: np.ndarray, mutation_rate: float) -> np.ndarray:
+    # Flip positions are drawn over the flattened population (or batch of populations) at once, the runs of
+    # genetic_algorithm_batch each draw their own
+    if isinstance(gen, RunGenerators):
+        for run_population, generator in zip(population, gen.generators):
+            genes = run_population.reshape(-1)
+            positions = sample_flip_positions(generator, genes.size, mutation_rate)
+            genes[positions] = 1 - genes[positions]
+        return population
+    genes = population.reshape(-1)
+    positions = sample_flip_positions(gen, genes.size, mutation_rate)
+    genes[positions] = 1 - genes[positions]
+    return population
+
+
 def print_best_values(fitness_values: np.ndarray, population: np.ndarray, generation_fitness: float) -> None:
     best_index = np.argmax(fitness_values)
     best_solution = population[best_index]
     print(f"Best Final Solution: {best_solution}")
-    print(f"Best Final Fitness: {get_genome_fitness(best_solution)}")
+    print(f"Best Final Fitness: {fitness_values[best_index]}")
     print(f"Generation perfect fitness percentage: {generation_fitness:.2f}")
 
 
@@ -100,24 +160,219 @@ def create_new_population(
     select_parent_mode: str,
     crossover_rate: float,
     mutation_rate: float,
+    phase_counters: Optional[PhaseCounters] = None,
 ) -> np.ndarray:
-
+    # Every operator call is timed when phase_counters is given, otherwise the timing costs a None check
+    start = perf_counter_ns() if phase_counters is not None else 0
     new_population = np.empty_like(population)
+    parents_idx = select_parents(gen, fitness_values, population_size, mode=select_parent_mode)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "selection", start)
 
     for i in range(0, population_size - 1, 2):
-        parent1 = select_parent(population, fitness_values, mode=select_parent_mode)
-        parent2 = select_parent(population, fitness_values, mode=select_parent_mode)
+        parent1 = population[parents_idx[i]]
+        parent2 = population[parents_idx[i + 1]]
         offspring1, offspring2 = crossover(parent1, parent2, crossover_rate)
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "crossover", start)
         new_population[i] = mutate(offspring1, mutation_rate)
         new_population[i + 1] = mutate(offspring2, mutation_rate)
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "mutation", start)
 
     if population_size % 2 != 0:
-        parent = select_parent(population, fitness_values, mode=select_parent_mode)
+        parent = population[parents_idx[-1]].copy()
         new_population[-1] = mutate(parent, mutation_rate)
+        if phase_counters is not None:
+            add_phase_time(phase_counters, "mutation", start)
+
+    return new_population
+
+
+def create_new_population_vectorized(
+    population_size: int,
+    population: np.ndarray,
+    fitness_values: np.ndarray,
+    select_parent_mode: str,
+    crossover_rate: float,
+    mutation_rate: float,
+    phase_counters: Optional[PhaseCounters] = None,
+) -> np.ndarray:
+    # Same operators as create_new_population applied to the whole population at once.
+    # Leading axes of population and fitness_values hold independent populations evolved side by side.
+    start = perf_counter_ns() if phase_counters is not None else 0
+    num_pairs = population_size // 2
+    genome_length = population.shape[-1]
+    parents_idx = select_parents(gen, fitness_values, population_size, mode=select_parent_mode)
+    new_population = np.take_along_axis(population, parents_idx[..., None], axis=-2)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "selection", start)
+
+    if genome_length > 1 and num_pairs > 0:
+        pairs_shape = population.shape[:-2] + (num_pairs,)
+        parents1 = new_population[..., 0 : 2 * num_pairs : 2, :]
+        parents2 = new_population[..., 1 : 2 * num_pairs : 2, :]
+        crossover_points = gen.integers(1, genome_length, size=pairs_shape)
+        do_crossover = gen.random(pairs_shape) < crossover_rate
+        swap_mask = (np.arange(genome_length) >= crossover_points[..., None]) & do_crossover[..., None]
+        offspring1 = np.where(swap_mask, parents2, parents1)
+        offspring2 = np.where(swap_mask, parents1, parents2)
+        new_population[..., 0 : 2 * num_pairs : 2, :] = offspring1
+        new_population[..., 1 : 2 * num_pairs : 2, :] = offspring2
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "crossover", start)
+
+    new_population = mutate_population(new_population, mutation_rate)
+    if phase_counters is not None:
+        add_phase_time(phase_counters, "mutation", start)
+    return new_population
+
+
+def get_population_buffers(population_size: int, genome_length: int) -> PopulationBuffers:
+    num_pairs = population_size // 2
+    return {
+        "population0": np.empty((population_size, genome_length), dtype=np.int8),
+        "population1": np.empty((population_size, genome_length), dtype=np.int8),
+        "best_population": np.empty((population_size, genome_length), dtype=np.int8),
+        "fitness_values": np.empty(population_size),
+        "crossover_draws": np.empty(num_pairs),
+        "do_crossover": np.empty(num_pairs, dtype=bool),
+        "swap_mask": np.empty((num_pairs, genome_length), dtype=bool),
+        "swapped_genes": np.empty((num_pairs, genome_length), dtype=np.int8),
+        "loci": np.arange(genome_length),
+    }
 
+
+def create_new_population_buffered(
+    population_size: int,
+    population: np.ndarray,
+    fitness_values: np.ndarray,
+    select_parent_mode: str,
+    crossover_rate: float,
+    mutation_rate: float,
+    buffers: PopulationBuffers,
+    phase_counters: Optional[PhaseCounters] = None,
+) -> np.ndarray:
+    # Same draws and offspring as create_new_population_vectorized, written into whichever of the two population
+    # buffers does not hold the parents. The genes past each crossover point are swapped in place with XOR.
+    start = perf_counter_ns() if phase_counters is not None else 0
+    num_pairs = population_size // 2
+    genome_length = population.shape[-1]
+    new_population = buffers["population1"] if population is buffers["population0"] else buffers["population0"]
+    parents_idx = select_parents(gen, fitness_values, population_size, mode=select_parent_mode)
+    np.take(population, parents_idx, axis=0, out=new_population)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "selection", start)
+
+    if genome_length > 1 and num_pairs > 0:
+        parents1 = new_population[0 : 2 * num_pairs : 2]
+        parents2 = new_population[1 : 2 * num_pairs : 2]
+        crossover_points = gen.integers(1, genome_length, size=num_pairs)
+        do_crossover = np.less(gen.random(out=buffers["crossover_draws"]), crossover_rate, out=buffers["do_crossover"])
+        swap_mask = np.greater_equal(buffers["loci"], crossover_points[:, None], out=buffers["swap_mask"])
+        np.logical_and(swap_mask, do_crossover[:, None], out=swap_mask)
+        swapped_genes = np.bitwise_xor(parents1, parents2, out=buffers["swapped_genes"])
+        np.bitwise_and(swapped_genes, swap_mask, out=swapped_genes)
+        np.bitwise_xor(parents1, swapped_genes, out=parents1)
+        np.bitwise_xor(parents2, swapped_genes, out=parents2)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "crossover", start)
+
+    mutate_population(new_population, mutation_rate)
+    if phase_counters is not None:
+        add_phase_time(phase_counters, "mutation", start)
     return new_population
 
 
+def create_new_population_incremental(
+    population_size: int,
+    population: np.ndarray,
+    fitness_values: np.ndarray,
+    select_parent_mode: str,
+    crossover_rate: float,
+    mutation_rate: float,
+    ones_counts: np.ndarray,
+    phase_counters: Optional[PhaseCounters] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Same operators as create_new_population_vectorized, also returns the number of ones of each child. Only the
+    # prefixes of crossed pairs are summed and every mutation adds or removes a one, non crossed children without
+    # mutations reuse their parent's count.
+    start = perf_counter_ns() if phase_counters is not None else 0
+    num_pairs = population_size // 2
+    genome_length = population.shape[-1]
+    parents_idx = select_parents(gen, fitness_values, population_size, mode=select_parent_mode)
+    new_population = population[parents_idx]
+    new_ones_counts = ones_counts[parents_idx].astype(np.int64)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "selection", start)
+
+    if genome_length > 1 and num_pairs > 0:
+        crossover_points = gen.integers(1, genome_length, size=num_pairs)
+        crossed_pairs = np.flatnonzero(gen.random(num_pairs) < crossover_rate)
+        offspring1_idx, offspring2_idx = 2 * crossed_pairs, 2 * crossed_pairs + 1
+        parents1, parents2 = new_population[offspring1_idx], new_population[offspring2_idx]
+        ones1, ones2 = new_ones_counts[offspring1_idx], new_ones_counts[offspring2_idx]
+        prefix_mask = np.arange(genome_length) < crossover_points[crossed_pairs, None]
+        prefix_ones1 = np.sum(parents1, axis=-1, where=prefix_mask, dtype=np.int64)
+        prefix_ones2 = np.sum(parents2, axis=-1, where=prefix_mask, dtype=np.int64)
+        new_population[offspring1_idx] = np.where(prefix_mask, parents1, parents2)
+        new_population[offspring2_idx] = np.where(prefix_mask, parents2, parents1)
+        new_ones_counts[offspring1_idx] = prefix_ones1 + ones2 - prefix_ones2
+        new_ones_counts[offspring2_idx] = prefix_ones2 + ones1 - prefix_ones1
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "crossover", start)
+
+    genes = new_population.reshape(-1)
+    positions = sample_flip_positions(gen, genes.size, mutation_rate)
+    np.add.at(new_ones_counts, positions // genome_length, 1 - 2 * genes[positions].astype(np.int64))
+    genes[positions] = 1 - genes[positions]
+    if phase_counters is not None:
+        add_phase_time(phase_counters, "mutation", start)
+    return new_population, new_ones_counts
+
+
+def save_checkpoint(
+    checkpoint_path: str,
+    generation: int,
+    population: np.ndarray,
+    fitness_values: np.ndarray,
+    best_population: np.ndarray,
+    best_generation: int,
+    best_generation_fitness: float,
+    best_fitness: float,
+) -> None:
+    # Written to a temporary file first so a crash while saving never corrupts the previous checkpoint
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, "wb") as checkpoint_file:
+        np.savez(
+            checkpoint_file,
+            generation=generation,
+            population=population,
+            fitness_values=fitness_values,
+            best_population=best_population,
+            best_generation=best_generation,
+            best_generation_fitness=best_generation_fitness,
+            best_fitness=best_fitness,
+            rng_state=json.dumps(gen.bit_generator.state),
+        )
+    os.replace(temp_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path: str) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray, int, float, float]:
+    # Restores the random generator too, so the run continues exactly as if it had never stopped
+    with np.load(checkpoint_path) as checkpoint:
+        gen.bit_generator.state = json.loads(checkpoint["rng_state"].item())
+        return (
+            int(checkpoint["generation"]),
+            checkpoint["population"],
+            checkpoint["fitness_values"],
+            checkpoint["best_population"],
+            int(checkpoint["best_generation"]),
+            float(checkpoint["best_generation_fitness"]),
+            float(checkpoint["best_fitness"]),
+        )
+
+
 def genetic_algorithm(
     population_size: int = 100,
     genome_length: int = 50,
@@ -127,24 +382,113 @@ def genetic_algorithm(
     select_parent_mode: str = "tournament",
     target_generation_fitness: float = 0.9,
     verbose: bool = False,
+    vectorized: bool = False,
+    incremental_fitness: bool = False,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: int = 100,
+    seed: Optional[int] = None,
+    instrumentation: Optional[Dict[str, Any]] = None,
+    fitness_function: Optional[Any] = None,
+    buffered: bool = False,
+    population_out: Optional[np.ndarray] = None,
 ) -> Tuple[int, float, float]:
-
-    set_seed()
-
-    target_fitness = get_target_fitness()
+    # A given instrumentation dict is filled with the phase counters of the run and the best and mean fitness of
+    # every generation. Buffered runs evolve like vectorized ones inside arrays allocated once before the loop.
+    # A given population_out array, such as a slot of a shared memory block, holds the population of the last
+    # generation at any time, so another process can read it while the run evolves.
+    if incremental_fitness and fitness_function is not None:
+        raise ValueError("Incremental fitness only supports One Max.")
+    if incremental_fitness and buffered:
+        raise ValueError("Incremental fitness cannot be combined with buffered populations.")
+
+    set_seed(seed)
+    phase_counters: Optional[PhaseCounters] = None
+    if instrumentation is not None:
+        phase_counters = get_phase_counters()
+        instrumentation.update(phases=phase_counters, best_fitness=[], mean_fitness=[])
+        if fitness_function is not None and hasattr(fitness_function, "stats"):  # Counted by a fitness cache
+            instrumentation["fitness_cache"] = fitness_function.stats
+    start = 0
+    new_population_function = create_new_population_vectorized if vectorized else create_new_population
+    buffers = get_population_buffers(population_size, genome_length) if buffered else None
+
+    target_fitness = get_fitness_target(fitness_function)
     population = init_population(population_size, genome_length)
     best_population = population
-    fitness_values = calculate_population_fitnesses(population)
+    fitness_values = evaluate_population(population, fitness_function)
 
     best_generation_fitness = 0.0
-
-    for generation in range(max_generations):
-        population = create_new_population(
-            population_size, population, fitness_values, select_parent_mode, crossover_rate, mutation_rate
-        )
-        fitness_values = calculate_population_fitnesses(population)
+    start_generation = 0
+
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):  # Continue a stopped run
+        (
+            generation,
+            population,
+            fitness_values,
+            best_population,
+            best_generation,
+            best_generation_fitness,
+            best_fitness,
+        ) = load_checkpoint(checkpoint_path)
+        start_generation = generation + 1
+    ones_counts = population.sum(axis=-1, dtype=np.int64) if incremental_fitness else np.empty(0, dtype=np.int64)
+    if population_out is not None:
+        np.copyto(population_out, population)
+
+    for generation in range(start_generation, max_generations):
+        if incremental_fitness:  # Always uses the vectorized operators
+            population, ones_counts = create_new_population_incremental(
+                population_size,
+                population,
+                fitness_values,
+                select_parent_mode,
+                crossover_rate,
+                mutation_rate,
+                ones_counts,
+                phase_counters,
+            )
+            if phase_counters is not None:
+                start = perf_counter_ns()
+            fitness_values = ones_counts / genome_length
+        elif buffers is not None:
+            population = create_new_population_buffered(
+                population_size,
+                population,
+                fitness_values,
+                select_parent_mode,
+                crossover_rate,
+                mutation_rate,
+                buffers,
+                phase_counters,
+            )
+            if phase_counters is not None:
+                start = perf_counter_ns()
+            if fitness_function is None:  # Selection is done with the previous fitness values, so they are overwritten
+                fitness_values = np.mean(population, axis=-1, out=buffers["fitness_values"])
+            else:
+                fitness_values = evaluate_population(population, fitness_function)
+        else:
+            population = new_population_function(
+                population_size,
+                population,
+                fitness_values,
+                select_parent_mode,
+                crossover_rate,
+                mutation_rate,
+                phase_counters,
+            )
+            if phase_counters is not None:
+                start = perf_counter_ns()
+            fitness_values = evaluate_population(population, fitness_function)
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "fitness", start)
+        if population_out is not None:
+            np.copyto(population_out, population)
         generation_fitness = get_generation_fitness(fitness_values, population_size)
         best_gen_fitness = get_best_fitness(fitness_values)
+        if instrumentation is not None:
+            instrumentation["best_fitness"].append(float(best_gen_fitness))
+            instrumentation["mean_fitness"].append(float(generation_fitness))
 
         if verbose:
             print(
@@ -152,7 +496,11 @@ def genetic_algorithm(
             )
 
         if generation_fitness >= best_generation_fitness:
-            best_population = population
+            if buffers is not None:  # The buffer of this generation is overwritten two generations later
+                best_population = buffers["best_population"]
+                np.copyto(best_population, population)
+            else:
+                best_population = population
             best_generation = generation
             best_generation_fitness = generation_fitness
             best_fitness = best_gen_fitness
@@ -161,11 +509,138 @@ def genetic_algorithm(
             if verbose:
                 print(f"Ideal solution found in generation {generation}.")
                 print_best_values(fitness_values, population, generation_fitness)
+            if phase_counters is not None:
+                add_phase_time(phase_counters, "bookkeeping", start)
             return generation, generation_fitness, best_gen_fitness  # Early return
 
+        if checkpoint_path is not None and (generation + 1) % checkpoint_interval == 0:
+            save_checkpoint(
+                checkpoint_path,
+                generation,
+                population,
+                fitness_values,
+                best_population,
+                best_generation,
+                best_generation_fitness,
+                best_fitness,
+            )
+        if phase_counters is not None:
+            add_phase_time(phase_counters, "bookkeeping", start)
+
     if verbose:
-        best_fitness_values = calculate_population_fitnesses(best_population)
+        best_fitness_values = evaluate_population(best_population, fitness_function)
         print(f"Best solution found after {max_generations} generations was generation number {best_generation}.")
         print_best_values(best_fitness_values, best_population, best_generation_fitness)
 
     return max_generations, best_generation_fitness, best_fitness
+
+
+def genetic_algorithm_stream(
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    vectorized: bool = False,
+    seed: Optional[int] = None,
+    include_best_genome: bool = False,
+    copy_population: bool = False,
+    fitness_function: Optional[Any] = None,
+) -> Iterator[GenerationSnapshot]:
+    # Evolves like genetic_algorithm but yields every generation instead of printing it, so the caller can log, plot
+    # or stop early by leaving the loop. The stream ends with the generation that reaches the target. Nothing is
+    # copied unless copy_population is set.
+    set_seed(seed)
+    new_population_function = create_new_population_vectorized if vectorized else create_new_population
+    target_fitness = get_fitness_target(fitness_function)
+    population = init_population(population_size, genome_length)
+    fitness_values = evaluate_population(population, fitness_function)
+
+    for generation in range(max_generations):
+        population = new_population_function(
+            population_size, population, fitness_values, select_parent_mode, crossover_rate, mutation_rate
+        )
+        fitness_values = evaluate_population(population, fitness_function)
+        generation_fitness = get_generation_fitness(fitness_values, population_size)
+        best_gen_fitness = get_best_fitness(fitness_values)
+        yield GenerationSnapshot(
+            generation,
+            float(best_gen_fitness),
+            float(generation_fitness),
+            population[np.argmax(fitness_values)] if include_best_genome else None,
+            population.copy() if copy_population else None,
+        )
+        if generation_fitness >= target_generation_fitness and best_gen_fitness == target_fitness:
+            return
+
+
+def genetic_algorithm_batch(
+    run_times: int,
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    seeds: Optional[List[int]] = None,
+    fitness_function: Optional[Any] = None,
+) -> List[Tuple[int, float, float]]:
+    # Evolves run_times independent runs as a single (runs, population, genome) array.
+    # Each run stops on its own and draws from its own generator, so it returns the same tuple as
+    # genetic_algorithm(vectorized=True) with its seed, whichever other runs share the batch.
+    global gen
+    if seeds and len(seeds) < run_times:
+        raise ValueError(f"Every run needs its own seed, got {len(seeds)} seeds for {run_times} runs.")
+    run_seeds: List[Any] = list(seeds) if seeds else np.random.SeedSequence().spawn(run_times)
+    run_generators = RunGenerators([np.random.default_rng(seed) for seed in run_seeds[:run_times]])
+    previous_gen = gen
+    try:
+        populations = np.empty((run_times, population_size, genome_length), dtype=np.int8)
+        for run_population, generator in zip(populations, run_generators.generators):
+            gen = generator
+            run_population[:] = init_population(population_size, genome_length)
+        gen = run_generators  # type: ignore[assignment]
+
+        target_fitness = get_fitness_target(fitness_function)
+        fitness_values = evaluate_population(populations, fitness_function)
+        active_runs = np.arange(run_times)
+        best_generation_fitness = np.zeros(run_times)
+        best_fitness = np.zeros(run_times)
+        results: List[Tuple[int, float, float]] = [(max_generations, 0.0, 0.0)] * run_times
+
+        for generation in range(max_generations):
+            populations = create_new_population_vectorized(
+                population_size, populations, fitness_values, select_parent_mode, crossover_rate, mutation_rate
+            )
+            fitness_values = evaluate_population(populations, fitness_function)
+            generation_fitness = np.sum(fitness_values, axis=-1) / population_size
+            best_gen_fitness = np.max(fitness_values, axis=-1)
+
+            improved = generation_fitness >= best_generation_fitness[active_runs]
+            best_generation_fitness[active_runs[improved]] = generation_fitness[improved]
+            best_fitness[active_runs[improved]] = best_gen_fitness[improved]
+
+            finished = (generation_fitness >= target_generation_fitness) & (best_gen_fitness == target_fitness)
+            if np.any(finished):
+                for run, run_generation_fitness, run_best_fitness in zip(
+                    active_runs[finished], generation_fitness[finished], best_gen_fitness[finished]
+                ):
+                    results[run] = (generation, float(run_generation_fitness), float(run_best_fitness))  # Early return
+                active_runs = active_runs[~finished]
+                run_generators.generators = [
+                    generator for generator, done in zip(run_generators.generators, finished) if not done
+                ]
+                populations = populations[~finished]
+                fitness_values = fitness_values[~finished]
+                if len(active_runs) == 0:
+                    break
+    finally:  # The other functions of the module expect a single generator
+        gen = previous_gen
+
+    for run in active_runs:
+        results[run] = (max_generations, float(best_generation_fitness[run]), float(best_fitness[run]))
+
+    return results
@@ -0,0 +1,244 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from mutation_numpy import sample_flip_positions
+from selection_numpy import select_parents
+
+WORD_SIZE: int = 64
+
+# Create a single instance of default_rng
+gen = np.random.default_rng(seed=None)
+
+
+def set_seed(seed: Optional[int] = None) -> None:
+    global gen
+    gen = np.random.default_rng(seed=seed)
+
+
+def get_num_words(genome_length: int) -> int:
+    return (genome_length + WORD_SIZE - 1) // WORD_SIZE
+
+
+def get_tail_mask(genome_length: int) -> np.uint64:
+    # Mask of the valid bits of the last word of a genome
+    tail_bits = genome_length % WORD_SIZE
+    return np.uint64((1 << tail_bits) - 1) if tail_bits != 0 else np.uint64(np.iinfo(np.uint64).max)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(words)
+    # SWAR popcount, uint64 arithmetic wraps around as needed
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + ((words >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (words * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def pack_population(population: np.ndarray) -> np.ndarray:
+    # Bit i of a genome is stored in bit i % 64 of word i // 64
+    population = np.atleast_2d(population)
+    genome_length = population.shape[1]
+    packed_bytes = np.packbits(population.astype(np.uint8), axis=1, bitorder="little")
+    padded_bytes = np.zeros((population.shape[0], get_num_words(genome_length) * 8), dtype=np.uint8)
+    padded_bytes[:, : packed_bytes.shape[1]] = packed_bytes
+    return padded_bytes.view("<u8").astype(np.uint64)
+
+
+def unpack_population(population: np.ndarray, genome_length: int) -> np.ndarray:
+    population = np.atleast_2d(population)
+    population_bytes = population.astype("<u8").view(np.uint8)
+    return np.unpackbits(population_bytes, axis=1, count=genome_length, bitorder="little").astype(np.int8)
+
+
+def random_genome(length: int) -> np.ndarray:
+    genome = gen.integers(0, np.iinfo(np.uint64).max, size=get_num_words(length), dtype=np.uint64, endpoint=True)
+    if len(genome) > 0:
+        genome[-1] &= get_tail_mask(length)
+    return genome
+
+
+def init_population(population_size: int, genome_length: int) -> np.ndarray:
+    shape = (population_size, get_num_words(genome_length))
+    population = gen.integers(0, np.iinfo(np.uint64).max, size=shape, dtype=np.uint64, endpoint=True)
+    if shape[1] > 0:
+        population[:, -1] &= get_tail_mask(genome_length)
+    return population
+
+
+def get_genome_fitness(genome: np.ndarray, genome_length: int) -> float:
+    return int(np.sum(popcount(genome))) / genome_length
+
+
+def calculate_population_fitnesses(population: np.ndarray, genome_length: int) -> np.ndarray:
+    return np.sum(popcount(population), axis=1) / genome_length
+
+
+def get_target_fitness() -> int:
+    return 1
+
+
+def get_best_fitness(fitness_values: np.ndarray) -> float:
+    return np.max(fitness_values) if len(fitness_values) > 0 else 0.0
+
+
+def get_generation_fitness(fitness_values: np.ndarray, population_size: int) -> float:
+    return np.sum(fitness_values) / population_size if population_size != 0 else 0.0
+
+
+def get_crossover_masks(crossover_points: np.ndarray, num_words: int) -> np.ndarray:
+    # One mask per crossover point with the bits below the point set
+    word_starts = np.arange(num_words) * WORD_SIZE
+    bits_in_word = np.clip(crossover_points[:, None] - word_starts, 0, WORD_SIZE).astype(np.uint64)
+    full_words = bits_in_word == WORD_SIZE
+    partial_masks = (np.uint64(1) << np.where(full_words, np.uint64(0), bits_in_word)) - np.uint64(1)
+    return np.where(full_words, np.uint64(np.iinfo(np.uint64).max), partial_masks)
+
+
+def crossover(
+    parent1: np.ndarray, parent2: np.ndarray, crossover_rate: float, genome_length: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    if gen.random() < crossover_rate:
+        crossover_point = gen.integers(1, genome_length, dtype=int)
+        mask = get_crossover_masks(np.array([crossover_point]), len(parent1))[0]
+        return (parent1 & mask) | (parent2 & ~mask), (parent2 & mask) | (parent1 & ~mask)
+    else:
+        return parent1.copy(), parent2.copy()
+
+
+def mutate_population(population: np.ndarray, mutation_rate: float, genome_length: int) -> np.ndarray:
+    positions = sample_flip_positions(gen, population.shape[0] * genome_length, mutation_rate)
+    genome_idx, bit_idx = np.divmod(positions, genome_length)
+    word_idx, bit_offset = np.divmod(bit_idx, WORD_SIZE)
+    flip_masks = np.left_shift(np.uint64(1), bit_offset.astype(np.uint64))
+    np.bitwise_xor.at(population, (genome_idx, word_idx), flip_masks)
+    return population
+
+
+def mutate(genome: np.ndarray, mutation_rate: float, genome_length: int) -> np.ndarray:
+    return mutate_population(genome[np.newaxis, :], mutation_rate, genome_length)[0]
+
+
+def print_best_values(
+    fitness_values: np.ndarray, population: np.ndarray, generation_fitness: float, genome_length: int
+) -> None:
+    best_index = np.argmax(fitness_values)
+    best_solution = population[best_index]
+    print(f"Best Final Solution: {unpack_population(best_solution, genome_length)[0]}")
+    print(f"Best Final Fitness: {get_genome_fitness(best_solution, genome_length)}")
+    print(f"Generation perfect fitness percentage: {generation_fitness:.2f}")
+
+
+def create_new_population(
+    population_size: int,
+    population: np.ndarray,
+    fitness_values: np.ndarray,
+    select_parent_mode: str,
+    crossover_rate: float,
+    mutation_rate: float,
+    genome_length: int,
+) -> np.ndarray:
+    num_pairs = population_size // 2
+    new_population = population[select_parents(gen, fitness_values, population_size, mode=select_parent_mode)]
+
+    if genome_length > 1 and num_pairs > 0:
+        parents1 = new_population[0 : 2 * num_pairs : 2]
+        parents2 = new_population[1 : 2 * num_pairs : 2]
+        crossover_points = np.where(
+            gen.random(num_pairs) < crossover_rate, gen.integers(1, genome_length, size=num_pairs), genome_length
+        )  # A crossover point at the end of the genome leaves the parents untouched
+        masks = get_crossover_masks(crossover_points, population.shape[1])
+        offspring1 = (parents1 & masks) | (parents2 & ~masks)
+        offspring2 = (parents2 & masks) | (parents1 & ~masks)
+        new_population[0 : 2 * num_pairs : 2] = offspring1
+        new_population[1 : 2 * num_pairs : 2] = offspring2
+
+    return mutate_population(new_population, mutation_rate, genome_length)
+
+
+def genetic_algorithm(
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    verbose: bool = False,
+    seed: Optional[int] = None,
+) -> Tuple[int, float, float]:
+
+    set_seed(seed)
+
+    target_fitness = get_target_fitness()
+    population = init_population(population_size, genome_length)
+    best_population = population
+    fitness_values = calculate_population_fitnesses(population, genome_length)
+
+    best_generation_fitness = 0.0
+
+    for generation in range(max_generations):
+        population = create_new_population(
+            population_size,
+            population,
+            fitness_values,
+            select_parent_mode,
+            crossover_rate,
+            mutation_rate,
+            genome_length,
+        )
+        fitness_values = calculate_population_fitnesses(population, genome_length)
+        generation_fitness = get_generation_fitness(fitness_values, population_size)
+        best_gen_fitness = get_best_fitness(fitness_values)
+
+        if verbose:
+            print(
+                f"Generation {generation}: Best Fitness = {best_gen_fitness} "
+                f"Generation Fitness Percentage: {generation_fitness:.2f}"
+            )
+
+        if generation_fitness >= best_generation_fitness:
+            best_population = population
+            best_generation = generation
+            best_generation_fitness = generation_fitness
+            best_fitness = best_gen_fitness
+
+        if generation_fitness >= target_generation_fitness and best_gen_fitness == target_fitness:
+            if verbose:
+                print(f"Ideal solution found in generation {generation}.")
+                print_best_values(fitness_values, population, generation_fitness, genome_length)
+            return generation, generation_fitness, best_gen_fitness  # Early return
+
+    if verbose:
+        best_fitness_values = calculate_population_fitnesses(best_population, genome_length)
+        print(f"Best solution found after {max_generations} generations was generation number {best_generation}.")
+        print_best_values(best_fitness_values, best_population, best_generation_fitness, genome_length)
+
+    return max_generations, best_generation_fitness, best_fitness
+
+
+def genetic_algorithm_batch(
+    run_times: int,
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    seeds: Optional[List[int]] = None,
+) -> List[Tuple[int, float, float]]:
+    return [
+        genetic_algorithm(
+            population_size,
+            genome_length,
+            max_generations,
+            mutation_rate,
+            crossover_rate,
+            select_parent_mode,
+            target_generation_fitness,
+            seed=seeds[run] if seeds else None,
+        )
+        for run in range(run_times)
+    ]
@@ -1,9 +1,34 @@
+import os
+import pickle
 import random
-from typing import List, Tuple
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from instrumentation import PhaseCounters, add_phase_time, get_phase_counters
+from mutation_vanilla import sample_flip_positions
+from selection_vanilla import select_parents, select_parents_roulette, select_parents_sus, select_parents_tournament
+
+# Every run draws from its own generator so seeded runs are reproducible in any process
+rng = random.Random()
+
+
+class GenerationSnapshot(NamedTuple):
+    # State of one generation yielded by genetic_algorithm_stream. best_genome is part of the population and only valid
+    # until the stream resumes, population is a copy and stays valid.
+    generation: int
+    best_fitness: float
+    mean_fitness: float
+    best_genome: Optional[List[int]] = None
+    population: Optional[List[List[int]]] = None
+
+
+def set_seed(seed: Optional[int] = None) -> None:
+    global rng
+    rng = random.Random(seed)
 
 
 def random_genome(length: int) -> List[int]:
-    return [random.randint(0, 1) for _ in range(length)]
+    return [rng.randint(0, 1) for _ in range(length)]
 
 
 def init_population(population_size: int, genome_length: int) -> List[List[int]]:
@@ -22,6 +47,18 @@ def get_target_fitness() -> int:
     return 1
 
 
+def evaluate_population(population: List[List[int]], fitness_function: Optional[Any] = None) -> List[float]:
+    # One Max unless a fitness function is given, any object with an evaluate method taking the whole population
+    # and a target attribute as in fitness_functions.py
+    if fitness_function is None:
+        return calculate_population_fitnesses(population)
+    return [float(fitness) for fitness in fitness_function.evaluate(population)]
+
+
+def get_fitness_target(fitness_function: Optional[Any] = None) -> float:
+    return get_target_fitness() if fitness_function is None else fitness_function.target
+
+
 def get_best_fitness(fitness_values: List[float]) -> float:
     return max(fitness_values) if fitness_values else 0.0
 
@@ -31,11 +68,14 @@ def get_generation_fitness(fitness_values: List[float], population_size: int) ->
 
 
 def select_parent(population: List[List[int]], fitness_values: List[float], mode: str = "tournament") -> List[int]:
-    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament"]:
-        tournament_size: int = random.randint(int(len(population) * 0.6), int(len(population) * 0.8))
+    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament", "sus"]:
+        tournament_size: int = rng.randint(int(len(population) * 0.6), int(len(population) * 0.8))
         tournament_size = tournament_size if tournament_size > 1 else 1
         return select_parent_tournament(population, fitness_values, tournament_size)
 
+    elif mode.lower() == "sus":
+        return select_parent_sus(population, fitness_values)
+
     else:
         return select_parent_roulette(population, fitness_values)
 
@@ -44,26 +84,22 @@ def select_parent_tournament(
     population: List[List[int]], fitness_values: List[float], tournament_size: int
 ) -> List[int]:
     # Tournament implementation
-    selected_candidates = random.sample(list(zip(population, fitness_values)), tournament_size)
-    winner = max(selected_candidates, key=lambda x: x[1])  # Select the candidate with the highest fitness
-    return winner[0]  # Return the selected individual from the winning tournament
+    return population[select_parents_tournament(rng, fitness_values, 1, tournament_size)[0]]
 
 
 def select_parent_roulette(population: List[List[int]], fitness_values: List[float]) -> List[int]:
     # Roulette wheel implementation
-    total_fitness = sum(fitness_values)
-    pick = random.uniform(0, total_fitness)
-    current = 0.0
-    for individual, fitness_value in zip(population, fitness_values):
-        current += fitness_value
-        if current > pick:
-            return individual
-    return population[0]
+    return population[select_parents_roulette(rng, fitness_values, 1)[0]]
+
+
+def select_parent_sus(population: List[List[int]], fitness_values: List[float]) -> List[int]:
+    # A single pointer stochastic universal sampling is a roulette spin
+    return population[select_parents_sus(rng, fitness_values, 1)[0]]
 
 
 def crossover(parent1: List[int], parent2: List[int], crossover_rate: float) -> Tuple[List[int], List[int]]:
-    if random.random() < crossover_rate:
-        crossover_point = random.randint(1, len(parent1) - 1)
+    if rng.random() < crossover_rate:
+        crossover_point = rng.randint(1, len(parent1) - 1)
         return (
             parent1[:crossover_point] + parent2[crossover_point:],
             parent2[:crossover_point] + parent1[crossover_point:],
@@ -73,17 +109,32 @@ def crossover(parent1: List[int], parent2: List[int], crossover_rate: float) ->
 
 
 def mutate(genome: List[int], mutation_rate: float) -> List[int]:
-    for i in range(len(genome)):
-        if random.random() < mutation_rate:
-            genome[i] = abs(genome[i] - 1)
+    for i in sample_flip_positions(rng, len(genome), mutation_rate):
+        genome[i] = abs(genome[i] - 1)
     return genome
 
 
+def mutate_with_ones_delta(genome: List[int], mutation_rate: float) -> int:
+    # Same as mutate, returns how much the number of ones in the genome changed
+    ones_delta = 0
+    for i in sample_flip_positions(rng, len(genome), mutation_rate):
+        ones_delta += 1 - 2 * genome[i]
+        genome[i] = abs(genome[i] - 1)
+    return ones_delta
+
+
+def count_prefix_ones(genome: List[int], crossover_point: int, ones_count: int) -> int:
+    # Only the shorter side of the crossover point is summed
+    if crossover_point <= len(genome) // 2:
+        return sum(genome[:crossover_point])
+    return ones_count - sum(genome[crossover_point:])
+
+
 def print_best_values(fitness_values: List[float], population: List[List[int]], generation_fitness: float) -> None:
     best_index = fitness_values.index(get_best_fitness(fitness_values))
     best_solution = population[best_index]
     print(f"Best Final Solution: {best_solution}")
-    print(f"Best Final Fitness: {get_genome_fitness(best_solution)}")
+    print(f"Best Final Fitness: {fitness_values[best_index]}")
     print(f"Generation perfect fitness percentage: {generation_fitness:.2f}")
 
 
@@ -94,22 +145,127 @@ def create_new_population(
     select_parent_mode: str,
     crossover_rate: float,
     mutation_rate: float,
+    phase_counters: Optional[PhaseCounters] = None,
 ) -> List[List[int]]:
+    # Every operator call is timed when phase_counters is given, otherwise the timing costs a None check
+    start = perf_counter_ns() if phase_counters is not None else 0
     new_population = []
-    for _ in range(population_size // 2):
+    parents_idx = select_parents(rng, fitness_values, population_size, mode=select_parent_mode)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "selection", start)
+    for i in range(0, population_size - 1, 2):
         # Tournament mode converges way faster than roulette
-        parent1 = select_parent(population, fitness_values, mode=select_parent_mode)
-        parent2 = select_parent(population, fitness_values, mode=select_parent_mode)
+        parent1 = population[parents_idx[i]]
+        parent2 = population[parents_idx[i + 1]]
         offspring1, offspring2 = crossover(parent1, parent2, crossover_rate)
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "crossover", start)
         new_population.extend([mutate(offspring1, mutation_rate), mutate(offspring2, mutation_rate)])
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "mutation", start)
 
     if population_size % 2 != 0:
-        parent = select_parent(population, fitness_values, mode=select_parent_mode)
+        parent = population[parents_idx[-1]].copy()
         new_population.append(mutate(parent, mutation_rate))
+        if phase_counters is not None:
+            add_phase_time(phase_counters, "mutation", start)
 
     return new_population
 
 
+def create_new_population_incremental(
+    population_size: int,
+    population: List[List[int]],
+    fitness_values: List[float],
+    select_parent_mode: str,
+    crossover_rate: float,
+    mutation_rate: float,
+    ones_counts: List[int],
+    phase_counters: Optional[PhaseCounters] = None,
+) -> Tuple[List[List[int]], List[int]]:
+    # Same as create_new_population, also returns the number of ones of each child. It is derived from the parents'
+    # counts at the crossover point plus the mutation delta instead of summing every child again.
+    start = perf_counter_ns() if phase_counters is not None else 0
+    genome_length = len(population[0]) if population else 0
+    new_population = []
+    new_ones_counts = []
+    parents_idx = select_parents(rng, fitness_values, population_size, mode=select_parent_mode)
+    if phase_counters is not None:
+        start = add_phase_time(phase_counters, "selection", start)
+    for i in range(0, population_size - 1, 2):
+        parent1, parent2 = population[parents_idx[i]], population[parents_idx[i + 1]]
+        ones1, ones2 = ones_counts[parents_idx[i]], ones_counts[parents_idx[i + 1]]
+        if rng.random() < crossover_rate:
+            crossover_point = rng.randint(1, genome_length - 1)
+            prefix_ones1 = count_prefix_ones(parent1, crossover_point, ones1)
+            prefix_ones2 = count_prefix_ones(parent2, crossover_point, ones2)
+            offspring1 = parent1[:crossover_point] + parent2[crossover_point:]
+            offspring2 = parent2[:crossover_point] + parent1[crossover_point:]
+            ones1, ones2 = prefix_ones1 + ones2 - prefix_ones2, prefix_ones2 + ones1 - prefix_ones1
+        else:
+            offspring1, offspring2 = parent1.copy(), parent2.copy()
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "crossover", start)
+        new_population.extend([offspring1, offspring2])
+        new_ones_counts.extend(
+            [
+                ones1 + mutate_with_ones_delta(offspring1, mutation_rate),
+                ones2 + mutate_with_ones_delta(offspring2, mutation_rate),
+            ]
+        )
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "mutation", start)
+
+    if population_size % 2 != 0:
+        parent = population[parents_idx[-1]].copy()
+        new_population.append(parent)
+        new_ones_counts.append(ones_counts[parents_idx[-1]] + mutate_with_ones_delta(parent, mutation_rate))
+        if phase_counters is not None:
+            add_phase_time(phase_counters, "mutation", start)
+
+    return new_population, new_ones_counts
+
+
+def save_checkpoint(
+    checkpoint_path: str,
+    generation: int,
+    population: List[List[int]],
+    fitness_values: List[float],
+    best_population: List[List[int]],
+    best_generation: int,
+    best_generation_fitness: float,
+    best_fitness: float,
+) -> None:
+    # Written to a temporary file first so a crash while saving never corrupts the previous checkpoint
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, "wb") as checkpoint_file:
+        pickle.dump(
+            (
+                generation,
+                population,
+                fitness_values,
+                best_population,
+                best_generation,
+                best_generation_fitness,
+                best_fitness,
+                rng.getstate(),
+            ),
+            checkpoint_file,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(temp_path, checkpoint_path)
+
+
+def load_checkpoint(
+    checkpoint_path: str,
+) -> Tuple[int, List[List[int]], List[float], List[List[int]], int, float, float]:
+    # Restores the random generator too, so the run continues exactly as if it had never stopped
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        *checkpoint, random_state = pickle.load(checkpoint_file)
+    rng.setstate(random_state)
+    return tuple(checkpoint)  # type: ignore
+
+
 def genetic_algorithm(
     population_size: int = 100,
     genome_length: int = 50,
@@ -119,23 +275,83 @@ def genetic_algorithm(
     select_parent_mode: str = "tournament",
     target_generation_fitness: float = 0.9,
     verbose: bool = False,
+    incremental_fitness: bool = False,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: int = 100,
+    seed: Optional[int] = None,
+    instrumentation: Optional[Dict[str, Any]] = None,
+    fitness_function: Optional[Any] = None,
 ) -> Tuple[int, float, float]:
-
-    target_fitness = get_target_fitness()
+    # A given instrumentation dict is filled with the phase counters of the run and the best and mean fitness of
+    # every generation
+    if incremental_fitness and fitness_function is not None:
+        raise ValueError("Incremental fitness only supports One Max.")
+
+    set_seed(seed)
+    phase_counters: Optional[PhaseCounters] = None
+    if instrumentation is not None:
+        phase_counters = get_phase_counters()
+        instrumentation.update(phases=phase_counters, best_fitness=[], mean_fitness=[])
+        if fitness_function is not None and hasattr(fitness_function, "stats"):  # Counted by a fitness cache
+            instrumentation["fitness_cache"] = fitness_function.stats
+    start = 0
+    target_fitness = get_fitness_target(fitness_function)
     population = init_population(population_size, genome_length)
     best_population = population
-    fitness_values = calculate_population_fitnesses(population)
+    fitness_values = evaluate_population(population, fitness_function)
 
     best_generation_fitness = 0.0
-
-    for generation in range(max_generations):
-
-        population = create_new_population(
-            population_size, population, fitness_values, select_parent_mode, crossover_rate, mutation_rate
-        )
-        fitness_values = calculate_population_fitnesses(population)
+    start_generation = 0
+
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):  # Continue a stopped run
+        (
+            generation,
+            population,
+            fitness_values,
+            best_population,
+            best_generation,
+            best_generation_fitness,
+            best_fitness,
+        ) = load_checkpoint(checkpoint_path)
+        start_generation = generation + 1
+    ones_counts = [sum(genome) for genome in population] if incremental_fitness else []
+
+    for generation in range(start_generation, max_generations):
+
+        if incremental_fitness:
+            population, ones_counts = create_new_population_incremental(
+                population_size,
+                population,
+                fitness_values,
+                select_parent_mode,
+                crossover_rate,
+                mutation_rate,
+                ones_counts,
+                phase_counters,
+            )
+            if phase_counters is not None:
+                start = perf_counter_ns()
+            fitness_values = [ones / genome_length for ones in ones_counts]
+        else:
+            population = create_new_population(
+                population_size,
+                population,
+                fitness_values,
+                select_parent_mode,
+                crossover_rate,
+                mutation_rate,
+                phase_counters,
+            )
+            if phase_counters is not None:
+                start = perf_counter_ns()
+            fitness_values = evaluate_population(population, fitness_function)
+        if phase_counters is not None:
+            start = add_phase_time(phase_counters, "fitness", start)
         generation_fitness = get_generation_fitness(fitness_values, population_size)
         best_gen_fitness = get_best_fitness(fitness_values)
+        if instrumentation is not None:
+            instrumentation["best_fitness"].append(best_gen_fitness)
+            instrumentation["mean_fitness"].append(generation_fitness)
 
         if verbose:
             print(
@@ -152,11 +368,94 @@ def genetic_algorithm(
             if verbose:
                 print(f"Ideal solution found in generation {generation}.")
                 print_best_values(fitness_values, population, generation_fitness)
+            if phase_counters is not None:
+                add_phase_time(phase_counters, "bookkeeping", start)
             return generation, generation_fitness, best_fitness  # Early return
 
+        if checkpoint_path is not None and (generation + 1) % checkpoint_interval == 0:
+            save_checkpoint(
+                checkpoint_path,
+                generation,
+                population,
+                fitness_values,
+                best_population,
+                best_generation,
+                best_generation_fitness,
+                best_fitness,
+            )
+        if phase_counters is not None:
+            add_phase_time(phase_counters, "bookkeeping", start)
+
     if verbose:
-        best_fitness_values = calculate_population_fitnesses(best_population)
+        best_fitness_values = evaluate_population(best_population, fitness_function)
         print(f"Best solution found after {max_generations} generations was generation number {best_generation}.")
         print_best_values(best_fitness_values, best_population, best_generation_fitness)
 
     return max_generations, best_generation_fitness, best_fitness
+
+
+def genetic_algorithm_stream(
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    seed: Optional[int] = None,
+    include_best_genome: bool = False,
+    copy_population: bool = False,
+    fitness_function: Optional[Any] = None,
+) -> Iterator[GenerationSnapshot]:
+    # Evolves like genetic_algorithm but yields every generation instead of printing it, so the caller can log, plot
+    # or stop early by leaving the loop. The stream ends with the generation that reaches the target. Nothing is
+    # copied unless copy_population is set.
+    set_seed(seed)
+    target_fitness = get_fitness_target(fitness_function)
+    population = init_population(population_size, genome_length)
+    fitness_values = evaluate_population(population, fitness_function)
+
+    for generation in range(max_generations):
+        population = create_new_population(
+            population_size, population, fitness_values, select_parent_mode, crossover_rate, mutation_rate
+        )
+        fitness_values = evaluate_population(population, fitness_function)
+        generation_fitness = get_generation_fitness(fitness_values, population_size)
+        best_gen_fitness = get_best_fitness(fitness_values)
+        yield GenerationSnapshot(
+            generation,
+            float(best_gen_fitness),
+            float(generation_fitness),
+            population[fitness_values.index(best_gen_fitness)] if include_best_genome else None,
+            [genome.copy() for genome in population] if copy_population else None,
+        )
+        if generation_fitness >= target_generation_fitness and best_gen_fitness == target_fitness:
+            return
+
+
+def genetic_algorithm_batch(
+    run_times: int,
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    seeds: Optional[List[int]] = None,
+    fitness_function: Optional[Any] = None,
+) -> List[Tuple[int, float, float]]:
+    return [
+        genetic_algorithm(
+            population_size,
+            genome_length,
+            max_generations,
+            mutation_rate,
+            crossover_rate,
+            select_parent_mode,
+            target_generation_fitness,
+            seed=seeds[run] if seeds else None,
+            fitness_function=fitness_function,
+        )
+        for run in range(run_times)
+    ]
@@ -0,0 +1,221 @@
+import random
+from typing import List, Optional, Tuple
+
+from mutation_vanilla import sample_flip_positions
+from selection_vanilla import select_parents, select_parents_roulette, select_parents_sus, select_parents_tournament
+
+# Every run draws from its own generator so seeded runs are reproducible in any process
+rng = random.Random()
+
+
+def set_seed(seed: Optional[int] = None) -> None:
+    global rng
+    rng = random.Random(seed)
+
+
+def random_genome(length: int) -> int:
+    # Bit i of the integer is gene i of the genome
+    return rng.getrandbits(length) if length > 0 else 0
+
+
+def init_population(population_size: int, genome_length: int) -> List[int]:
+    return [random_genome(genome_length) for _ in range(population_size)]
+
+
+def pack_genome(genome: List[int]) -> int:
+    return int("".join(str(gene) for gene in reversed(genome)), 2) if genome else 0
+
+
+def unpack_genome(genome: int, genome_length: int) -> List[int]:
+    return [(genome >> i) & 1 for i in range(genome_length)]
+
+
+def get_genome_fitness(genome: int, genome_length: int) -> float:
+    return genome.bit_count() / genome_length
+
+
+def calculate_population_fitnesses(population: List[int], genome_length: int) -> List[float]:
+    return [genome.bit_count() / genome_length for genome in population]
+
+
+def get_target_fitness() -> int:
+    return 1
+
+
+def get_best_fitness(fitness_values: List[float]) -> float:
+    return max(fitness_values) if fitness_values else 0.0
+
+
+def get_generation_fitness(fitness_values: List[float], population_size: int) -> float:
+    return sum(fitness_values) / (population_size) if population_size != 0 else 0
+
+
+def select_parent(population: List[int], fitness_values: List[float], mode: str = "tournament") -> int:
+    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament", "sus"]:
+        tournament_size: int = rng.randint(int(len(population) * 0.6), int(len(population) * 0.8))
+        tournament_size = tournament_size if tournament_size > 1 else 1
+        return select_parent_tournament(population, fitness_values, tournament_size)
+
+    elif mode.lower() == "sus":
+        return select_parent_sus(population, fitness_values)
+
+    else:
+        return select_parent_roulette(population, fitness_values)
+
+
+def select_parent_tournament(population: List[int], fitness_values: List[float], tournament_size: int) -> int:
+    # Tournament implementation
+    return population[select_parents_tournament(rng, fitness_values, 1, tournament_size)[0]]
+
+
+def select_parent_roulette(population: List[int], fitness_values: List[float]) -> int:
+    # Roulette wheel implementation
+    return population[select_parents_roulette(rng, fitness_values, 1)[0]]
+
+
+def select_parent_sus(population: List[int], fitness_values: List[float]) -> int:
+    # A single pointer stochastic universal sampling is a roulette spin
+    return population[select_parents_sus(rng, fitness_values, 1)[0]]
+
+
+def crossover(parent1: int, parent2: int, crossover_rate: float, genome_length: int) -> Tuple[int, int]:
+    if rng.random() < crossover_rate:
+        crossover_point = rng.randint(1, genome_length - 1)
+        mask = (1 << crossover_point) - 1
+        return (parent1 & mask) | (parent2 & ~mask), (parent2 & mask) | (parent1 & ~mask)
+    else:
+        return parent1, parent2
+
+
+def get_mutation_mask(genome_length: int, mutation_rate: float) -> int:
+    # Bit i of the mask is set when gene i flips
+    mask = 0
+    for position in sample_flip_positions(rng, genome_length, mutation_rate):
+        mask |= 1 << position
+    return mask
+
+
+def mutate(genome: int, mutation_rate: float, genome_length: int) -> int:
+    return genome ^ get_mutation_mask(genome_length, mutation_rate)
+
+
+def print_best_values(
+    fitness_values: List[float], population: List[int], generation_fitness: float, genome_length: int
+) -> None:
+    best_index = fitness_values.index(get_best_fitness(fitness_values))
+    best_solution = population[best_index]
+    print(f"Best Final Solution: {unpack_genome(best_solution, genome_length)}")
+    print(f"Best Final Fitness: {get_genome_fitness(best_solution, genome_length)}")
+    print(f"Generation perfect fitness percentage: {generation_fitness:.2f}")
+
+
+def create_new_population(
+    population_size: int,
+    population: List[int],
+    fitness_values: List[float],
+    select_parent_mode: str,
+    crossover_rate: float,
+    mutation_rate: float,
+    genome_length: int,
+) -> List[int]:
+    new_population = []
+    parents_idx = select_parents(rng, fitness_values, population_size, mode=select_parent_mode)
+    for i in range(0, population_size - 1, 2):
+        offspring1, offspring2 = crossover(
+            population[parents_idx[i]], population[parents_idx[i + 1]], crossover_rate, genome_length
+        )
+        new_population.extend(
+            [mutate(offspring1, mutation_rate, genome_length), mutate(offspring2, mutation_rate, genome_length)]
+        )
+
+    if population_size % 2 != 0:
+        new_population.append(mutate(population[parents_idx[-1]], mutation_rate, genome_length))
+
+    return new_population
+
+
+def genetic_algorithm(
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    verbose: bool = False,
+    seed: Optional[int] = None,
+) -> Tuple[int, float, float]:
+
+    set_seed(seed)
+    target_fitness = get_target_fitness()
+    population = init_population(population_size, genome_length)
+    best_population = population
+    fitness_values = calculate_population_fitnesses(population, genome_length)
+
+    best_generation_fitness = 0.0
+
+    for generation in range(max_generations):
+
+        population = create_new_population(
+            population_size,
+            population,
+            fitness_values,
+            select_parent_mode,
+            crossover_rate,
+            mutation_rate,
+            genome_length,
+        )
+        fitness_values = calculate_population_fitnesses(population, genome_length)
+        generation_fitness = get_generation_fitness(fitness_values, population_size)
+        best_gen_fitness = get_best_fitness(fitness_values)
+
+        if verbose:
+            print(
+                f"Generation {generation}: Best Fitness = {best_gen_fitness} "
+                f"Generation Fitness Percentage: {generation_fitness:.2f}"
+            )
+
+        if generation_fitness >= best_generation_fitness:
+            best_population = population
+            best_generation = generation
+            best_generation_fitness = generation_fitness
+            best_fitness = best_gen_fitness
+
+        if generation_fitness >= target_generation_fitness and best_gen_fitness == target_fitness:
+            if verbose:
+                print(f"Ideal solution found in generation {generation}.")
+                print_best_values(fitness_values, population, generation_fitness, genome_length)
+            return generation, generation_fitness, best_fitness  # Early return
+
+    if verbose:
+        best_fitness_values = calculate_population_fitnesses(best_population, genome_length)
+        print(f"Best solution found after {max_generations} generations was generation number {best_generation}.")
+        print_best_values(best_fitness_values, best_population, best_generation_fitness, genome_length)
+
+    return max_generations, best_generation_fitness, best_fitness
+
+
+def genetic_algorithm_batch(
+    run_times: int,
+    population_size: int = 100,
+    genome_length: int = 50,
+    max_generations: int = 1000,
+    mutation_rate: float = 0.02,
+    crossover_rate: float = 0.7,
+    select_parent_mode: str = "tournament",
+    target_generation_fitness: float = 0.9,
+    seeds: Optional[List[int]] = None,
+) -> List[Tuple[int, float, float]]:
+    return [
+        genetic_algorithm(
+            population_size,
+            genome_length,
+            max_generations,
+            mutation_rate,
+            crossover_rate,
+            select_parent_mode,
+            target_generation_fitness,
+            seed=seeds[run] if seeds else None,
+        )
+        for run in range(run_times)
+    ]
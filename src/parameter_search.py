@@ -0,0 +1,118 @@
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Candidate = Tuple[float, float]  # mutation rate, crossover rate
+# Scores every candidate with the given run times and max generations, higher is better
+Evaluate = Callable[[List[Candidate], int, int], List[float]]
+
+
+def successive_halving(
+    candidates: Sequence[Candidate],
+    evaluate: Evaluate,
+    min_run_times: int = 1,
+    max_run_times: int = 8,
+    min_generations: int = 50,
+    max_generations: int = 400,
+    reduction_factor: int = 2,
+) -> Tuple[Candidate, float, int]:
+    # Every round scores the surviving candidates, keeps the best 1 / reduction_factor of them and multiplies the runs
+    # and generations of the next round by reduction_factor. The last candidate is scored once more with the full
+    # budget. Returns the best candidate, its score and the total number of runs spent.
+    if not candidates:
+        raise ValueError("At least one candidate is needed.")
+    if reduction_factor < 2:
+        raise ValueError("The reduction factor must be at least 2.")
+    if min(min_run_times, max_run_times) < 1:  # A round without runs would never grow its budget
+        raise ValueError("The minimum and maximum run times must be at least 1.")
+    if min(min_generations, max_generations) < 1:
+        raise ValueError("The minimum and maximum generations must be at least 1.")
+
+    survivors = list(candidates)
+    run_times = min(min_run_times, max_run_times)
+    generations = min(min_generations, max_generations)
+    total_runs = 0
+
+    while True:
+        scores = evaluate(survivors, run_times, generations)
+        total_runs += run_times * len(survivors)
+        full_budget = run_times == max_run_times and generations == max_generations
+        if len(survivors) == 1 and full_budget:
+            return survivors[0], scores[0], total_runs
+
+        ranking = sorted(range(len(survivors)), key=lambda idx: scores[idx], reverse=True)  # Ties keep grid order
+        survivors = [survivors[idx] for idx in ranking[: math.ceil(len(survivors) / reduction_factor)]]
+        run_times = min(run_times * reduction_factor, max_run_times)
+        generations = min(generations * reduction_factor, max_generations)
+
+
+def rbf_kernel(points1: np.ndarray, points2: np.ndarray, length_scale: float) -> np.ndarray:
+    squared_distances = np.sum((points1[:, None, :] - points2[None, :, :]) ** 2, axis=-1)
+    return np.exp(-0.5 * squared_distances / length_scale**2)
+
+
+def predict_gaussian_process(
+    observed_points: np.ndarray,
+    observed_scores: np.ndarray,
+    query_points: np.ndarray,
+    length_scale: float = 0.2,
+    noise: float = 1e-2,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Posterior mean and standard deviation of a gaussian process with an RBF kernel fitted to the standardized scores.
+    # The noise term absorbs the run to run variance of the scores.
+    score_mean = np.mean(observed_scores)
+    score_std = np.std(observed_scores) or 1.0
+    standardized_scores = (observed_scores - score_mean) / score_std
+
+    cholesky = np.linalg.cholesky(
+        rbf_kernel(observed_points, observed_points, length_scale) + noise * np.eye(len(observed_points))
+    )
+    weights = np.linalg.solve(cholesky.T, np.linalg.solve(cholesky, standardized_scores))
+    query_kernel = rbf_kernel(query_points, observed_points, length_scale)
+    projection = np.linalg.solve(cholesky, query_kernel.T)
+    variance = np.maximum(1.0 - np.sum(projection**2, axis=0), 0.0)
+    return query_kernel @ weights * score_std + score_mean, np.sqrt(variance) * score_std
+
+
+def surrogate_search(
+    mutation_rate_bounds: Tuple[float, float],
+    crossover_rate_bounds: Tuple[float, float],
+    evaluate: Evaluate,
+    budget: int = 20,
+    initial_points: int = 5,
+    run_times: int = 8,
+    generations: int = 400,
+    exploration: float = 2.0,
+    num_proposals: int = 1000,
+    seed: Optional[int] = None,
+) -> Tuple[Candidate, float, int]:
+    # Scores initial_points random candidates, then fits a gaussian process to every score seen so far and evaluates
+    # the random proposal with the highest upper confidence bound until budget candidates have been scored. The rates
+    # are searched in the unit square and scaled to their bounds. Returns the best candidate, its score and the total
+    # number of runs spent.
+    if budget < 1:
+        raise ValueError("The evaluation budget must be at least 1.")
+
+    gen = np.random.default_rng(seed)
+    lower_bounds = np.array([mutation_rate_bounds[0], crossover_rate_bounds[0]])
+    upper_bounds = np.array([mutation_rate_bounds[1], crossover_rate_bounds[1]])
+
+    def to_candidate(unit_point: np.ndarray) -> Candidate:
+        rates = lower_bounds + unit_point * (upper_bounds - lower_bounds)
+        return round(float(rates[0]), 4), round(float(rates[1]), 4)
+
+    observed_points = gen.random((min(max(initial_points, 1), budget), 2))
+    candidates = [to_candidate(point) for point in observed_points]
+    scores = list(evaluate(candidates, run_times, generations))
+
+    while len(candidates) < budget:
+        proposals = gen.random((num_proposals, 2))
+        mean, std = predict_gaussian_process(observed_points, np.array(scores), proposals)
+        next_point = proposals[np.argmax(mean + exploration * std)]
+        observed_points = np.vstack([observed_points, next_point])
+        candidates.append(to_candidate(next_point))
+        scores.extend(evaluate(candidates[-1:], run_times, generations))
+
+    best_idx = int(np.argmax(scores))
+    return candidates[best_idx], scores[best_idx], len(candidates) * run_times
@@ -0,0 +1,44 @@
+import glob
+import io
+import os
+import pstats
+import shutil
+from typing import List, Optional, TextIO
+
+PROFILE_DIR: str = ".profiles"
+WORKER_PROFILE_PATTERN: str = "worker_*.prof"
+MERGED_PROFILE_NAME: str = "merged.prof"
+PROFILE_REPORT_NAME: str = "report.txt"
+REPORT_LIMIT: int = 25  # Functions listed in each section of the report
+
+
+def prepare_profile_dir(profile_dir: str = PROFILE_DIR) -> str:
+    # Stats files of an earlier sweep would be merged into this one, so the directory starts empty
+    shutil.rmtree(profile_dir, ignore_errors=True)
+    os.makedirs(profile_dir)
+    return profile_dir
+
+
+def get_worker_profiles(profile_dir: str = PROFILE_DIR) -> List[str]:
+    return sorted(glob.glob(os.path.join(profile_dir, WORKER_PROFILE_PATTERN)))
+
+
+def merge_profiles(profile_dir: str = PROFILE_DIR, stream: Optional[TextIO] = None) -> pstats.Stats:
+    worker_profiles = get_worker_profiles(profile_dir)
+    if not worker_profiles:
+        raise FileNotFoundError(f"No worker profiles were written to {profile_dir}.")
+    return pstats.Stats(*worker_profiles, stream=stream)
+
+
+def write_profile_report(profile_dir: str = PROFILE_DIR, limit: int = REPORT_LIMIT) -> str:
+    # Merges the stats of every worker, saves them for other viewers (snakeviz, gprof2dot) and writes the hot spots
+    # by own time and by cumulative time as text. Returns the report.
+    report = io.StringIO()
+    stats = merge_profiles(profile_dir, report)
+    stats.dump_stats(os.path.join(profile_dir, MERGED_PROFILE_NAME))
+    report.write(f"Merged {len(get_worker_profiles(profile_dir))} worker profiles\n")
+    stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(limit)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    with open(os.path.join(profile_dir, PROFILE_REPORT_NAME), "w") as report_file:
+        report_file.write(report.getvalue())
+    return report.getvalue()
@@ -0,0 +1,74 @@
+import os
+import sqlite3
+from typing import List, NamedTuple, Optional, Tuple
+
+RESULT_CACHE_PATH: str = os.path.join(".cache", "results.sqlite3")
+NO_SEED: int = -1  # Stored instead of None, NULL values are never equal inside a primary key
+
+
+class RunConfig(NamedTuple):
+    backend: str
+    population_size: int
+    genome_length: int
+    generations: int
+    mutation_rate: float
+    crossover_rate: float
+    select_parent_mode: str
+    target_generation_fitness: float
+    seed: Optional[int] = None
+
+
+class ResultCache:
+    # Stores the (generation, generation_fitness, best_fitness) tuple of every run on disk, keyed by the full
+    # configuration of the genetic algorithm and the index of the run
+    def __init__(self, path: str = RESULT_CACHE_PATH) -> None:
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS runs (
+                backend TEXT NOT NULL,
+                population_size INTEGER NOT NULL,
+                genome_length INTEGER NOT NULL,
+                generations INTEGER NOT NULL,
+                mutation_rate REAL NOT NULL,
+                crossover_rate REAL NOT NULL,
+                select_parent_mode TEXT NOT NULL,
+                target_generation_fitness REAL NOT NULL,
+                seed INTEGER NOT NULL,
+                run_index INTEGER NOT NULL,
+                generation INTEGER NOT NULL,
+                generation_fitness REAL NOT NULL,
+                best_fitness REAL NOT NULL,
+                PRIMARY KEY (
+                    backend, population_size, genome_length, generations, mutation_rate, crossover_rate,
+                    select_parent_mode, target_generation_fitness, seed, run_index
+                )
+            )"""
+        )
+        self.connection.commit()
+
+    def get_key(self, config: RunConfig) -> Tuple:
+        return (*config[:-1], config.seed if config.seed is not None else NO_SEED)
+
+    def get_runs(self, config: RunConfig, max_runs: int) -> List[Tuple[int, float, float]]:
+        # Returns the cached runs with an index below max_runs, in run order
+        rows = self.connection.execute(
+            """SELECT generation, generation_fitness, best_fitness FROM runs
+            WHERE backend = ? AND population_size = ? AND genome_length = ? AND generations = ? AND mutation_rate = ?
+            AND crossover_rate = ? AND select_parent_mode = ? AND target_generation_fitness = ? AND seed = ?
+            AND run_index < ? ORDER BY run_index""",
+            (*self.get_key(config), max_runs),
+        )
+        return [(int(row[0]), float(row[1]), float(row[2])) for row in rows]
+
+    def add_runs(self, config: RunConfig, runs: List[Tuple[int, float, float]], first_run_index: int = 0) -> None:
+        key = self.get_key(config)
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*key, first_run_index + i, *run) for i, run in enumerate(runs)],
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,55 @@
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Dict, List, Set
+
+
+class TaskScheduler:
+    # Submits the combinations of a sweep in order and keeps at least max_pending tasks queued, topping the queue up
+    # every time any task finishes. The sweep still consumes the combinations in order, so its early stop logic is
+    # unchanged while the workers never wait for the slowest run of a combination.
+    def __init__(self, submit: Callable[[int], List[Future]], num_combinations: int, max_pending: int) -> None:
+        self.submit = submit
+        self.num_combinations: int = num_combinations
+        self.max_pending: int = max_pending
+        self.next_combination: int = 0
+        self.tasks: Dict[int, List[Future]] = {}
+
+    def get_pending_tasks(self) -> Set[Future]:
+        return {future for future_tasks in self.tasks.values() for future in future_tasks if not future.done()}
+
+    def submit_next(self) -> None:
+        self.tasks[self.next_combination] = self.submit(self.next_combination)
+        self.next_combination += 1
+
+    def fill(self) -> None:
+        pending_tasks = len(self.get_pending_tasks())
+        while self.next_combination < self.num_combinations and pending_tasks < self.max_pending:
+            self.submit_next()
+            pending_tasks += len(self.tasks[self.next_combination - 1])
+
+    def wait(self, combination_index: int) -> List[Future]:
+        # Blocks until every task of the combination is done and hands them over
+        while self.next_combination <= combination_index:
+            self.submit_next()
+        self.fill()
+        future_tasks = self.tasks.pop(combination_index)
+        remaining_tasks = {future for future in future_tasks if not future.done()}
+        while remaining_tasks:
+            done_tasks, _ = wait(remaining_tasks | self.get_pending_tasks(), return_when=FIRST_COMPLETED)
+            remaining_tasks -= done_tasks
+            self.fill()
+        return future_tasks
+
+    def skip_until(self, combination_index: int) -> List[Future]:
+        # Cancels every combination before combination_index, the sweep continues from there. Future.cancel() only
+        # removes queued tasks, the ones a worker already started run to the end and are returned.
+        running_tasks = []
+        for skipped_index in [index for index in self.tasks if index < combination_index]:
+            for future in self.tasks.pop(skipped_index):
+                if not future.cancel() and not future.done():
+                    running_tasks.append(future)
+        self.next_combination = max(self.next_combination, combination_index)
+        return running_tasks
+
+    def cancel(self) -> List[Future]:
+        # Nothing else is submitted and the queued tasks are dropped, the returned running ones still finish
+        return self.skip_until(self.num_combinations)
@@ -0,0 +1,102 @@
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+
+@lru_cache(maxsize=128)
+def get_tournament_rank_cdf(
+    population_size: int, min_tournament_size: int, max_tournament_size: int
+) -> np.ndarray:
+    # Cumulative probability of a tournament winner being the r-th fittest individual. A tournament of k
+    # individuals drawn without replacement is won by rank r or worse with probability C(P - k, r) / C(P, r),
+    # and the sum over every k between min and max collapses to two terms with the hockey-stick identity.
+    log_factorials = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, population_size + 2)))))
+
+    def log_comb(n: int, k: np.ndarray) -> np.ndarray:
+        return np.where(
+            k <= n, log_factorials[n] - log_factorials[k] - log_factorials[np.clip(n - k, 0, None)], -np.inf
+        )
+
+    ranks = np.arange(1, population_size + 1)
+    log_total = log_comb(population_size, ranks)
+    survival = np.exp(log_comb(population_size - min_tournament_size + 1, ranks + 1) - log_total) - np.exp(
+        log_comb(population_size - max_tournament_size, ranks + 1) - log_total
+    )
+    cdf = 1 - survival / (max_tournament_size - min_tournament_size + 1)
+    cdf[-1] = 1.0
+    return cdf
+
+
+def select_parents_tournament(
+    generator: np.random.Generator,
+    fitness_values: np.ndarray, num_parents: int, tournament_size: int, max_tournament_size: Optional[int] = None
+) -> np.ndarray:
+    # Returns the indices of num_parents tournament winners without playing the tournaments: the winner's fitness
+    # rank is drawn from its exact distribution. Tournament sizes are drawn uniformly between tournament_size and
+    # max_tournament_size. A 2D fitness_values array holds one population per row, each one selected independently.
+    population_size = fitness_values.shape[-1]
+    picks_shape = fitness_values.shape[:-1] + (num_parents,)
+    rank_cdf = get_tournament_rank_cdf(population_size, tournament_size, max_tournament_size or tournament_size)
+    ranking = np.argsort(-fitness_values, axis=-1, kind="stable")
+    ranks = np.minimum(np.searchsorted(rank_cdf, generator.random(picks_shape), side="right"), population_size - 1)
+
+    # Tied individuals share a fitness rank range, the winner is uniform among them
+    sorted_fitness = np.take_along_axis(fitness_values, ranking, axis=-1)
+    positions = np.arange(population_size)
+    first_of_group = np.ones(fitness_values.shape[:-1] + (1,), dtype=bool)
+    group_starts = np.concatenate((first_of_group, sorted_fitness[..., 1:] != sorted_fitness[..., :-1]), axis=-1)
+    group_starts = np.maximum.accumulate(np.where(group_starts, positions, 0), axis=-1)
+    group_ends = np.concatenate((sorted_fitness[..., :-1] != sorted_fitness[..., 1:], first_of_group), axis=-1)
+    group_ends = np.where(group_ends, positions + 1, population_size)
+    group_ends = np.flip(np.minimum.accumulate(np.flip(group_ends, axis=-1), axis=-1), axis=-1)
+    starts = np.take_along_axis(group_starts, ranks, axis=-1)
+    ends = np.take_along_axis(group_ends, ranks, axis=-1)
+    ranks = starts + (generator.random(picks_shape) * (ends - starts)).astype(ranks.dtype)
+    return np.take_along_axis(ranking, ranks, axis=-1)
+
+
+def spin_wheels(fitness_values: np.ndarray, pointers: np.ndarray) -> np.ndarray:
+    # Returns the individuals under each pointer in [0, 1) of the fitness proportionate wheel, in one binary search.
+    # Each row's wheel is normalized to [0, 1] and shifted by its row number so one search serves every row.
+    population_size = fitness_values.shape[-1]
+    cumulative_fitness = np.cumsum(fitness_values, axis=-1).reshape(-1, population_size)
+    total_fitness = cumulative_fitness[:, -1:]
+    wheels = np.divide(cumulative_fitness, total_fitness, out=np.ones_like(cumulative_fitness), where=total_fitness > 0)
+    row_offsets = np.arange(len(wheels))[:, None]
+    picks = pointers.reshape(len(wheels), -1) + row_offsets
+    selected_idx = np.searchsorted((wheels + row_offsets).ravel(), picks.ravel(), side="right").reshape(picks.shape)
+    selected_idx -= row_offsets * population_size
+    return np.where(selected_idx < population_size, selected_idx, 0).reshape(pointers.shape)
+
+
+def select_parents_roulette(generator: np.random.Generator, fitness_values: np.ndarray, num_parents: int) -> np.ndarray:
+    # Roulette wheel implementation, the cumulative fitness is built once and every spin is a binary search
+    return spin_wheels(fitness_values, generator.random(fitness_values.shape[:-1] + (num_parents,)))
+
+
+def select_parents_sus(generator: np.random.Generator, fitness_values: np.ndarray, num_parents: int) -> np.ndarray:
+    # Stochastic universal sampling: a single spin of a wheel with num_parents evenly spaced pointers.
+    # The winners come out in population order, so they are shuffled before being paired for crossover.
+    start = generator.random(fitness_values.shape[:-1] + (1,))
+    selected_idx = spin_wheels(fitness_values, (start + np.arange(num_parents)) / num_parents)
+    return generator.permuted(selected_idx, axis=-1)
+
+
+def select_parents(
+    generator: np.random.Generator, fitness_values: np.ndarray, num_parents: int, mode: str = "tournament"
+) -> np.ndarray:
+    # Returns the indices of num_parents parents drawn from generator with the same distribution as the backends'
+    # select_parent. A 2D fitness_values array holds one population per row and parents are drawn independently for
+    # each row.
+    population_size = fitness_values.shape[-1]
+    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament", "sus"]:
+        min_tournament_size = max(int(population_size * 0.6), 1)
+        max_tournament_size = max(int(population_size * 0.8), 1)
+        return select_parents_tournament(
+            generator, fitness_values, num_parents, min_tournament_size, max_tournament_size
+        )
+    elif mode.lower() == "sus":
+        return select_parents_sus(generator, fitness_values, num_parents)
+    else:
+        return select_parents_roulette(generator, fitness_values, num_parents)
@@ -0,0 +1,106 @@
+import bisect
+import math
+import random
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional
+
+
+@lru_cache(maxsize=128)
+def get_tournament_rank_cdf(population_size: int, min_tournament_size: int, max_tournament_size: int) -> List[float]:
+    # Cumulative probability of a tournament winner being the r-th fittest individual. A tournament of k
+    # individuals drawn without replacement is won by rank r or worse with probability C(P - k, r) / C(P, r),
+    # and the sum over every k between min and max collapses to two terms with the hockey-stick identity.
+    def log_comb(n: int, k: int) -> float:
+        return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1) if k <= n else -math.inf
+
+    cdf = []
+    for rank in range(1, population_size + 1):
+        log_total = log_comb(population_size, rank)
+        survival = math.exp(log_comb(population_size - min_tournament_size + 1, rank + 1) - log_total) - math.exp(
+            log_comb(population_size - max_tournament_size, rank + 1) - log_total
+        )
+        cdf.append(1 - survival / (max_tournament_size - min_tournament_size + 1))
+    cdf[-1] = 1.0
+    return cdf
+
+
+def select_parents_tournament(
+    generator: random.Random,
+    fitness_values: List[float], num_parents: int, tournament_size: int, max_tournament_size: Optional[int] = None
+) -> List[int]:
+    # Returns the indices of num_parents tournament winners without playing the tournaments: the winner's fitness
+    # rank is drawn from its exact distribution. Tournament sizes are drawn uniformly between tournament_size and
+    # max_tournament_size.
+    population_size = len(fitness_values)
+    rank_cdf = get_tournament_rank_cdf(population_size, tournament_size, max_tournament_size or tournament_size)
+    ranking = sorted(range(population_size), key=fitness_values.__getitem__, reverse=True)
+
+    # Tied individuals share a fitness rank range, the winner is uniform among them
+    group_starts = [0] * population_size
+    group_ends = [population_size] * population_size
+    for position in range(1, population_size):
+        same_group = fitness_values[ranking[position]] == fitness_values[ranking[position - 1]]
+        group_starts[position] = group_starts[position - 1] if same_group else position
+    for position in range(population_size - 2, -1, -1):
+        same_group = fitness_values[ranking[position]] == fitness_values[ranking[position + 1]]
+        group_ends[position] = group_ends[position + 1] if same_group else position + 1
+
+    selected_idx = []
+    for _ in range(num_parents):
+        rank = min(bisect.bisect_right(rank_cdf, generator.random()), population_size - 1)
+        start = group_starts[rank]
+        selected_idx.append(ranking[start + int(generator.random() * (group_ends[rank] - start))])
+    return selected_idx
+
+
+def select_parents_roulette(generator: random.Random, fitness_values: List[float], num_parents: int) -> List[int]:
+    # Roulette wheel implementation, the cumulative fitness is built once and every spin is a binary search
+    cumulative_fitness = list(accumulate(fitness_values))
+    total_fitness = cumulative_fitness[-1] if cumulative_fitness else 0.0
+    population_size = len(fitness_values)
+    selected_idx = []
+    for _ in range(num_parents):
+        winner_idx = bisect.bisect_right(cumulative_fitness, generator.uniform(0, total_fitness))
+        selected_idx.append(winner_idx if winner_idx < population_size else 0)
+    return selected_idx
+
+
+def select_parents_sus(generator: random.Random, fitness_values: List[float], num_parents: int) -> List[int]:
+    # Stochastic universal sampling: a single spin of a wheel with num_parents evenly spaced pointers, walked in
+    # one linear pass. The winners come out in population order, so they are shuffled before being paired.
+    total_fitness = sum(fitness_values)
+    if total_fitness <= 0 or num_parents == 0:
+        return [0] * num_parents
+    step = total_fitness / num_parents
+    pointer = generator.uniform(0, step)
+    current = 0.0
+    last_winner_idx = 0
+    selected_idx: List[int] = []
+    for i, fitness_value in enumerate(fitness_values):
+        current += fitness_value
+        while pointer < current and len(selected_idx) < num_parents:
+            selected_idx.append(i)
+            pointer += step
+        if fitness_value > 0:
+            last_winner_idx = i
+    selected_idx.extend([last_winner_idx] * (num_parents - len(selected_idx)))  # Pointers lost to rounding
+    generator.shuffle(selected_idx)
+    return selected_idx
+
+
+def select_parents(
+    generator: random.Random, fitness_values: List[float], num_parents: int, mode: str = "tournament"
+) -> List[int]:
+    # Returns the indices of num_parents parents drawn from generator with the same distribution as the backends'
+    # select_parent
+    if mode.lower() == "tournament" or mode.lower() not in ["roulette", "tournament", "sus"]:
+        min_tournament_size = max(int(len(fitness_values) * 0.6), 1)
+        max_tournament_size = max(int(len(fitness_values) * 0.8), 1)
+        return select_parents_tournament(
+            generator, fitness_values, num_parents, min_tournament_size, max_tournament_size
+        )
+    elif mode.lower() == "sus":
+        return select_parents_sus(generator, fitness_values, num_parents)
+    else:
+        return select_parents_roulette(generator, fitness_values, num_parents)
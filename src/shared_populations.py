@@ -0,0 +1,56 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+SharedPopulationsHandle = Tuple[str, Tuple[int, int, int]]  # Name of the block and shape of the populations
+
+
+class SharedPopulations:
+    # One shared memory block holding a (slots, population, genome) array of int8 genes, one slot per run. The main
+    # process creates it and passes get_handle() to the workers, which attach to the same block by name and write the
+    # population of their run into its slot every generation. The main process reads any slot, even while the run is
+    # evolving, without the populations ever going through a pipe.
+    def __init__(self, num_slots: int, population_size: int, genome_length: int, name: Optional[str] = None) -> None:
+        self.shape: Tuple[int, int, int] = (num_slots, population_size, genome_length)
+        size = max(num_slots * population_size * genome_length, 1)
+        self.block = SharedMemory(name=name, create=name is None, size=size)
+        if self.block.buf is None:
+            raise RuntimeError(f"The shared block {self.block.name} could not be mapped.")
+        self.populations: np.ndarray = np.ndarray(self.shape, dtype=np.int8, buffer=self.block.buf)
+        if name is None:  # A new block is zeroed on every platform, slots of runs that never started stay empty
+            self.populations.fill(0)
+
+    @classmethod
+    def attach(cls, handle: SharedPopulationsHandle) -> "SharedPopulations":
+        name, (num_slots, population_size, genome_length) = handle
+        return cls(num_slots, population_size, genome_length, name)
+
+    def get_handle(self) -> SharedPopulationsHandle:
+        return self.block.name, self.shape
+
+    def get_population(self, slot: int) -> np.ndarray:
+        # A view of the live population, copy it to keep it after the run goes on
+        return self.populations[slot]
+
+    def get_best_genome(
+        self, slots: Iterable[int], fitness_function: Optional[Any] = None
+    ) -> Tuple[np.ndarray, float]:
+        # Fittest genome of the populations in the given slots, One Max unless a fitness function is given
+        genomes = self.populations[list(slots)].reshape(-1, self.shape[-1])
+        if fitness_function is None:
+            fitness_values = np.mean(genomes, axis=-1)
+        else:
+            fitness_values = np.asarray(fitness_function.evaluate(genomes), dtype=np.float64)
+        best_index = int(np.argmax(fitness_values))
+        return genomes[best_index].copy(), float(fitness_values[best_index])
+
+    def close(self) -> None:
+        # The block can only be unmapped once no array uses it, including the views handed out by get_population
+        self.populations = np.empty((0, 0, 0), dtype=np.int8)
+        self.block.close()
+
+    def unlink(self) -> None:
+        # Only the process that created the block frees it, after every worker is done with it
+        self.close()
+        self.block.unlink()
@@ -1,14 +1,110 @@
-from functools import wraps
+import json
+import math
+import sys
 import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, Iterator, List, TextIO
+
+
+class Histogram:
+    # Durations of every call of a scope. Buckets are powers of two of microseconds, so memory stays bounded however
+    # many calls are recorded.
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = 0.0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+        bucket = max(math.ceil(math.log2(duration * 1e6)), 0) if duration > 0 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def get_percentile(self, percentile: float) -> float:
+        # Upper bound of the bucket holding the percentile, capped by the slowest call
+        rank = percentile / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(2**bucket / 1e6, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.get_percentile(50),
+            "p90": self.get_percentile(90),
+            "p99": self.get_percentile(99),
+            "buckets_us": {f"<={2**bucket}": self.buckets[bucket] for bucket in sorted(self.buckets)},
+        }
+
+
+class MetricsRegistry:
+    # Records the duration of every timed scope into a histogram named after the path of the enclosing scopes, so a
+    # "combination" scope inside "main" is recorded as "main/combination"
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Histogram] = {}
+        self.scopes: List[str] = []
+
+    def record(self, name: str, duration: float) -> None:
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].add(duration)
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        self.scopes.append(name)
+        path = "/".join(self.scopes)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(path, time.perf_counter() - start_time)
+            self.scopes.pop()
+
+    def get_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+
+    def reset(self) -> None:
+        self.histograms = {}
+
+
+registry = MetricsRegistry()
 
 
 def timeit(func):
     @wraps(func)
     def timeit_wrapper(*args, **kwargs):
-        start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
+        with registry.scope(func.__name__):
+            start_time = time.perf_counter()
+            result = func(*args, **kwargs)
+            end_time = time.perf_counter()
         total_time = end_time - start_time
         print(f'Function {func.__name__} Took {total_time:.4f} seconds')
         return result
     return timeit_wrapper
+
+
+class EventLog:
+    # Writes one JSON object per line, to a file or to stdout when the path is "-"
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.stream: TextIO = sys.stdout if path == "-" else open(path, "a")
+
+    def emit(self, event: str, **fields: Any) -> None:
+        self.stream.write(json.dumps({"event": event, "timestamp": time.time(), **fields}) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.stream is not sys.stdout:
+            self.stream.close()
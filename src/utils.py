@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
 
 
 def generate_equally_spaced_values(min_val: float = 0.1, max_val: float = 1, length: int = 10, invert: bool = False) -> List[float]:
@@ -9,3 +11,9 @@ def generate_equally_spaced_values(min_val: float = 0.1, max_val: float = 1, len
     step = (max_val - min_val) / (length - 1) if length > 1 else 0
     values = [round(min_val + i * step, 4) for i in range(length)]
     return values
+
+
+def spawn_seeds(master_seed: int, count: int, spawn_key: Sequence[int] = ()) -> List[int]:
+    # Independent child seeds of master_seed, the same master seed and spawn key always yield the same seeds
+    seed_sequence = np.random.SeedSequence(master_seed, spawn_key=tuple(spawn_key))
+    return [int(child.generate_state(1, np.uint64)[0]) for child in seed_sequence.spawn(count)]
@@ -0,0 +1,72 @@
+import cProfile
+import os
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from shared_populations import SharedPopulations, SharedPopulationsHandle
+
+backend: Optional[ModuleType] = None
+shared_populations: Dict[str, SharedPopulations] = {}
+profiler: Optional[cProfile.Profile] = None
+profile_path: str = ""
+
+
+def init_worker(backend_name: str, profile_dir: Optional[str] = None) -> None:
+    # Runs once per worker process so the backend is already imported when the first task arrives
+    global backend, profiler, profile_path
+    backend = import_module(backend_name)
+    if profile_dir is not None:  # Every worker profiles its tasks into its own stats file
+        profiler = cProfile.Profile()
+        profile_path = os.path.join(profile_dir, f"worker_{os.getpid()}.prof")
+
+
+def get_backend() -> ModuleType:
+    if backend is None:
+        raise RuntimeError("The worker backend has not been initialized, call init_worker first.")
+    return backend
+
+
+def run_with_worker_id(task: Callable[..., Any], *args, **kwargs) -> Tuple[int, Any]:
+    # Tags the result of any task with the process id of the worker that ran it
+    if profiler is None:
+        return os.getpid(), task(*args, **kwargs)
+    # Workers are never told when the pool shuts down, so the stats are saved after every task
+    profiler.enable()
+    try:
+        result = task(*args, **kwargs)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+    return os.getpid(), result
+
+
+def get_shared_populations(handle: SharedPopulationsHandle) -> SharedPopulations:
+    # Workers attach to each shared block once and keep it mapped for the rest of the sweep
+    name = handle[0]
+    if name not in shared_populations:
+        shared_populations[name] = SharedPopulations.attach(handle)
+    return shared_populations[name]
+
+
+def run_in_shared_slot(
+    task: Callable[..., Any], handle: SharedPopulationsHandle, slot: int, *args, **kwargs
+) -> Any:
+    # The run writes its population into its slot of the shared block every generation, only the result of the task
+    # comes back through the pipe
+    return task(*args, population_out=get_shared_populations(handle).get_population(slot), **kwargs)
+
+
+def run_genetic_algorithm(*args, **kwargs) -> List[Tuple[int, float, float]]:
+    return [get_backend().genetic_algorithm(*args, **kwargs)]
+
+
+def run_genetic_algorithm_instrumented(*args, **kwargs) -> List[Tuple[Tuple[int, float, float], Dict[str, Any]]]:
+    # Returns the phase counters and fitness history of the run alongside its result
+    instrumentation: Dict[str, Any] = {}
+    result = get_backend().genetic_algorithm(*args, instrumentation=instrumentation, **kwargs)
+    return [(result, instrumentation)]
+
+
+def run_genetic_algorithm_batch(run_times: int, *args, **kwargs) -> List[Tuple[int, float, float]]:
+    return get_backend().genetic_algorithm_batch(run_times, *args, **kwargs)
@@ -0,0 +1,77 @@
+import unittest
+
+import src.one_max_genetic_algorithm_numpy as numpy_backend
+import src.one_max_genetic_algorithm_vanilla as vanilla_backend
+from src.benchmark import compare_results, get_macro_benchmarks, get_micro_benchmarks, run_benchmarks, summarize
+
+
+def get_results(**medians):
+    return {"benchmarks": {name: {"median": median, "iqr": 0.0} for name, median in medians.items()}}
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_summarize(self):
+        stats = summarize([1.0, 2.0, 3.0, 4.0, 5.0], number=10)
+        self.assertEqual(stats["median"], 3.0)
+        self.assertEqual(stats["min"], 1.0)
+        self.assertEqual(stats["max"], 5.0)
+        self.assertEqual(stats["iqr"], stats["q3"] - stats["q1"])
+        self.assertGreater(stats["iqr"], 0)
+        self.assertEqual(stats["number"], 10)
+
+    def test_summarize_single_repeat(self):
+        stats = summarize([2.0], number=1)
+        self.assertEqual(stats["median"], 2.0)
+        self.assertEqual(stats["iqr"], 0.0)
+
+    def test_micro_benchmarks_run_on_both_backends(self):
+        for backend in [numpy_backend, vanilla_backend]:
+            benchmarks = get_micro_benchmarks(backend, population_size=10, genome_length=8)
+            self.assertIn("select_parent_tournament", benchmarks)
+            self.assertIn("select_parent_roulette", benchmarks)
+            for func in benchmarks.values():
+                func()
+
+    def test_macro_benchmarks_cover_the_grid(self):
+        benchmarks = get_macro_benchmarks(vanilla_backend, [10, 20], [8, 16, 32], generations=2)
+        self.assertEqual(len(benchmarks), 6)
+        generation, _, _ = next(iter(benchmarks.values()))()
+        self.assertEqual(generation, 2)
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(
+            ["src.one_max_genetic_algorithm_vanilla"],
+            ["micro", "macro"],
+            micro_population_size=10,
+            micro_genome_length=8,
+            micro_repeats=2,
+            macro_population_sizes=[10],
+            macro_genome_lengths=[8],
+            macro_generations=2,
+            macro_repeats=2,
+            min_time=0.0,
+        )
+        self.assertIn("vanilla/python/micro/crossover", results["benchmarks"])
+        macro_name = "vanilla/python/macro/genetic_algorithm[population_size=10,genome_length=8]"
+        self.assertIn(macro_name, results["benchmarks"])
+        self.assertEqual(len(results["benchmarks"]), 8)
+        self.assertIn("python", results["metadata"])
+
+    def test_compare_results(self):
+        baseline = get_results(slower=1.0, faster=1.0, same=1.0, removed=1.0)
+        current = get_results(slower=1.5, faster=0.5, same=1.05, added=1.0)
+        statuses = {name: status for name, _, _, status in compare_results(baseline, current, threshold=0.1)}
+        self.assertEqual(
+            statuses,
+            {"slower": "regression", "faster": "improvement", "same": "ok", "removed": "missing", "added": "new"},
+        )
+
+    def test_compare_results_tolerates_noise(self):
+        baseline = get_results(noisy=1.0)
+        current = get_results(noisy=1.3)
+        current["benchmarks"]["noisy"]["iqr"] = 0.25
+        self.assertEqual(compare_results(baseline, current, threshold=0.1)[0][3], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
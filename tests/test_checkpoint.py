@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from src.checkpoint import clear_checkpoints, load_sweep_checkpoint, save_sweep_checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_dir = os.path.join(self.directory.name, "checkpoints")
+        self.path = os.path.join(self.checkpoint_dir, "sweep.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        state = {"completed": {"0": [[12, 0.99, 1.0]]}, "best": {"mutation_rate": 0.01, "score": 0.9}}
+        save_sweep_checkpoint(state, self.path)
+        self.assertEqual(load_sweep_checkpoint(self.path), state)
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_save_overwrites_previous_checkpoint(self):
+        save_sweep_checkpoint({"completed": {}}, self.path)
+        save_sweep_checkpoint({"completed": {"0": []}}, self.path)
+        self.assertEqual(load_sweep_checkpoint(self.path), {"completed": {"0": []}})
+
+    def test_load_missing_checkpoint(self):
+        with self.assertRaises(FileNotFoundError):
+            load_sweep_checkpoint(self.path)
+
+    def test_clear_checkpoints(self):
+        save_sweep_checkpoint({}, self.path)
+        clear_checkpoints(self.checkpoint_dir)
+        self.assertFalse(os.path.exists(self.checkpoint_dir))
+        clear_checkpoints(self.checkpoint_dir)  # Clearing twice is harmless
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import itertools
+import pickle
+import unittest
+
+import numpy as np
+
+from src.fitness_functions import (
+    FITNESS_FUNCTIONS,
+    CachedFitnessFunction,
+    DeceptiveTrap,
+    Knapsack,
+    NKLandscape,
+    OneMax,
+    get_fitness_function,
+)
+
+
+class CountingOneMax(OneMax):
+    def __init__(self):
+        super().__init__()
+        self.evaluated = 0
+
+    def evaluate(self, population):
+        self.evaluated += len(population)
+        return super().evaluate(population)
+
+
+def get_all_genomes(genome_length):
+    return np.array(list(itertools.product([0, 1], repeat=genome_length)), dtype=np.int8)
+
+
+class TestFitnessFunctions(unittest.TestCase):
+    def test_one_max(self):
+        population = np.array([[0, 0, 0, 0], [1, 0, 1, 0], [1, 1, 1, 1]], dtype=np.int8)
+        np.testing.assert_array_equal(OneMax().evaluate(population), [0.0, 0.5, 1.0])
+        self.assertEqual(list(OneMax().evaluate([[1, 1], [0, 1]])), [1.0, 0.5])
+
+    def test_deceptive_trap(self):
+        trap = DeceptiveTrap(8, block_size=4)
+        population = np.array([[1] * 8, [0] * 8, [1, 1, 1, 0, 0, 0, 0, 0], [1, 1, 1, 1, 0, 0, 0, 1]])
+        np.testing.assert_array_equal(trap.evaluate(population), [1.0, 0.75, 3 / 8, 6 / 8])
+        self.assertEqual(trap.evaluate(get_all_genomes(8)).max(), trap.target)
+
+    def test_deceptive_trap_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            DeceptiveTrap(10, block_size=4)
+
+    def test_nk_landscape_optimum(self):
+        # The dynamic programming optimum matches an exhaustive search and scores exactly the target
+        for genome_length, k in [(6, 0), (8, 2), (10, 4), (7, 6)]:
+            nk = NKLandscape(genome_length, k, seed=genome_length + k)
+            all_genomes = get_all_genomes(genome_length)
+            self.assertEqual(nk.get_contributions(all_genomes).max(), nk.optimum)
+            fitness_values = nk.evaluate(all_genomes)
+            self.assertEqual(fitness_values.max(), nk.target)
+            self.assertTrue(np.all(fitness_values >= 0))
+
+    def test_nk_landscape_contributions(self):
+        nk = NKLandscape(5, k=2, seed=1)
+        genome = [1, 0, 1, 1, 0]
+        # Windows of bits 1 0 1, 0 1 1, 1 1 0 and the zero padded 1 0 0 and 0 0 0
+        expected = sum(nk.tables[locus, window] for locus, window in enumerate([0b101, 0b011, 0b110, 0b100, 0b000]))
+        self.assertEqual(nk.get_contributions([genome])[0], expected)
+
+    def test_nk_landscape_invalid_k(self):
+        with self.assertRaises(ValueError):
+            NKLandscape(5, k=5)
+
+    def test_knapsack_optimum(self):
+        for seed in range(5):
+            knapsack = Knapsack(12, seed=seed)
+            all_genomes = get_all_genomes(12)
+            fits = all_genomes @ knapsack.weights <= knapsack.capacity
+            self.assertEqual((all_genomes @ knapsack.values)[fits].max(), knapsack.optimum)
+            fitness_values = knapsack.evaluate(all_genomes)
+            self.assertEqual(fitness_values.max(), knapsack.target)
+            # Overweight genomes never score above the best subset that fits
+            self.assertLessEqual(fitness_values[~fits].max(), 1.0)
+
+    def test_evaluate_batched_populations(self):
+        populations = np.random.default_rng(0).integers(0, 2, size=(3, 4, 20), dtype=np.int8)
+        for name in FITNESS_FUNCTIONS[1:]:
+            fitness_function = get_fitness_function(name, 20, seed=0)
+            batched = fitness_function.evaluate(populations)
+            self.assertEqual(batched.shape, (3, 4))
+            np.testing.assert_array_equal(batched[1], fitness_function.evaluate(populations[1]))
+
+    def test_get_fitness_function(self):
+        self.assertIsNone(get_fitness_function("onemax", 20))
+        self.assertIsInstance(get_fitness_function("trap", 20), DeceptiveTrap)
+        self.assertEqual(get_fitness_function("nk", 20, seed=3).name, NKLandscape(20, 3, seed=3).name)
+        self.assertIsInstance(get_fitness_function("knapsack", 20), Knapsack)
+        with self.assertRaises(ValueError):
+            get_fitness_function("rastrigin", 20)
+
+    def test_cached_fitness_function(self):
+        one_max = CountingOneMax()
+        cached = CachedFitnessFunction(one_max, maxsize=10)
+        population = np.array([[1, 0, 1, 1], [1, 0, 1, 1], [0, 0, 0, 0]], dtype=np.int8)
+        np.testing.assert_array_equal(cached.evaluate(population), [0.75, 0.75, 0.0])
+        # The clone in the population is evaluated once, and nothing is evaluated the second time
+        self.assertEqual(one_max.evaluated, 2)
+        np.testing.assert_array_equal(cached.evaluate(population), [0.75, 0.75, 0.0])
+        self.assertEqual(one_max.evaluated, 2)
+        self.assertEqual(cached.stats, {"hits": 4, "misses": 2, "evictions": 0})
+        self.assertAlmostEqual(cached.get_hit_rate(), 4 / 6)
+        self.assertEqual((cached.name, cached.target), (one_max.name, one_max.target))
+
+    def test_cached_fitness_function_evicts_least_recently_used(self):
+        one_max = CountingOneMax()
+        cached = CachedFitnessFunction(one_max, maxsize=2)
+        cached.evaluate([[0, 0], [0, 1]])
+        cached.evaluate([[0, 0]])  # Now the genome 0 1 is the least recently used
+        cached.evaluate([[1, 1]])
+        self.assertEqual(cached.stats["evictions"], 1)
+        cached.evaluate([[0, 0], [1, 1]])
+        self.assertEqual(one_max.evaluated, 3)
+        cached.evaluate([[0, 1]])
+        self.assertEqual(one_max.evaluated, 4)
+
+    def test_cached_fitness_function_matches_wrapped(self):
+        knapsack = Knapsack(30, seed=1)
+        cached = CachedFitnessFunction(knapsack, maxsize=50)
+        for seed in range(5):
+            population = np.random.default_rng(seed).integers(0, 2, size=(40, 30), dtype=np.int8)
+            population[20:] = population[:20]
+            np.testing.assert_array_equal(cached.evaluate(population), knapsack.evaluate(population))
+        self.assertGreater(cached.stats["evictions"], 0)
+        self.assertLessEqual(len(cached.cache), 50)
+
+    def test_cached_fitness_function_pickle(self):
+        # Cached fitness functions are pickled to the worker processes along with their cache and stats
+        cached = get_fitness_function("nk", 20, seed=3, cache_size=100)
+        population = np.random.default_rng(0).integers(0, 2, size=(10, 20), dtype=np.int8)
+        expected = cached.evaluate(population)
+        unpickled = pickle.loads(pickle.dumps(cached))
+        self.assertIsInstance(unpickled, CachedFitnessFunction)
+        self.assertEqual((unpickled.name, unpickled.target, unpickled.maxsize), (cached.name, cached.target, 100))
+        self.assertEqual(unpickled.cache, cached.cache)
+        self.assertEqual(unpickled.stats, cached.stats)
+        np.testing.assert_array_equal(unpickled.evaluate(population), expected)
+        self.assertEqual(unpickled.stats["hits"], cached.stats["hits"] + len(population))
+        np.testing.assert_array_equal(unpickled.fitness_function.evaluate(population), expected)
+
+    def test_cached_fitness_function_invalid_size(self):
+        with self.assertRaises(ValueError):
+            CachedFitnessFunction(OneMax(), maxsize=0)
+
+    def test_get_fitness_function_cached(self):
+        self.assertIsInstance(get_fitness_function("onemax", 20, cache_size=100), CachedFitnessFunction)
+        cached = get_fitness_function("nk", 20, seed=3, cache_size=100)
+        self.assertIsInstance(cached.fitness_function, NKLandscape)
+        self.assertEqual(cached.maxsize, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from src.instrumentation import PHASES, Instrumentation, add_phase_time, get_phase_counters
+
+
+def get_run(phase_time, best_fitness, mean_fitness):
+    return {
+        "phases": {"selection": [phase_time, 2], "fitness": [phase_time * 3, 2]},
+        "best_fitness": best_fitness,
+        "mean_fitness": mean_fitness,
+    }
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_add_phase_time(self):
+        phase_counters = get_phase_counters()
+        self.assertEqual(list(phase_counters), list(PHASES))
+        now = add_phase_time(phase_counters, "mutation", 0)
+        self.assertEqual(phase_counters["mutation"], [now, 1])
+        self.assertEqual(add_phase_time(phase_counters, "mutation", now) - now, phase_counters["mutation"][0] - now)
+        self.assertEqual(phase_counters["mutation"][1], 2)
+        self.assertEqual(phase_counters["selection"], [0, 0])
+
+    def test_add_run_sums_phases(self):
+        instrumentation = Instrumentation()
+        instrumentation.add_run(get_run(100, [0.5], [0.25]))
+        instrumentation.add_run(get_run(300, [0.5], [0.25]))
+        self.assertEqual(instrumentation.runs, 2)
+        self.assertEqual(instrumentation.phase_times, {"selection": 400, "fitness": 1200})
+        self.assertEqual(instrumentation.phase_calls, {"selection": 4, "fitness": 4})
+        self.assertEqual(instrumentation.get_total_time(), 1600)
+
+    def test_fitness_curves_average_runs_reaching_each_generation(self):
+        instrumentation = Instrumentation()
+        instrumentation.add_run(get_run(1, [0.5, 1.0], [0.2, 0.6]))
+        instrumentation.add_run(get_run(1, [0.7], [0.4]))
+        self.assertEqual(instrumentation.get_best_fitness_curve(), [0.6, 1.0])
+        self.assertEqual(instrumentation.get_mean_fitness_curve(), [0.30000000000000004, 0.6])
+        self.assertEqual(instrumentation.generation_runs, [2, 1])
+
+    def test_repr(self):
+        instrumentation = Instrumentation()
+        instrumentation.add_run(get_run(1000, [0.5] * 25, [0.25] * 25))
+        text = repr(instrumentation)
+        self.assertIn("selection", text)
+        self.assertIn("25.0%", text)
+        self.assertIn("75.0%", text)
+
+    def test_fitness_cache(self):
+        instrumentation = Instrumentation()
+        for hits, misses in [(30, 10), (50, 10)]:
+            run = get_run(1, [0.5], [0.25])
+            run["fitness_cache"] = {"hits": hits, "misses": misses, "evictions": 1}
+            instrumentation.add_run(run)
+        self.assertEqual(instrumentation.fitness_cache, {"hits": 80, "misses": 20, "evictions": 2})
+        self.assertEqual(instrumentation.get_fitness_cache_hit_rate(), 0.8)
+        self.assertIn("80.0% hit rate", repr(instrumentation))
+
+    def test_repr_empty(self):
+        self.assertIn("Instrumented runs: 0", repr(Instrumentation()))
+
+
+if __name__ == "__main__":
+    unittest.main()
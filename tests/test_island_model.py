@@ -0,0 +1,143 @@
+import multiprocessing
+import unittest
+
+from src.fitness_functions import Knapsack
+from src.island_model import (
+    IslandResult,
+    get_migration_size,
+    get_neighbors,
+    get_ranking,
+    island_genetic_algorithm,
+    receive_migrants,
+    run_island,
+)
+
+
+class FailingFitnessFunction:
+    name = "failing"
+    target = 1.0
+
+    def evaluate(self, population):
+        raise ValueError("The fitness function failed.")
+
+
+class TestIslandModel(unittest.TestCase):
+    def test_get_neighbors_ring(self):
+        self.assertEqual([get_neighbors(island, 4, "ring") for island in range(4)], [[1], [2], [3], [0]])
+
+    def test_get_neighbors_full(self):
+        self.assertEqual(get_neighbors(1, 4, "full"), [0, 2, 3])
+
+    def test_get_neighbors_single_island(self):
+        self.assertEqual(get_neighbors(0, 1, "full"), [])
+
+    def test_get_neighbors_unknown_topology(self):
+        with self.assertRaises(ValueError):
+            get_neighbors(0, 4, "star")
+
+    def test_get_migration_size(self):
+        self.assertEqual(get_migration_size(50, 0.1), 5)
+        self.assertEqual(get_migration_size(50, 0.0), 1)
+        self.assertEqual(get_migration_size(50, 1.0), 49)
+
+    def test_get_ranking(self):
+        self.assertEqual(get_ranking([0.2, 0.9, 0.5]), [1, 2, 0])
+
+    def test_receive_migrants_keeps_later_epochs(self):
+        inbox = multiprocessing.Queue()
+        stop_event = multiprocessing.Event()
+        pending_migrants = {}
+        inbox.put((2, 0, ["fast epoch 2"], [0.9]))
+        inbox.put((1, 1, ["slow epoch 1"], [0.5]))
+        inbox.put((1, 0, ["fast epoch 1"], [0.8]))
+        received = receive_migrants(inbox, pending_migrants, 1, 2, stop_event)
+        self.assertEqual(sorted(migrants[0] for migrants, _ in received), ["fast epoch 1", "slow epoch 1"])
+        self.assertEqual(pending_migrants, {2: [(["fast epoch 2"], [0.9])]})
+
+    def test_receive_migrants_stops(self):
+        stop_event = multiprocessing.Event()
+        stop_event.set()
+        self.assertIsNone(receive_migrants(multiprocessing.Queue(), {}, 1, 1, stop_event))
+
+    def test_island_genetic_algorithm(self):
+        for backend_name, vectorized in [
+            ("src.one_max_genetic_algorithm_numpy", True),
+            ("src.one_max_genetic_algorithm_vanilla", False),
+        ]:
+            for topology in ["ring", "full"]:
+                results = island_genetic_algorithm(
+                    backend_name,
+                    num_islands=3,
+                    population_size=20,
+                    genome_length=30,
+                    max_generations=300,
+                    mutation_rate=0.01,
+                    target_generation_fitness=0.95,
+                    migration_interval=5,
+                    topology=topology,
+                    vectorized=vectorized,
+                )
+                self.assertEqual(len(results), 3)
+                # The first island to reach the target stops the others
+                self.assertTrue(any(result.best_fitness == 1.0 for result in results))
+                for generation, generation_fitness, best_fitness, _ in results:
+                    self.assertLessEqual(generation, 300)
+                    self.assertLessEqual(generation_fitness, best_fitness + 1e-12)
+
+    def test_island_genetic_algorithm_fitness_function(self):
+        results = island_genetic_algorithm(
+            "src.one_max_genetic_algorithm_numpy",
+            num_islands=2,
+            population_size=20,
+            genome_length=20,
+            max_generations=300,
+            target_generation_fitness=0.5,
+            migration_interval=5,
+            vectorized=True,
+            fitness_function=Knapsack(20, seed=0),
+            seeds=[1, 2],
+        )
+        self.assertEqual(len(results), 2)
+        for _, generation_fitness, best_fitness, _ in results:
+            # The mean of a population of ties can round 1 ulp above its max
+            self.assertLessEqual(generation_fitness, best_fitness + 1e-12)
+            self.assertLessEqual(best_fitness, 1.0)
+
+    def test_island_genetic_algorithm_seeds(self):
+        # Without a reachable target every island runs every generation, so seeded runs are reproducible
+        params = ("src.one_max_genetic_algorithm_vanilla", 3, 10, 20, 20, 0.01, 0.7, "tournament", 1.1, 4)
+        results = island_genetic_algorithm(*params, seeds=[1, 2, 3])
+        self.assertEqual(island_genetic_algorithm(*params, seeds=[1, 2, 3]), results)
+        self.assertEqual([(generation, stopped) for generation, _, _, stopped in results], [(20, False)] * 3)
+
+    def test_island_genetic_algorithm_failed_island(self):
+        # The island processes crash on their first evaluation, which raises instead of waiting for their results
+        with self.assertRaises(RuntimeError):
+            island_genetic_algorithm(
+                "src.one_max_genetic_algorithm_vanilla", 2, 10, 10, 20, fitness_function=FailingFitnessFunction()
+            )
+
+    def test_run_island_stopped(self):
+        # An island stopped before its first generation completed none
+        result_queue = multiprocessing.Queue()
+        stop_event = multiprocessing.Event()
+        stop_event.set()
+        params = (10, 10, 20, 0.01, 0.7, "tournament", 0.9, 5, 0.1)
+        run_island("src.one_max_genetic_algorithm_vanilla", 0, [], [], 0, result_queue, stop_event, *params)
+        self.assertEqual(result_queue.get(timeout=5), (0, IslandResult(0, 0.0, 0.0, stopped=True)))
+
+    def test_island_genetic_algorithm_single_island(self):
+        results = island_genetic_algorithm(
+            "src.one_max_genetic_algorithm_vanilla", 1, 10, 10, 20, target_generation_fitness=1.1
+        )
+        self.assertEqual(len(results), 1)
+
+    def test_island_genetic_algorithm_invalid(self):
+        with self.assertRaises(ValueError):
+            island_genetic_algorithm("src.one_max_genetic_algorithm_vanilla", num_islands=0)
+        with self.assertRaises(ValueError):
+            island_genetic_algorithm("src.one_max_genetic_algorithm_vanilla", migration_interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
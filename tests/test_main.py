@@ -0,0 +1,174 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import src.main as main_module
+from src.checkpoint import SWEEP_CHECKPOINT_PATH, load_sweep_checkpoint
+from src.main import (
+    create_sweep_checkpoint,
+    get_known_runs,
+    get_sweep_settings,
+    load_resumable_sweep,
+    main,
+    process_genetic_algorithm,
+    record_combination,
+)
+from src.result_cache import ResultCache, RunConfig
+
+MUTATION_RATE_VALUES = [0.05, 0.02]
+CROSSOVER_RATE_VALUES = [0.3, 0.6, 0.9]
+
+
+class SweepInterrupted(Exception):
+    pass
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        # Small sweeps, with the checkpoints written to a directory of their own
+        self.directory = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        constants = {"RUN_TIMES": 3, "POPULATION_SIZE": 10, "GENOME_LENGTH": 8, "CHECKPOINT_INTERVAL": 5}
+        for name, value in constants.items():
+            patcher = mock.patch.object(main_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def run_sweep(self, *args, **kwargs):
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            return process_genetic_algorithm(MUTATION_RATE_VALUES, CROSSOVER_RATE_VALUES, *args, **kwargs)
+
+    def get_settings(self):
+        return get_sweep_settings(MUTATION_RATE_VALUES, CROSSOVER_RATE_VALUES)
+
+    def run_recorded_sweep(self, *args, **kwargs):
+        # Also returns the combination index, first run and number of runs of every non empty submission
+        submissions = []
+        submit_combination = main_module.submit_combination
+
+        def record_submission(*submit_args, **submit_kwargs):
+            if submit_kwargs["run_times"] > 0:
+                submissions.append((submit_args[5], submit_kwargs["first_run"], submit_kwargs["run_times"]))
+            return submit_combination(*submit_args, **submit_kwargs)
+
+        with mock.patch.object(main_module, "submit_combination", record_submission):
+            return self.run_sweep(*args, **kwargs), submissions
+
+    def assertSameSweep(self, sweep, expected_sweep):
+        # Same best rates and the same runs for them
+        self.assertEqual(sweep[:2], expected_sweep[:2])
+        for attribute in ["generations", "generation_fitnesses", "best_fitnesses"]:
+            self.assertEqual(getattr(sweep[2], attribute), getattr(expected_sweep[2], attribute))
+
+    def test_main_buffered_vanilla(self):
+        # Only the NumPy version evolves inside population buffers
+        with self.assertRaises(ValueError):
+            main(False, buffered=True)
+
+    def test_sweep_batched_incremental(self):
+        # Batched runs evaluate whole populations, so the sweep is neither announced nor cached as incremental
+        result_cache = ResultCache(":memory:")
+        with redirect_stdout(io.StringIO()) as output, redirect_stderr(io.StringIO()):
+            process_genetic_algorithm(
+                MUTATION_RATE_VALUES, CROSSOVER_RATE_VALUES, batched=True, incremental=True, result_cache=result_cache
+            )
+        self.assertIn("Running vanilla batched version.", output.getvalue())
+        backends = result_cache.connection.execute("SELECT DISTINCT backend FROM runs").fetchall()
+        self.assertEqual(backends, [("one_max_genetic_algorithm_vanilla+batched",)])
+        result_cache.close()
+
+    def test_get_known_runs(self):
+        config = RunConfig("backend", 10, 8, 400, 0.05, 0.3, "tournament", 0.998, 1)
+        result_cache = ResultCache(":memory:")
+        result_cache.add_runs(config, [(4, 0.5, 1.0)], first_run_index=0)
+        sweep_checkpoint = create_sweep_checkpoint(self.get_settings(), {})
+        sweep_checkpoint["completed"]["1"] = [[2, 0.75, 1.0]]
+        self.assertEqual(get_known_runs(0, config), [])
+        self.assertEqual(get_known_runs(0, config, sweep_checkpoint, result_cache), [(4, 0.5, 1.0)])
+        self.assertEqual(get_known_runs(1, config, sweep_checkpoint, result_cache), [(2, 0.75, 1.0)])
+        result_cache.close()
+
+    def test_record_combination(self):
+        sweep_checkpoint = create_sweep_checkpoint(self.get_settings(), {"seed": 1})
+        record_combination(sweep_checkpoint, 2, [(4, 0.5, 1.0)], 0.05, 0.9, 0.75)
+        self.assertEqual(load_resumable_sweep(self.get_settings()), load_sweep_checkpoint(SWEEP_CHECKPOINT_PATH))
+        self.assertEqual(load_sweep_checkpoint(SWEEP_CHECKPOINT_PATH)["completed"], {"2": [[4, 0.5, 1.0]]})
+        with self.assertRaises(ValueError):
+            load_resumable_sweep(get_sweep_settings(MUTATION_RATE_VALUES, [0.3]))
+
+    def test_resume_interrupted_sweep(self):
+        # A sweep stopped after its second combination and resumed ends exactly like one that never stopped
+        expected_sweep = self.run_sweep(master_seed=1)
+        saves = []
+        save_sweep_checkpoint = main_module.save_sweep_checkpoint
+
+        def save_and_interrupt(sweep_checkpoint):
+            save_sweep_checkpoint(sweep_checkpoint)
+            saves.append(sweep_checkpoint)
+            if len(saves) == 2:
+                raise SweepInterrupted()
+
+        with mock.patch.object(main_module, "save_sweep_checkpoint", save_and_interrupt):
+            with self.assertRaises(SweepInterrupted):
+                self.run_sweep(master_seed=1, sweep_checkpoint=create_sweep_checkpoint(self.get_settings(), {}))
+        self.assertEqual(sorted(load_resumable_sweep(self.get_settings())["completed"]), ["0", "1"])
+
+        sweep, submissions = self.run_recorded_sweep(
+            master_seed=1, sweep_checkpoint=load_resumable_sweep(self.get_settings())
+        )
+        self.assertSameSweep(sweep, expected_sweep)
+        self.assertTrue(all(combination_index >= 2 for combination_index, _, _ in submissions))
+        self.assertFalse(os.path.exists(SWEEP_CHECKPOINT_PATH))  # Cleared once the sweep is done
+
+    def prime_cache(self, result_cache, run_times):
+        # Caches the first run_times runs of every combination the sweep computes
+        with mock.patch.object(main_module, "RUN_TIMES", run_times):
+            self.run_sweep(master_seed=1, result_cache=result_cache)
+
+    def test_sweep_partially_cached(self):
+        # Only the runs missing from the cache are computed, and merged after the cached ones in run order
+        expected_sweep, expected_submissions = self.run_recorded_sweep(master_seed=1)
+        result_cache = ResultCache(":memory:")
+        self.prime_cache(result_cache, 1)
+        sweep, submissions = self.run_recorded_sweep(master_seed=1, result_cache=result_cache)
+        self.assertSameSweep(sweep, expected_sweep)
+        self.assertEqual(
+            submissions, [(combination_index, 1, 2) for combination_index, _, _ in expected_submissions]
+        )
+
+        # Every run is cached now
+        sweep, submissions = self.run_recorded_sweep(master_seed=1, result_cache=result_cache)
+        self.assertSameSweep(sweep, expected_sweep)
+        self.assertEqual(submissions, [])
+        result_cache.close()
+
+    def test_resume_sweep_partially_cached(self):
+        # Combinations completed before the sweep stopped come from the checkpoint, the others from the cache first
+        expected_sweep, expected_submissions = self.run_recorded_sweep(master_seed=1)
+        result_cache = ResultCache(":memory:")
+        self.prime_cache(result_cache, 1)
+        sweep_checkpoint = create_sweep_checkpoint(self.get_settings(), {})
+        self.run_sweep(master_seed=1, sweep_checkpoint=sweep_checkpoint)
+        for combination_index in list(sweep_checkpoint["completed"])[2:]:
+            del sweep_checkpoint["completed"][combination_index]
+        sweep, submissions = self.run_recorded_sweep(
+            master_seed=1, result_cache=result_cache, sweep_checkpoint=sweep_checkpoint
+        )
+        self.assertSameSweep(sweep, expected_sweep)
+        self.assertEqual(
+            submissions,
+            [(combination_index, 1, 2) for combination_index, _, _ in expected_submissions if combination_index >= 2],
+        )
+        result_cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
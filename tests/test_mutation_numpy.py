@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from src.mutation_numpy import DENSE_MASK_MAX_GENES, sample_flip_positions
+
+
+class TestMutationNumpy(unittest.TestCase):
+    def setUp(self):
+        self.generator = np.random.default_rng(seed=0)
+
+    def test_sample_flip_positions_rates(self):
+        self.assertEqual(len(sample_flip_positions(self.generator, 100, 0.0)), 0)
+        self.assertEqual(len(sample_flip_positions(self.generator, 0, 0.5)), 0)
+        np.testing.assert_equal(sample_flip_positions(self.generator, 5, 1.0), np.arange(5))
+
+    def test_sample_flip_positions_short_genome(self):
+        # Drawn with one number per gene
+        flips = np.zeros(35, dtype=np.int64)
+        for _ in range(10_000):
+            positions = sample_flip_positions(self.generator, 35, 0.1)
+            self.assertTrue(np.all(np.diff(positions) > 0))
+            flips[positions] += 1
+        self.assertTrue(np.all((900 <= flips) & (flips <= 1100)))
+
+    def test_sample_flip_positions_long_genome(self):
+        # Drawn with the geometric gaps between flips
+        total_genes = 100 * DENSE_MASK_MAX_GENES
+        positions = sample_flip_positions(self.generator, total_genes, 0.01)
+        self.assertTrue(np.all(np.diff(positions) > 0))
+        self.assertTrue(np.all((0 <= positions) & (positions < total_genes)))
+        self.assertTrue(0.009 * total_genes <= len(positions) <= 0.011 * total_genes)
+
+    def test_sample_flip_positions_seeded(self):
+        positions = sample_flip_positions(np.random.default_rng(seed=1), 35, 0.2)
+        np.testing.assert_equal(sample_flip_positions(np.random.default_rng(seed=1), 35, 0.2), positions)
+
+
+if __name__ == "__main__":
+    unittest.main()
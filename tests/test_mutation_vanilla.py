@@ -0,0 +1,28 @@
+import random
+import unittest
+
+from src.mutation_vanilla import sample_flip_positions
+
+
+class TestMutationVanilla(unittest.TestCase):
+    def setUp(self):
+        self.generator = random.Random(0)
+
+    def test_sample_flip_positions_rates(self):
+        self.assertEqual(sample_flip_positions(self.generator, 10, 0.0), [])
+        self.assertEqual(sample_flip_positions(self.generator, 5, 1.0), [0, 1, 2, 3, 4])
+        self.assertEqual(sample_flip_positions(self.generator, 0, 0.5), [])
+
+    def test_sample_flip_positions_sorted_and_in_range(self):
+        positions = sample_flip_positions(self.generator, 100_000, 0.01)
+        self.assertEqual(positions, sorted(set(positions)))
+        self.assertTrue(all(0 <= position < 100_000 for position in positions))
+        self.assertTrue(800 <= len(positions) <= 1200)
+
+    def test_sample_flip_positions_seeded(self):
+        positions = sample_flip_positions(random.Random(1), 35, 0.2)
+        self.assertEqual(sample_flip_positions(random.Random(1), 35, 0.2), positions)
+
+
+if __name__ == "__main__":
+    unittest.main()
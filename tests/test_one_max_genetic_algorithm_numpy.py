@@ -1,25 +1,48 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 import numpy as np
 
+from src.fitness_functions import CachedFitnessFunction
 from src.one_max_genetic_algorithm_numpy import (
     calculate_population_fitnesses,
     create_new_population,
+    create_new_population_buffered,
+    create_new_population_incremental,
+    create_new_population_vectorized,
     crossover,
     genetic_algorithm,
+    genetic_algorithm_batch,
+    genetic_algorithm_stream,
+    get_population_buffers,
     get_best_fitness,
     get_generation_fitness,
     get_genome_fitness,
     get_target_fitness,
     init_population,
+    load_checkpoint,
     mutate,
+    mutate_population,
     random_genome,
+    save_checkpoint,
     select_parent,
     select_parent_roulette,
+    select_parent_sus,
     select_parent_tournament,
 )
 
 
+class ZeroMax:
+    # Any object with a name, a target and an evaluate method over the whole population is a fitness function
+    name = "zeromax"
+    target = 1.0
+
+    def evaluate(self, population):
+        return [1 - sum(genome) / len(genome) for genome in population]
+
+
 class TestUnitGeneticAlgorithm(unittest.TestCase):
 
     def test_random_genome_length(self):
@@ -177,6 +200,12 @@ class TestUnitGeneticAlgorithm(unittest.TestCase):
         selected_individual = select_parent_roulette(population, fitness_values)
         self.assertIn(selected_individual, population)  # Ensure the selected individual is from the population
 
+    def test_select_parent_sus(self):
+        population = np.array([[1, 1, 1, 1], [1, 0, 1, 0], [0, 0, 1, 1], [0, 0, 0, 0]], dtype=np.int8)
+        fitness_values = calculate_population_fitnesses(population)
+        self.assertIn(select_parent_sus(population, fitness_values), population)
+        self.assertIn(select_parent(population, fitness_values, "SUS"), population)
+
     def test_crossover_no_crossover(self):
         # Given
         parent1 = np.array([1, 2, 3, 4, 5])
@@ -245,6 +274,17 @@ class TestUnitGeneticAlgorithm(unittest.TestCase):
         avg_mutation_gen_fitness = sum(mutated_gen_fitness) / len(mutated_gen_fitness)
         self.assertTrue(0.49 <= avg_mutation_gen_fitness <= 0.51)
 
+    def test_mutate_population_rate_1(self):
+        population = np.zeros((2, 3, 4), dtype=np.int8)
+        np.testing.assert_equal(mutate_population(population, 1.0), np.ones((2, 3, 4), dtype=np.int8))
+
+    def test_mutate_population_fitness_all_zeroes(self):
+        population = np.zeros((1_000, 50), dtype=np.int8)
+        mutated_population = mutate_population(population, 0.5)
+        self.assertIs(mutated_population, population)  # Mutated in place
+        fitness_avg = get_generation_fitness(calculate_population_fitnesses(mutated_population), 1_000)
+        self.assertTrue(0.49 <= fitness_avg <= 0.51)
+
     def test_population_size_odd(self):
         population_size = 101
         population = np.array([[0, 1, 0, 1]] * population_size)
@@ -315,6 +355,276 @@ class TestUnitGeneticAlgorithm(unittest.TestCase):
         self.assertGreaterEqual(best_fitness, 0)
         self.assertLessEqual(best_fitness, 1)
 
+    def test_create_new_population_vectorized_population_size_odd(self):
+        population_size = 101
+        population = np.array([[0, 1, 0, 1]] * population_size, dtype=np.int8)
+        fitness_values = calculate_population_fitnesses(population)
+
+        new_population = create_new_population_vectorized(
+            population_size, population, fitness_values, "tournament", 0.8, 0.0
+        )
+        self.assertEqual(new_population.shape, population.shape)
+        self.assertEqual(new_population.dtype, population.dtype)
+        np.testing.assert_equal(new_population, population)  # Identical parents and no mutation
+
+    def test_create_new_population_vectorized_mutation_rate_1(self):
+        population = np.zeros((10, 8), dtype=np.int8)
+        fitness_values = calculate_population_fitnesses(population)
+        new_population = create_new_population_vectorized(10, population, fitness_values, "roulette", 0.5, 1.0)
+        np.testing.assert_equal(new_population, np.ones((10, 8), dtype=np.int8))
+
+    def test_create_new_population_vectorized_keeps_genes_per_position(self):
+        # Single point crossover only swaps tails, so every column keeps the genes of the selected parents
+        population = np.array([[1, 1, 1, 1, 1, 1], [0, 0, 0, 0, 0, 0]] * 10, dtype=np.int8)
+        fitness_values = np.full(20, 0.5)
+        new_population = create_new_population_vectorized(20, population, fitness_values, "roulette", 1.0, 0.0)
+        self.assertTrue(np.all((new_population == 0) | (new_population == 1)))
+        self.assertEqual(new_population.shape, population.shape)
+
+    def test_create_new_population_vectorized_batch(self):
+        populations = np.zeros((3, 11, 6), dtype=np.int8)
+        populations[1] = 1
+        fitness_values = np.mean(populations, axis=-1)
+        new_populations = create_new_population_vectorized(11, populations, fitness_values, "tournament", 1.0, 0.0)
+        self.assertEqual(new_populations.shape, populations.shape)
+        np.testing.assert_equal(new_populations, populations)  # Runs never exchange genes
+
+    def test_genetic_algorithm_vectorized(self):
+        generation, generation_fitness, best_fitness = genetic_algorithm(
+            population_size=50,
+            genome_length=20,
+            max_generations=200,
+            mutation_rate=0.01,
+            crossover_rate=0.5,
+            target_generation_fitness=0.95,
+            vectorized=True,
+        )
+        self.assertLessEqual(generation, 200)
+        self.assertGreaterEqual(generation_fitness, 0.9)
+        self.assertEqual(best_fitness, 1.0)
+
+    def test_create_new_population_incremental_matches_recomputed_counts(self):
+        population = init_population(21, 30)
+        ones_counts = population.sum(axis=-1)
+        for select_parent_mode in ["tournament", "roulette", "sus"]:
+            for _ in range(20):
+                population, ones_counts = create_new_population_incremental(
+                    21, population, ones_counts / 30, select_parent_mode, 0.6, 0.05, ones_counts
+                )
+                self.assertEqual(population.shape, (21, 30))
+                np.testing.assert_array_equal(ones_counts, population.sum(axis=-1))
+
+    def test_genetic_algorithm_incremental_fitness(self):
+        generation, generation_fitness, best_fitness = genetic_algorithm(
+            population_size=50,
+            genome_length=20,
+            max_generations=200,
+            mutation_rate=0.01,
+            crossover_rate=0.5,
+            target_generation_fitness=0.95,
+            incremental_fitness=True,
+        )
+        self.assertLessEqual(generation, 200)
+        self.assertGreaterEqual(generation_fitness, 0.9)
+        self.assertEqual(best_fitness, 1.0)
+
+    def test_save_and_load_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "run.ckpt")
+            population = init_population(6, 8)
+            fitness_values = calculate_population_fitnesses(population)
+            save_checkpoint(checkpoint_path, 41, population, fitness_values, population, 40, 0.75, 1.0)
+            loaded = load_checkpoint(checkpoint_path)
+            self.assertEqual(loaded[0], 41)
+            np.testing.assert_array_equal(loaded[1], population)
+            self.assertEqual(loaded[4:], (40, 0.75, 1.0))
+
+    def test_genetic_algorithm_resumes_from_checkpoint(self):
+        # A run resumed from a checkpoint continues exactly like the run that wrote it
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "run.ckpt")
+            resumed_path = os.path.join(directory, "resumed.ckpt")
+            params = (30, 40, 20, 0.01, 0.5, "tournament", 1.1)
+            genetic_algorithm(*params, checkpoint_path=checkpoint_path, checkpoint_interval=10, vectorized=True)
+            shutil.copy(checkpoint_path, resumed_path)
+            params = (30, 40, 50, 0.01, 0.5, "tournament", 1.1)
+            result = genetic_algorithm(
+                *params, checkpoint_path=checkpoint_path, checkpoint_interval=10, vectorized=True
+            )
+            resumed_result = genetic_algorithm(
+                *params, checkpoint_path=resumed_path, checkpoint_interval=100, vectorized=True
+            )
+            self.assertEqual(result, resumed_result)
+
+    def test_genetic_algorithm_batch(self):
+        max_generations = 200
+        results = genetic_algorithm_batch(
+            run_times=5,
+            population_size=31,
+            genome_length=15,
+            max_generations=max_generations,
+            mutation_rate=0.01,
+            crossover_rate=0.5,
+            target_generation_fitness=0.95,
+        )
+        self.assertEqual(len(results), 5)
+        for generation, generation_fitness, best_fitness in results:
+            self.assertIsInstance(generation, int)
+            self.assertIsInstance(generation_fitness, float)
+            self.assertIsInstance(best_fitness, float)
+            self.assertLessEqual(generation, max_generations)
+            self.assertGreaterEqual(generation_fitness, 0)
+            self.assertLessEqual(generation_fitness, 1)
+            self.assertLessEqual(best_fitness, 1)
+            if generation < max_generations:  # Early terminated runs reached the target
+                self.assertGreaterEqual(generation_fitness, 0.95)
+                self.assertEqual(best_fitness, 1.0)
+
+    def test_genetic_algorithm_instrumentation(self):
+        # Instrumented runs time every phase and evolve exactly like the uninstrumented run with the same seed
+        params = (21, 20, 30, 0.01, 0.5, "tournament", 1.1)
+        for options in [{}, {"vectorized": True}]:
+            instrumentation = {}
+            result = genetic_algorithm(*params, seed=3, instrumentation=instrumentation, **options)
+            self.assertEqual(result, genetic_algorithm(*params, seed=3, **options))
+            phases = ["selection", "crossover", "mutation", "fitness", "bookkeeping"]
+            self.assertEqual(list(instrumentation["phases"]), phases)
+            for phase_time, phase_calls in instrumentation["phases"].values():
+                self.assertGreater(phase_time, 0)
+                self.assertGreaterEqual(phase_calls, 30)
+            self.assertEqual(len(instrumentation["best_fitness"]), 30)
+            self.assertEqual(len(instrumentation["mean_fitness"]), 30)
+            self.assertEqual(max(instrumentation["mean_fitness"]), result[1])
+
+    def test_genetic_algorithm_seed_is_reproducible(self):
+        params = (30, 20, 50, 0.01, 0.5, "tournament", 1.1)
+        for vectorized in [False, True]:
+            result = genetic_algorithm(*params, vectorized=vectorized, seed=7)
+            self.assertEqual(genetic_algorithm(*params, vectorized=vectorized, seed=7), result)
+        results = genetic_algorithm_batch(3, *params, seeds=[1, 2, 3])
+        self.assertEqual(genetic_algorithm_batch(3, *params, seeds=[1, 2, 3]), results)
+
+    def test_genetic_algorithm_batch_matches_single_runs(self):
+        # Every run draws from its own seed, so it does not depend on the other runs of the batch
+        params = (30, 20, 150, 0.01, 0.5)
+        for select_parent_mode in ["tournament", "roulette", "sus"]:
+            run_params = (*params, select_parent_mode, 0.95)
+            results = genetic_algorithm_batch(4, *run_params, seeds=[1, 2, 3, 4])
+            single_results = [genetic_algorithm(*run_params, vectorized=True, seed=seed) for seed in [1, 2, 3, 4]]
+            self.assertEqual(results, single_results)
+            self.assertEqual(genetic_algorithm_batch(2, *run_params, seeds=[3, 4]), results[2:])
+
+    def test_genetic_algorithm_batch_too_few_seeds(self):
+        with self.assertRaises(ValueError):
+            genetic_algorithm_batch(3, 10, 10, 5, seeds=[1, 2])
+
+    def test_genetic_algorithm_batch_runs_terminate_independently(self):
+        results = genetic_algorithm_batch(
+            run_times=20, population_size=20, genome_length=8, max_generations=100, mutation_rate=0.01
+        )
+        generations = [generation for generation, _, _ in results]
+        self.assertGreater(len(set(generations)), 1)
+
+    def test_genetic_algorithm_stream(self):
+        # The stream evolves like genetic_algorithm with the same seed and ends with the generation reaching the target
+        params = (20, 10, 200, 0.01, 0.7, "tournament", 0.9)
+        for options in [{}, {"vectorized": True}]:
+            snapshots = list(genetic_algorithm_stream(*params, seed=5, **options))
+            self.assertEqual([snapshot.generation for snapshot in snapshots], list(range(len(snapshots))))
+            last = snapshots[-1]
+            result = genetic_algorithm(*params, seed=5, **options)
+            self.assertEqual((last.generation, last.mean_fitness, last.best_fitness), result)
+            self.assertIsNone(last.best_genome)
+            self.assertIsNone(last.population)
+
+    def test_genetic_algorithm_population_out(self):
+        # The given array holds the population of the last generation, the one the stream ends with
+        params = (20, 10, 200, 0.01, 0.7, "tournament", 0.9)
+        for options in [{}, {"vectorized": True}, {"buffered": True}]:
+            population_out = np.zeros((20, 10), dtype=np.int8)
+            result = genetic_algorithm(*params, seed=5, population_out=population_out, **options)
+            self.assertEqual(result, genetic_algorithm(*params, seed=5, **options))
+            stream_options = {"vectorized": True} if options else {}
+            snapshots = list(genetic_algorithm_stream(*params, seed=5, copy_population=True, **stream_options))
+            np.testing.assert_array_equal(population_out, snapshots[-1].population)
+
+    def test_genetic_algorithm_stream_stops_early(self):
+        stream = genetic_algorithm_stream(20, 10, 1000, 0.01, 0.7, "tournament", 1.1, seed=5)
+        snapshots = []
+        for snapshot in stream:
+            snapshots.append(snapshot)
+            if snapshot.generation == 4:
+                break
+        self.assertEqual(len(snapshots), 5)
+
+    def test_genetic_algorithm_stream_best_genome_and_population(self):
+        stream = genetic_algorithm_stream(
+            20, 10, 5, 0.01, 0.7, "tournament", 1.1, seed=5, include_best_genome=True, copy_population=True
+        )
+        for snapshot in stream:
+            self.assertEqual(len(snapshot.population), 20)
+            self.assertEqual(get_genome_fitness(snapshot.best_genome), snapshot.best_fitness)
+            self.assertAlmostEqual(
+                float(sum(get_genome_fitness(genome) for genome in snapshot.population)) / 20, snapshot.mean_fitness
+            )
+
+    def test_genetic_algorithm_fitness_function(self):
+        # Evolves towards the optimum of the given fitness function and stops at its target
+        params = (20, 10, 300, 0.01, 0.7, "tournament", 0.9)
+        for options in [{}, {"vectorized": True}]:
+            generation, generation_fitness, best_fitness = genetic_algorithm(
+                *params, seed=1, fitness_function=ZeroMax(), **options
+            )
+            self.assertLess(generation, 300)
+            self.assertGreaterEqual(generation_fitness, 0.9)
+            self.assertEqual(best_fitness, 1.0)
+            snapshots = list(genetic_algorithm_stream(*params, seed=1, fitness_function=ZeroMax(), **options))
+            self.assertEqual(snapshots[-1].generation, generation)
+        results = genetic_algorithm_batch(3, *params, seeds=[1, 2, 3], fitness_function=ZeroMax())
+        self.assertTrue(all(best_fitness == 1.0 for _, _, best_fitness in results))
+
+    def test_genetic_algorithm_fitness_cache(self):
+        # A cached fitness function evolves exactly like the uncached one and its counters go into the instrumentation
+        params = (20, 10, 50, 0.01, 0.7, "tournament", 1.1)
+        instrumentation = {}
+        cached = CachedFitnessFunction(ZeroMax())
+        result = genetic_algorithm(*params, seed=2, instrumentation=instrumentation, fitness_function=cached)
+        self.assertEqual(result, genetic_algorithm(*params, seed=2, fitness_function=ZeroMax()))
+        self.assertIs(instrumentation["fitness_cache"], cached.stats)
+        self.assertEqual(cached.stats["hits"] + cached.stats["misses"], 20 * 51)
+        self.assertGreater(cached.stats["hits"], 0)
+
+    def test_genetic_algorithm_fitness_function_incremental(self):
+        with self.assertRaises(ValueError):
+            genetic_algorithm(10, 10, 10, incremental_fitness=True, fitness_function=ZeroMax())
+
+    def test_genetic_algorithm_buffered(self):
+        # Buffered runs draw the same numbers and breed the same offspring as vectorized runs
+        for select_parent_mode in ["tournament", "roulette", "sus"]:
+            for population_size, genome_length in [(20, 10), (21, 7), (3, 5)]:
+                params = (population_size, genome_length, 40, 0.02, 0.7, select_parent_mode, 1.1)
+                result = genetic_algorithm(*params, seed=4, buffered=True)
+                self.assertEqual(result, genetic_algorithm(*params, seed=4, vectorized=True))
+        params = (20, 10, 300, 0.01, 0.7, "tournament", 0.9)
+        result = genetic_algorithm(*params, seed=4, buffered=True, fitness_function=ZeroMax())
+        self.assertEqual(result, genetic_algorithm(*params, seed=4, fitness_function=ZeroMax(), vectorized=True))
+
+    def test_create_new_population_buffered_swaps_buffers(self):
+        buffers = get_population_buffers(10, 8)
+        population = init_population(10, 8)
+        fitness_values = calculate_population_fitnesses(population)
+        first = create_new_population_buffered(10, population, fitness_values, "tournament", 0.7, 0.01, buffers)
+        self.assertIs(first, buffers["population0"])
+        fitness_values = calculate_population_fitnesses(first)
+        second = create_new_population_buffered(10, first, fitness_values, "tournament", 0.7, 0.01, buffers)
+        self.assertIs(second, buffers["population1"])
+        third = create_new_population_buffered(10, second, fitness_values, "tournament", 0.7, 0.01, buffers)
+        self.assertIs(third, buffers["population0"])
+
+    def test_genetic_algorithm_buffered_incremental(self):
+        with self.assertRaises(ValueError):
+            genetic_algorithm(10, 10, 10, incremental_fitness=True, buffered=True)
+
 
 class TestInteGeneticAlgorithm(unittest.TestCase):
 
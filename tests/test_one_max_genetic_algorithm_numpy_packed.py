@@ -0,0 +1,130 @@
+import unittest
+
+import numpy as np
+
+from src.one_max_genetic_algorithm_numpy_packed import (
+    calculate_population_fitnesses,
+    create_new_population,
+    crossover,
+    genetic_algorithm,
+    get_crossover_masks,
+    get_genome_fitness,
+    get_num_words,
+    init_population,
+    mutate,
+    mutate_population,
+    pack_population,
+    popcount,
+    random_genome,
+    unpack_population,
+)
+
+
+class TestUnitGeneticAlgorithmPacked(unittest.TestCase):
+
+    def test_get_num_words(self):
+        self.assertEqual(get_num_words(0), 0)
+        self.assertEqual(get_num_words(1), 1)
+        self.assertEqual(get_num_words(64), 1)
+        self.assertEqual(get_num_words(65), 2)
+
+    def test_random_genome_padding_bits_are_zero(self):
+        genome = random_genome(70)
+        self.assertEqual(len(genome), 2)
+        self.assertEqual(int(genome[-1]) >> 6, 0)
+
+    def test_init_population_shape(self):
+        population = init_population(10, 130)
+        self.assertEqual(population.shape, (10, 3))
+        self.assertEqual(population.dtype, np.uint64)
+
+    def test_popcount(self):
+        words = np.array([0, 1, 2**64 - 1, 0x8000000000000001], dtype=np.uint64)
+        np.testing.assert_equal(popcount(words), np.array([0, 1, 64, 2]))
+
+    def test_pack_unpack_roundtrip(self):
+        for genome_length in [1, 7, 64, 65, 200]:
+            population = np.random.randint(0, 2, size=(5, genome_length)).astype(np.int8)
+            packed_population = pack_population(population)
+            self.assertEqual(packed_population.shape, (5, get_num_words(genome_length)))
+            np.testing.assert_equal(unpack_population(packed_population, genome_length), population)
+
+    def test_genome_fitness(self):
+        genome = pack_population(np.array([0, 1, 0, 1, 0, 1, 1, 0], dtype=np.int8))[0]
+        self.assertEqual(get_genome_fitness(genome, 8), 0.5)
+
+    def test_calculate_population_fitnesses_matches_unpacked(self):
+        population = np.random.randint(0, 2, size=(20, 100)).astype(np.int8)
+        np.testing.assert_allclose(
+            calculate_population_fitnesses(pack_population(population), 100), np.mean(population, axis=1)
+        )
+
+    def test_get_crossover_masks(self):
+        masks = get_crossover_masks(np.array([1, 64, 70]), 2)
+        np.testing.assert_equal(masks[0], np.array([1, 0], dtype=np.uint64))
+        np.testing.assert_equal(masks[1], np.array([2**64 - 1, 0], dtype=np.uint64))
+        np.testing.assert_equal(masks[2], np.array([2**64 - 1, 0b111111], dtype=np.uint64))
+
+    def test_crossover_no_crossover(self):
+        parent1, parent2 = random_genome(100), random_genome(100)
+        child1, child2 = crossover(parent1, parent2, 0.0, 100)
+        np.testing.assert_equal(child1, parent1)
+        np.testing.assert_equal(child2, parent2)
+
+    def test_crossover_with_crossover_keeps_genes(self):
+        population = np.array([[1] * 100, [0] * 100], dtype=np.int8)
+        packed_population = pack_population(population)
+        child1, child2 = crossover(packed_population[0], packed_population[1], 1.0, 100)
+        unpacked_child1 = unpack_population(child1, 100)[0]
+        unpacked_child2 = unpack_population(child2, 100)[0]
+        np.testing.assert_equal(unpacked_child1 + unpacked_child2, np.ones(100))
+        self.assertTrue(0 < np.sum(unpacked_child1) < 100)
+
+    def test_mutate_with_rate_1(self):
+        genome = pack_population(np.array([0, 1, 0, 1, 1], dtype=np.int8))[0]
+        mutated_genome = mutate(genome, 1.0, 5)
+        np.testing.assert_equal(unpack_population(mutated_genome, 5)[0], np.array([1, 0, 1, 0, 0]))
+
+    def test_mutate_population_fitness_all_zeroes(self):
+        population = np.zeros((1_000, 2), dtype=np.uint64)
+        mutate_population(population, 0.5, 100)
+        fitness_avg = np.mean(calculate_population_fitnesses(population, 100))
+        self.assertTrue(0.49 <= fitness_avg <= 0.51)
+
+    def test_create_new_population_population_size_odd(self):
+        population = init_population(101, 70)
+        fitness_values = calculate_population_fitnesses(population, 70)
+        new_population = create_new_population(101, population, fitness_values, "tournament", 0.8, 0.03, 70)
+        self.assertEqual(new_population.shape, population.shape)
+        self.assertTrue(np.all(new_population[:, -1] >> np.uint64(6) == 0))  # Padding bits stay unset
+
+    def test_genetic_algorithm_custom_parameters(self):
+        generation, generation_fitness, best_fitness = genetic_algorithm(
+            population_size=50,
+            genome_length=20,
+            max_generations=200,
+            mutation_rate=0.01,
+            crossover_rate=0.5,
+            select_parent_mode="roulette",
+            target_generation_fitness=0.95,
+        )
+        self.assertLessEqual(generation, 200)
+        self.assertGreaterEqual(generation_fitness, 0)
+        self.assertLessEqual(generation_fitness, 1)
+        self.assertGreaterEqual(best_fitness, 0)
+        self.assertLessEqual(best_fitness, 1)
+
+    def test_genetic_algorithm_seed_is_reproducible(self):
+        params = (20, 70, 50, 0.01, 0.5, "tournament", 1.1)
+        self.assertEqual(genetic_algorithm(*params, seed=7), genetic_algorithm(*params, seed=7))
+
+    def test_genetic_algorithm_long_genome(self):
+        generation, generation_fitness, best_fitness = genetic_algorithm(
+            population_size=20, genome_length=100_000, max_generations=5, mutation_rate=0.001
+        )
+        self.assertEqual(generation, 5)
+        self.assertTrue(0.45 <= generation_fitness <= 0.55)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,42 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 from src.one_max_genetic_algorithm_vanilla import (
     calculate_population_fitnesses,
     create_new_population,
+    create_new_population_incremental,
     crossover,
     genetic_algorithm,
+    genetic_algorithm_batch,
+    genetic_algorithm_stream,
     get_best_fitness,
     get_generation_fitness,
     get_genome_fitness,
     get_target_fitness,
     init_population,
+    load_checkpoint,
     mutate,
+    mutate_with_ones_delta,
     random_genome,
+    save_checkpoint,
     select_parent,
     select_parent_roulette,
+    select_parent_sus,
     select_parent_tournament,
 )
 
 
+class ZeroMax:
+    # Any object with a name, a target and an evaluate method over the whole population is a fitness function
+    name = "zeromax"
+    target = 1.0
+
+    def evaluate(self, population):
+        return [1 - sum(genome) / len(genome) for genome in population]
+
+
 class TestUnitGeneticAlgorithm(unittest.TestCase):
 
     def test_random_genome_length(self):
@@ -173,6 +192,12 @@ class TestUnitGeneticAlgorithm(unittest.TestCase):
         selected_individual = select_parent_roulette(population, fitness_values)
         self.assertIn(selected_individual, population)  # Ensure the selected individual is from the population
 
+    def test_select_parent_sus(self):
+        population = [[1, 1, 1, 1], [1, 0, 1, 0], [0, 0, 1, 1], [0, 0, 0, 0]]
+        fitness_values = calculate_population_fitnesses(population)
+        self.assertIn(select_parent_sus(population, fitness_values), population)
+        self.assertIn(select_parent(population, fitness_values, "SUS"), population)
+
     def test_crossover_no_crossover(self):
         # Given
         parent1 = [1, 2, 3, 4, 5]
@@ -311,6 +336,144 @@ class TestUnitGeneticAlgorithm(unittest.TestCase):
         self.assertGreaterEqual(best_fitness, 0)
         self.assertLessEqual(best_fitness, 1)
 
+    def test_mutate_with_ones_delta(self):
+        genome = [1, 0, 1, 1, 0]
+        self.assertEqual(mutate_with_ones_delta(genome, 1.0), -1)
+        self.assertEqual(genome, [0, 1, 0, 0, 1])
+        self.assertEqual(mutate_with_ones_delta(genome, 0.0), 0)
+
+    def test_create_new_population_incremental_matches_recomputed_counts(self):
+        population = init_population(21, 30)
+        ones_counts = [sum(genome) for genome in population]
+        for select_parent_mode in ["tournament", "roulette", "sus"]:
+            for _ in range(20):
+                fitness_values = [ones / 30 for ones in ones_counts]
+                population, ones_counts = create_new_population_incremental(
+                    21, population, fitness_values, select_parent_mode, 0.6, 0.05, ones_counts
+                )
+                self.assertEqual(len(population), 21)
+                self.assertEqual(ones_counts, [sum(genome) for genome in population])
+
+    def test_genetic_algorithm_incremental_fitness(self):
+        generation, generation_fitness, best_fitness = genetic_algorithm(
+            population_size=50, genome_length=20, max_generations=300, incremental_fitness=True
+        )
+        self.assertLessEqual(generation, 300)
+        self.assertGreaterEqual(generation_fitness, 0)
+        self.assertLessEqual(best_fitness, 1)
+
+    def test_save_and_load_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "run.ckpt")
+            population = init_population(6, 8)
+            fitness_values = calculate_population_fitnesses(population)
+            save_checkpoint(checkpoint_path, 41, population, fitness_values, population, 40, 0.75, 1.0)
+            loaded = load_checkpoint(checkpoint_path)
+            self.assertEqual(loaded[0], 41)
+            self.assertEqual(loaded[1], population)
+            self.assertEqual(loaded[4:], (40, 0.75, 1.0))
+
+    def test_genetic_algorithm_resumes_from_checkpoint(self):
+        # A run resumed from a checkpoint continues exactly like the run that wrote it
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "run.ckpt")
+            resumed_path = os.path.join(directory, "resumed.ckpt")
+            params = (30, 40, 20, 0.01, 0.5, "tournament", 1.1)
+            genetic_algorithm(
+                *params, checkpoint_path=checkpoint_path, checkpoint_interval=10, incremental_fitness=True
+            )
+            shutil.copy(checkpoint_path, resumed_path)
+            params = (30, 40, 50, 0.01, 0.5, "tournament", 1.1)
+            result = genetic_algorithm(
+                *params, checkpoint_path=checkpoint_path, checkpoint_interval=10, incremental_fitness=True
+            )
+            resumed_result = genetic_algorithm(
+                *params, checkpoint_path=resumed_path, checkpoint_interval=100, incremental_fitness=True
+            )
+            self.assertEqual(result, resumed_result)
+
+    def test_genetic_algorithm_batch(self):
+        results = genetic_algorithm_batch(run_times=3, population_size=20, genome_length=10, max_generations=50)
+        self.assertEqual(len(results), 3)
+        for generation, generation_fitness, best_fitness in results:
+            self.assertLessEqual(generation, 50)
+            self.assertGreaterEqual(generation_fitness, 0)
+            self.assertLessEqual(best_fitness, 1)
+
+    def test_genetic_algorithm_instrumentation(self):
+        # Instrumented runs time every phase and evolve exactly like the uninstrumented run with the same seed
+        params = (21, 20, 30, 0.01, 0.5, "tournament", 1.1)
+        for options in [{}, {"incremental_fitness": True}]:
+            instrumentation = {}
+            result = genetic_algorithm(*params, seed=3, instrumentation=instrumentation, **options)
+            self.assertEqual(result, genetic_algorithm(*params, seed=3, **options))
+            phases = ["selection", "crossover", "mutation", "fitness", "bookkeeping"]
+            self.assertEqual(list(instrumentation["phases"]), phases)
+            for phase_time, phase_calls in instrumentation["phases"].values():
+                self.assertGreater(phase_time, 0)
+                self.assertGreaterEqual(phase_calls, 30)
+            self.assertEqual(len(instrumentation["best_fitness"]), 30)
+            self.assertEqual(len(instrumentation["mean_fitness"]), 30)
+            self.assertEqual(max(instrumentation["mean_fitness"]), result[1])
+
+    def test_genetic_algorithm_seed_is_reproducible(self):
+        params = (20, 20, 50, 0.01, 0.5, "tournament", 1.1)
+        result = genetic_algorithm(*params, seed=7)
+        self.assertEqual(genetic_algorithm(*params, seed=7), result)
+        results = genetic_algorithm_batch(3, *params, seeds=[1, 2, 3])
+        self.assertEqual(results[1], genetic_algorithm(*params, seed=2))
+
+    def test_genetic_algorithm_stream(self):
+        # The stream evolves like genetic_algorithm with the same seed and ends with the generation reaching the target
+        params = (20, 10, 200, 0.01, 0.7, "tournament", 0.9)
+        for options in [{}]:
+            snapshots = list(genetic_algorithm_stream(*params, seed=5, **options))
+            self.assertEqual([snapshot.generation for snapshot in snapshots], list(range(len(snapshots))))
+            last = snapshots[-1]
+            result = genetic_algorithm(*params, seed=5, **options)
+            self.assertEqual((last.generation, last.mean_fitness, last.best_fitness), result)
+            self.assertIsNone(last.best_genome)
+            self.assertIsNone(last.population)
+
+    def test_genetic_algorithm_stream_stops_early(self):
+        stream = genetic_algorithm_stream(20, 10, 1000, 0.01, 0.7, "tournament", 1.1, seed=5)
+        snapshots = []
+        for snapshot in stream:
+            snapshots.append(snapshot)
+            if snapshot.generation == 4:
+                break
+        self.assertEqual(len(snapshots), 5)
+
+    def test_genetic_algorithm_stream_best_genome_and_population(self):
+        stream = genetic_algorithm_stream(
+            20, 10, 5, 0.01, 0.7, "tournament", 1.1, seed=5, include_best_genome=True, copy_population=True
+        )
+        for snapshot in stream:
+            self.assertEqual(len(snapshot.population), 20)
+            self.assertEqual(get_genome_fitness(snapshot.best_genome), snapshot.best_fitness)
+            self.assertAlmostEqual(
+                float(sum(get_genome_fitness(genome) for genome in snapshot.population)) / 20, snapshot.mean_fitness
+            )
+
+    def test_genetic_algorithm_fitness_function(self):
+        # Evolves towards the optimum of the given fitness function and stops at its target
+        params = (20, 10, 300, 0.01, 0.7, "tournament", 0.9)
+        for options in [{}]:
+            generation, generation_fitness, best_fitness = genetic_algorithm(
+                *params, seed=1, fitness_function=ZeroMax(), **options
+            )
+            self.assertLess(generation, 300)
+            self.assertGreaterEqual(generation_fitness, 0.9)
+            self.assertEqual(best_fitness, 1.0)
+            snapshots = list(genetic_algorithm_stream(*params, seed=1, fitness_function=ZeroMax(), **options))
+            self.assertEqual(snapshots[-1].generation, generation)
+        results = genetic_algorithm_batch(3, *params, seeds=[1, 2, 3], fitness_function=ZeroMax())
+        self.assertTrue(all(best_fitness == 1.0 for _, _, best_fitness in results))
+
+    def test_genetic_algorithm_fitness_function_incremental(self):
+        with self.assertRaises(ValueError):
+            genetic_algorithm(10, 10, 10, incremental_fitness=True, fitness_function=ZeroMax())
+
 
 class TestInteGeneticAlgorithm(unittest.TestCase):
 
@@ -0,0 +1,94 @@
+import unittest
+
+from src.one_max_genetic_algorithm_vanilla_packed import (
+    calculate_population_fitnesses,
+    create_new_population,
+    crossover,
+    genetic_algorithm,
+    get_genome_fitness,
+    get_mutation_mask,
+    init_population,
+    mutate,
+    pack_genome,
+    random_genome,
+    select_parent,
+    unpack_genome,
+)
+
+
+class TestUnitGeneticAlgorithmPacked(unittest.TestCase):
+
+    def test_random_genome_range(self):
+        genome = random_genome(10)
+        self.assertTrue(0 <= genome < 2**10)
+        self.assertEqual(random_genome(0), 0)
+
+    def test_pack_unpack_roundtrip(self):
+        genome = [1, 0, 1, 1, 0, 0, 0, 1, 0]
+        self.assertEqual(pack_genome(genome), 0b010001101)
+        self.assertEqual(unpack_genome(pack_genome(genome), len(genome)), genome)
+
+    def test_genome_fitness(self):
+        self.assertEqual(get_genome_fitness(0, 10), 0.0)
+        self.assertEqual(get_genome_fitness(2**10 - 1, 10), 1.0)
+        self.assertEqual(get_genome_fitness(pack_genome([0, 1, 0, 1, 0, 1, 1, 0]), 8), 0.5)
+
+    def test_calculate_population_fitnesses(self):
+        population = [0, 0b1111110000, 0b0010101010]
+        self.assertEqual(calculate_population_fitnesses(population, 10), [0.0, 0.6, 0.4])
+
+    def test_select_parent(self):
+        population = [0b1111, 0b0101, 0b1100, 0b0000]
+        fitness_values = calculate_population_fitnesses(population, 4)
+        for mode in ["tournament", "roulette", "gibberish"]:
+            self.assertIn(select_parent(population, fitness_values, mode), population)
+
+    def test_crossover_no_crossover(self):
+        self.assertEqual(crossover(0b1111, 0b0000, 0.0, 4), (0b1111, 0b0000))
+
+    def test_crossover_with_crossover(self):
+        child1, child2 = crossover(2**10 - 1, 0, 1.0, 10)
+        self.assertEqual(child1 ^ child2, 2**10 - 1)
+        self.assertTrue(0 < child1.bit_count() < 10)
+
+    def test_get_mutation_mask(self):
+        self.assertEqual(get_mutation_mask(10, 0.0), 0)
+        self.assertEqual(get_mutation_mask(10, 1.0), 2**10 - 1)
+        self.assertTrue(0 <= get_mutation_mask(10, 0.5) < 2**10)
+
+    def test_mutate_population_fitness_all_zeroes(self):
+        mutated_gen_fitness = [get_genome_fitness(mutate(0, 0.5, 50), 50) for _ in range(10_000)]
+        avg_mutation_gen_fitness = sum(mutated_gen_fitness) / len(mutated_gen_fitness)
+        self.assertTrue(0.49 <= avg_mutation_gen_fitness <= 0.51)
+
+    def test_population_size_odd(self):
+        population = init_population(101, 70)
+        fitness_values = calculate_population_fitnesses(population, 70)
+        new_population = create_new_population(101, population, fitness_values, "tournament", 0.8, 0.03, 70)
+        self.assertEqual(len(new_population), 101)
+        self.assertTrue(all(0 <= genome < 2**70 for genome in new_population))
+
+    def test_genetic_algorithm_custom_parameters(self):
+        generation, generation_fitness, best_fitness = genetic_algorithm(
+            population_size=20,
+            genome_length=10,
+            max_generations=50,
+            mutation_rate=0.01,
+            crossover_rate=0.8,
+            select_parent_mode="roulette",
+            target_generation_fitness=0.95,
+            verbose=True,
+        )
+        self.assertLessEqual(generation, 50)
+        self.assertGreaterEqual(generation_fitness, 0)
+        self.assertLessEqual(generation_fitness, 1)
+        self.assertGreaterEqual(best_fitness, 0)
+        self.assertLessEqual(best_fitness, 1)
+
+    def test_genetic_algorithm_seed_is_reproducible(self):
+        params = (20, 70, 50, 0.01, 0.5, "tournament", 1.1)
+        self.assertEqual(genetic_algorithm(*params, seed=7), genetic_algorithm(*params, seed=7))
+
+
+if __name__ == "__main__":
+    unittest.main()
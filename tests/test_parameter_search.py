@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+
+from src.parameter_search import predict_gaussian_process, successive_halving, surrogate_search
+
+
+class TestSuccessiveHalving(unittest.TestCase):
+    def setUp(self):
+        self.rounds = []
+
+    def evaluate(self, candidates, run_times, generations):
+        # The closer the mutation rate is to 0.005 the better, crossover rates break the ties
+        self.rounds.append((list(candidates), run_times, generations))
+        return [1 - abs(mutation_rate - 0.005) + crossover_rate * 0.01 for mutation_rate, crossover_rate in candidates]
+
+    def test_finds_best_candidate(self):
+        candidates = [
+            (mutation_rate / 1000, crossover_rate / 10)
+            for mutation_rate in range(1, 11)
+            for crossover_rate in range(1, 6)
+        ]
+        best_candidate, best_score, _ = successive_halving(candidates, self.evaluate)
+        self.assertEqual(best_candidate, (0.005, 0.5))
+        self.assertAlmostEqual(best_score, 1.005)
+
+    def test_rounds_halve_candidates_and_grow_budget(self):
+        candidates = [(mutation_rate / 1000, 0.5) for mutation_rate in range(1, 9)]
+        _, _, total_runs = successive_halving(
+            candidates, self.evaluate, min_run_times=1, max_run_times=4, min_generations=10, max_generations=40
+        )
+        self.assertEqual([len(candidates) for candidates, _, _ in self.rounds], [8, 4, 2, 1])
+        self.assertEqual([run_times for _, run_times, _ in self.rounds], [1, 2, 4, 4])
+        self.assertEqual([generations for _, _, generations in self.rounds], [10, 20, 40, 40])
+        self.assertEqual(total_runs, 8 + 8 + 8 + 4)
+
+    def test_single_candidate_gets_full_budget(self):
+        best_candidate, _, total_runs = successive_halving(
+            [(0.01, 0.1)], self.evaluate, min_run_times=2, max_run_times=8, min_generations=100, max_generations=400
+        )
+        self.assertEqual(best_candidate, (0.01, 0.1))
+        self.assertEqual(self.rounds[-1][1:], (8, 400))
+        self.assertEqual(total_runs, 2 + 4 + 8)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            successive_halving([], self.evaluate)
+        with self.assertRaises(ValueError):
+            successive_halving([(0.01, 0.1)], self.evaluate, reduction_factor=1)
+        for budget in [{"min_run_times": 0}, {"max_run_times": 0}, {"min_generations": 0}, {"max_generations": -1}]:
+            with self.assertRaises(ValueError):
+                successive_halving([(0.01, 0.1)], self.evaluate, **budget)
+
+
+class TestSurrogateSearch(unittest.TestCase):
+    def setUp(self):
+        self.evaluated = []
+
+    def evaluate(self, candidates, run_times, generations):
+        # Smooth score with its peak at a mutation rate of 0.004 and a crossover rate of 0.3
+        self.evaluated.extend(candidates)
+        return [
+            1 - ((mutation_rate - 0.004) / 0.009) ** 2 - ((crossover_rate - 0.3) / 0.5) ** 2
+            for mutation_rate, crossover_rate in candidates
+        ]
+
+    def test_predict_gaussian_process_interpolates_observations(self):
+        observed_points = np.array([[0.1, 0.1], [0.5, 0.5], [0.9, 0.2]])
+        observed_scores = np.array([0.2, 0.8, 0.5])
+        mean, std = predict_gaussian_process(observed_points, observed_scores, observed_points, noise=1e-6)
+        np.testing.assert_allclose(mean, observed_scores, atol=1e-3)
+        self.assertTrue(np.all(std < 1e-2))
+        _, far_std = predict_gaussian_process(observed_points, observed_scores, np.array([[0.1, 0.9]]))
+        self.assertGreater(far_std[0], 0.1)
+
+    def test_respects_budget_and_bounds(self):
+        _, _, total_runs = surrogate_search((0.001, 0.01), (0.1, 0.6), self.evaluate, budget=12, run_times=3, seed=1)
+        self.assertEqual(len(self.evaluated), 12)
+        self.assertEqual(total_runs, 36)
+        for mutation_rate, crossover_rate in self.evaluated:
+            self.assertTrue(0.001 <= mutation_rate <= 0.01)
+            self.assertTrue(0.1 <= crossover_rate <= 0.6)
+
+    def test_finds_peak(self):
+        (mutation_rate, crossover_rate), best_score, _ = surrogate_search(
+            (0.001, 0.01), (0.1, 0.6), self.evaluate, budget=25, seed=0
+        )
+        self.assertAlmostEqual(mutation_rate, 0.004, delta=0.001)
+        self.assertAlmostEqual(crossover_rate, 0.3, delta=0.1)
+        self.assertGreater(best_score, 0.95)
+
+    def test_budget_smaller_than_initial_points(self):
+        surrogate_search((0.001, 0.01), (0.1, 0.6), self.evaluate, budget=2, initial_points=5)
+        self.assertEqual(len(self.evaluated), 2)
+        with self.assertRaises(ValueError):
+            surrogate_search((0.001, 0.01), (0.1, 0.6), self.evaluate, budget=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
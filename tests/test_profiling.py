@@ -0,0 +1,72 @@
+import cProfile
+import os
+import tempfile
+import unittest
+
+from src.profiling import (
+    MERGED_PROFILE_NAME,
+    PROFILE_REPORT_NAME,
+    get_worker_profiles,
+    merge_profiles,
+    prepare_profile_dir,
+    write_profile_report,
+)
+
+
+def profiled_function():
+    return sum(range(1000))
+
+
+def write_worker_profile(profile_dir, worker_id, calls):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(calls):
+        profiled_function()
+    profiler.disable()
+    profiler.dump_stats(os.path.join(profile_dir, f"worker_{worker_id}.prof"))
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.profile_dir = os.path.join(self.directory.name, "profiles")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_prepare_profile_dir_removes_old_profiles(self):
+        prepare_profile_dir(self.profile_dir)
+        write_worker_profile(self.profile_dir, 1, 1)
+        prepare_profile_dir(self.profile_dir)
+        self.assertEqual(get_worker_profiles(self.profile_dir), [])
+
+    def test_merge_profiles_adds_worker_calls(self):
+        prepare_profile_dir(self.profile_dir)
+        write_worker_profile(self.profile_dir, 1, 3)
+        write_worker_profile(self.profile_dir, 2, 4)
+        stats = merge_profiles(self.profile_dir)
+        calls = [
+            primitive_calls
+            for (_, _, function_name), (primitive_calls, *_) in stats.stats.items()
+            if function_name == "profiled_function"
+        ]
+        self.assertEqual(calls, [7])
+
+    def test_merge_profiles_without_profiles(self):
+        prepare_profile_dir(self.profile_dir)
+        with self.assertRaises(FileNotFoundError):
+            merge_profiles(self.profile_dir)
+
+    def test_write_profile_report(self):
+        prepare_profile_dir(self.profile_dir)
+        write_worker_profile(self.profile_dir, 1, 2)
+        report = write_profile_report(self.profile_dir)
+        self.assertIn("Merged 1 worker profiles", report)
+        self.assertIn("profiled_function", report)
+        self.assertTrue(os.path.exists(os.path.join(self.profile_dir, MERGED_PROFILE_NAME)))
+        with open(os.path.join(self.profile_dir, PROFILE_REPORT_NAME)) as report_file:
+            self.assertEqual(report_file.read(), report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from src.result_cache import ResultCache, RunConfig
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResultCache(":memory:")
+        self.config = RunConfig("one_max_genetic_algorithm_vanilla", 50, 35, 400, 0.001, 0.5, "tournament", 0.998)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_empty_cache(self):
+        self.assertEqual(self.cache.get_runs(self.config, 8), [])
+
+    def test_add_and_get_runs(self):
+        self.cache.add_runs(self.config, [(10, 0.99, 1.0), (400, 0.9, 0.97)])
+        self.cache.add_runs(self.config, [(25, 0.995, 1.0)], first_run_index=2)
+        self.assertEqual(self.cache.get_runs(self.config, 8), [(10, 0.99, 1.0), (400, 0.9, 0.97), (25, 0.995, 1.0)])
+        self.assertEqual(self.cache.get_runs(self.config, 2), [(10, 0.99, 1.0), (400, 0.9, 0.97)])
+
+    def test_runs_are_keyed_by_full_config(self):
+        self.cache.add_runs(self.config, [(10, 0.99, 1.0)])
+        self.assertEqual(self.cache.get_runs(self.config._replace(generations=200), 8), [])
+        self.assertEqual(self.cache.get_runs(self.config._replace(crossover_rate=0.6), 8), [])
+        self.assertEqual(self.cache.get_runs(self.config._replace(backend="one_max_genetic_algorithm_numpy"), 8), [])
+        self.assertEqual(self.cache.get_runs(self.config._replace(seed=1), 8), [])
+
+    def test_seeds(self):
+        seeded_config = self.config._replace(seed=42)
+        self.cache.add_runs(seeded_config, [(10, 0.99, 1.0)])
+        self.cache.add_runs(self.config, [(20, 0.98, 1.0)])
+        self.assertEqual(self.cache.get_runs(seeded_config, 8), [(10, 0.99, 1.0)])
+        self.assertEqual(self.cache.get_runs(self.config, 8), [(20, 0.98, 1.0)])
+
+    def test_replaces_existing_runs(self):
+        self.cache.add_runs(self.config, [(10, 0.99, 1.0)])
+        self.cache.add_runs(self.config, [(30, 0.95, 1.0)])
+        self.assertEqual(self.cache.get_runs(self.config, 8), [(30, 0.95, 1.0)])
+
+    def test_persists_on_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache", "results.sqlite3")
+            cache = ResultCache(path)
+            cache.add_runs(self.config, [(10, 0.99, 1.0)])
+            cache.close()
+            cache = ResultCache(path)
+            self.assertEqual(cache.get_runs(self.config, 8), [(10, 0.99, 1.0)])
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
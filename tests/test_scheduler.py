@@ -0,0 +1,113 @@
+import threading
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.scheduler import TaskScheduler
+
+
+class TestTaskScheduler(unittest.TestCase):
+    def setUp(self):
+        self.submitted = []
+
+    def submit_done(self, combination_index):
+        # Every combination is two tasks that are already finished
+        self.submitted.append(combination_index)
+        tasks = [Future(), Future()]
+        for run, future in enumerate(tasks):
+            future.set_result((combination_index, run))
+        return tasks
+
+    def test_wait_returns_tasks_in_order(self):
+        scheduler = TaskScheduler(self.submit_done, num_combinations=5, max_pending=4)
+        for combination_index in range(5):
+            tasks = scheduler.wait(combination_index)
+            self.assertEqual([future.result() for future in tasks], [(combination_index, 0), (combination_index, 1)])
+        self.assertEqual(self.submitted, [0, 1, 2, 3, 4])
+
+    def test_fill_keeps_max_pending_tasks_queued(self):
+        blocked_tasks = []
+
+        def submit_pending(combination_index):
+            self.submitted.append(combination_index)
+            tasks = [Future(), Future()]
+            blocked_tasks.extend(tasks)
+            return tasks
+
+        scheduler = TaskScheduler(submit_pending, num_combinations=10, max_pending=5)
+        scheduler.fill()
+        self.assertEqual(self.submitted, [0, 1, 2])
+        self.assertEqual(len(scheduler.get_pending_tasks()), 6)
+        for future in blocked_tasks[:4]:
+            future.set_result(None)
+        scheduler.fill()
+        self.assertEqual(self.submitted, [0, 1, 2, 3, 4])
+
+    def test_wait_tops_up_queue_while_blocked(self):
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+
+            def submit(combination_index):
+                self.submitted.append(combination_index)
+                if combination_index == 0:  # The first combination has a slow run
+                    return [executor.submit(release.wait), executor.submit(lambda: None)]
+                return [executor.submit(lambda: None)]
+
+            scheduler = TaskScheduler(submit, num_combinations=6, max_pending=2)
+            threading.Timer(0.2, release.set).start()
+            scheduler.wait(0)
+            self.assertEqual(self.submitted, [0, 1, 2, 3, 4, 5])  # Later combinations ran while waiting
+
+    def test_skip_until_cancels_skipped_combinations(self):
+        tasks = {}
+
+        def submit_pending(combination_index):
+            tasks[combination_index] = [Future()]
+            if combination_index >= 6:
+                tasks[combination_index][0].set_result(None)
+            return tasks[combination_index]
+
+        scheduler = TaskScheduler(submit_pending, num_combinations=10, max_pending=4)
+        scheduler.fill()
+        scheduler.skip_until(2)
+        self.assertTrue(tasks[0][0].cancelled())
+        self.assertTrue(tasks[1][0].cancelled())
+        self.assertFalse(tasks[2][0].cancelled())
+        scheduler.skip_until(6)
+        self.assertEqual(scheduler.next_combination, 6)
+        scheduler.wait(6)  # Submitted on demand
+        self.assertIn(6, tasks)
+        scheduler.cancel()
+        self.assertEqual(scheduler.tasks, {})
+        self.assertEqual(scheduler.next_combination, 10)
+
+    def test_cancel_returns_running_tasks(self):
+        # Queued tasks are cancelled, the one a worker already started cannot be and runs to the end
+        started = threading.Event()
+        release = threading.Event()
+
+        def run():
+            started.set()
+            release.wait()
+            return "finished"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            def submit(combination_index):
+                return [executor.submit(run)]
+
+            scheduler = TaskScheduler(submit, num_combinations=4, max_pending=3)
+            scheduler.fill()
+            started.wait()
+            first_task = scheduler.tasks[0][0]
+            queued_tasks = [future for index in [1, 2] for future in scheduler.tasks[index]]
+            running_tasks = scheduler.cancel()
+            self.assertEqual(running_tasks, [first_task])
+            self.assertFalse(first_task.cancelled())
+            self.assertTrue(all(future.cancelled() for future in queued_tasks))
+            release.set()
+            self.assertEqual(running_tasks[0].result(), "finished")
+        self.assertEqual(scheduler.next_combination, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
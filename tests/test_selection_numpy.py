@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+from src.selection_numpy import (
+    get_tournament_rank_cdf,
+    select_parents,
+    select_parents_roulette,
+    select_parents_sus,
+    select_parents_tournament,
+)
+
+
+class TestSelectionNumpy(unittest.TestCase):
+    def setUp(self):
+        self.generator = np.random.default_rng(seed=0)
+
+    def test_get_tournament_rank_cdf_single_individual_tournament(self):
+        # Tournaments of one individual pick every rank with the same probability
+        rank_cdf = get_tournament_rank_cdf(4, 1, 1)
+        for actual, expected in zip(rank_cdf, [0.25, 0.5, 0.75, 1.0]):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_get_tournament_rank_cdf_whole_population_tournament(self):
+        # Tournaments of the whole population are always won by the fittest individual
+        rank_cdf = get_tournament_rank_cdf(5, 5, 5)
+        for actual in rank_cdf:
+            self.assertAlmostEqual(actual, 1.0)
+
+    def test_get_tournament_rank_cdf_two_of_three(self):
+        # The fittest of three wins 2 of the 3 possible pairs, the second one the remaining pair
+        rank_cdf = get_tournament_rank_cdf(3, 2, 2)
+        for actual, expected in zip(rank_cdf, [2 / 3, 1.0, 1.0]):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_select_parents_tournament(self):
+        fitness_values = np.array([0.1, 0.9, 0.5, 0.3, 0.7])
+        selected_idx = select_parents_tournament(self.generator, fitness_values, 1_000, 5)
+        self.assertEqual(len(selected_idx), 1_000)
+        self.assertTrue(all(idx == 1 for idx in selected_idx))  # Whole population tournaments
+
+        selected_idx = select_parents_tournament(self.generator, fitness_values, 1_000, 2, 4)
+        self.assertNotIn(0, selected_idx)
+        self.assertTrue(all(0 <= idx < 5 for idx in selected_idx))
+
+    def test_select_parents_roulette_proportional(self):
+        fitness_values = np.array([0.0, 0.25, 0.75])
+        selected_idx = select_parents_roulette(self.generator, fitness_values, 40_000)
+        counts = np.bincount(selected_idx, minlength=3) / 40_000
+        self.assertEqual(counts[0], 0.0)
+        self.assertTrue(0.23 <= counts[1] <= 0.27)
+        self.assertTrue(0.73 <= counts[2] <= 0.77)
+
+    def test_select_parents_sus_evenly_spaced_pointers(self):
+        # With equal slices every individual gets exactly one pointer
+        fitness_values = np.full(8, 0.5)
+        np.testing.assert_equal(np.sort(select_parents_sus(self.generator, fitness_values, 8)), np.arange(8))
+
+    def test_select_parents_sus_expected_copies(self):
+        # Every individual gets either the floor or the ceiling of its expected number of copies
+        fitness_values = np.array([0.0, 0.1, 0.3, 0.6, 1.0])
+        for _ in range(100):
+            counts = np.bincount(select_parents_sus(self.generator, fitness_values, 10), minlength=5)
+            expected_counts = fitness_values / np.sum(fitness_values) * 10
+            self.assertTrue(np.all(np.floor(expected_counts) <= counts))
+            self.assertTrue(np.all(counts <= np.ceil(expected_counts)))
+
+    def test_select_parents_sus_batch(self):
+        fitness_values = np.array([[0.0, 1.0, 1.0], [1.0, 0.0, 0.0]])
+        selected_idx = select_parents_sus(self.generator, fitness_values, 10)
+        self.assertEqual(selected_idx.shape, (2, 10))
+        self.assertNotIn(0, selected_idx[0])
+        np.testing.assert_equal(selected_idx[1], np.zeros(10))
+
+    def test_select_parents_indices_in_range(self):
+        fitness_values = np.array([0.1, 0.9, 0.5, 0.3])
+        for mode in ["tournament", "roulette", "gibberish"]:
+            selected_idx = select_parents(self.generator, fitness_values, 100, mode)
+            self.assertEqual(len(selected_idx), 100)
+            self.assertTrue(np.all((selected_idx >= 0) & (selected_idx < len(fitness_values))))
+
+    def test_select_parents_tournament_never_picks_the_worst(self):
+        # Tournaments of at least two individuals can never be won by the unique worst one
+        fitness_values = np.array([0.1, 0.9, 0.5, 0.3, 0.7])
+        selected_idx = select_parents(self.generator, fitness_values, 10_000, "tournament")
+        self.assertNotIn(0, selected_idx)
+        self.assertEqual(np.bincount(selected_idx).argmax(), 1)
+
+    def test_select_parents_roulette_zero_fitness(self):
+        fitness_values = np.zeros(5)
+        selected_idx = select_parents(self.generator, fitness_values, 10, "roulette")
+        np.testing.assert_equal(selected_idx, np.zeros(10, dtype=int))
+
+    def test_select_parents_tournament_ties_are_uniform(self):
+        fitness_values = np.full(4, 0.5)
+        selected_idx = select_parents(self.generator, fitness_values, 40_000, "tournament")
+        counts = np.bincount(selected_idx, minlength=4) / 40_000
+        self.assertTrue(np.all((0.23 <= counts) & (counts <= 0.27)))
+
+    def test_select_parents_batch_rows_are_independent(self):
+        fitness_values = np.array([np.arange(10) / 10, np.arange(10)[::-1] / 10])
+        for mode in ["tournament", "roulette"]:
+            selected_idx = select_parents(self.generator, fitness_values, 50, mode)
+            self.assertEqual(selected_idx.shape, (2, 50))
+            self.assertNotIn(0, selected_idx[0])  # Zero fitness or the worst of a tournament of at least 6
+            self.assertNotIn(9, selected_idx[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
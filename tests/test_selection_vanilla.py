@@ -0,0 +1,82 @@
+import random
+import unittest
+
+
+from src.selection_vanilla import (
+    get_tournament_rank_cdf,
+    select_parents,
+    select_parents_roulette,
+    select_parents_sus,
+    select_parents_tournament,
+)
+
+
+class TestSelectionVanilla(unittest.TestCase):
+    def setUp(self):
+        self.generator = random.Random(0)
+
+    def test_get_tournament_rank_cdf_single_individual_tournament(self):
+        # Tournaments of one individual pick every rank with the same probability
+        rank_cdf = get_tournament_rank_cdf(4, 1, 1)
+        for actual, expected in zip(rank_cdf, [0.25, 0.5, 0.75, 1.0]):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_get_tournament_rank_cdf_whole_population_tournament(self):
+        # Tournaments of the whole population are always won by the fittest individual
+        rank_cdf = get_tournament_rank_cdf(5, 5, 5)
+        for actual in rank_cdf:
+            self.assertAlmostEqual(actual, 1.0)
+
+    def test_get_tournament_rank_cdf_two_of_three(self):
+        # The fittest of three wins 2 of the 3 possible pairs, the second one the remaining pair
+        rank_cdf = get_tournament_rank_cdf(3, 2, 2)
+        for actual, expected in zip(rank_cdf, [2 / 3, 1.0, 1.0]):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_select_parents_tournament(self):
+        fitness_values = [0.1, 0.9, 0.5, 0.3, 0.7]
+        selected_idx = select_parents_tournament(self.generator, fitness_values, 1_000, 5)
+        self.assertEqual(len(selected_idx), 1_000)
+        self.assertTrue(all(idx == 1 for idx in selected_idx))  # Whole population tournaments
+
+        selected_idx = select_parents_tournament(self.generator, fitness_values, 1_000, 2, 4)
+        self.assertNotIn(0, selected_idx)
+        self.assertTrue(all(0 <= idx < 5 for idx in selected_idx))
+
+    def test_select_parents_modes(self):
+        fitness_values = [0.1, 0.9, 0.5, 0.3]
+        for mode in ["tournament", "roulette", "gibberish"]:
+            selected_idx = select_parents(self.generator, fitness_values, 100, mode)
+            self.assertEqual(len(selected_idx), 100)
+            self.assertTrue(all(0 <= idx < 4 for idx in selected_idx))
+
+    def test_select_parents_roulette_proportional(self):
+        fitness_values = [0.0, 0.25, 0.75]
+        selected_idx = select_parents_roulette(self.generator, fitness_values, 40_000)
+        self.assertNotIn(0, selected_idx)
+        self.assertTrue(0.23 <= selected_idx.count(1) / 40_000 <= 0.27)
+        self.assertTrue(0.73 <= selected_idx.count(2) / 40_000 <= 0.77)
+
+    def test_select_parents_roulette_zero_fitness(self):
+        self.assertEqual(select_parents_roulette(self.generator, [0.0, 0.0, 0.0], 5), [0, 0, 0, 0, 0])
+
+    def test_select_parents_sus_evenly_spaced_pointers(self):
+        # With equal slices every individual gets exactly one pointer
+        self.assertEqual(sorted(select_parents_sus(self.generator, [0.5] * 8, 8)), list(range(8)))
+
+    def test_select_parents_sus_expected_copies(self):
+        # Every individual gets either the floor or the ceiling of its expected number of copies
+        fitness_values = [0.0, 0.1, 0.3, 0.6, 1.0]
+        for _ in range(100):
+            selected_idx = select_parents_sus(self.generator, fitness_values, 10)
+            self.assertEqual(len(selected_idx), 10)
+            for i, fitness_value in enumerate(fitness_values):
+                expected_count = fitness_value / sum(fitness_values) * 10
+                self.assertTrue(int(expected_count) <= selected_idx.count(i) <= int(expected_count) + 1)
+
+    def test_select_parents_sus_zero_fitness(self):
+        self.assertEqual(select_parents_sus(self.generator, [0.0, 0.0], 3), [0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
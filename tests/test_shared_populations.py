@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from src.fitness_functions import DeceptiveTrap
+from src.shared_populations import SharedPopulations
+
+
+class TestSharedPopulations(unittest.TestCase):
+    def setUp(self):
+        self.populations = SharedPopulations(3, 4, 5)
+
+    def tearDown(self):
+        self.populations.unlink()
+
+    def test_new_block_is_empty(self):
+        self.assertEqual(self.populations.populations.shape, (3, 4, 5))
+        self.assertEqual(self.populations.populations.dtype, np.int8)
+        self.assertFalse(np.any(self.populations.populations))
+
+    def test_attach_shares_the_block(self):
+        # A process attaching with the handle sees the writes of the creator and the other way around
+        attached = SharedPopulations.attach(self.populations.get_handle())
+        try:
+            self.populations.get_population(1)[2] = 1
+            np.testing.assert_array_equal(attached.get_population(1)[2], np.ones(5))
+            attached.get_population(2)[:] = 1
+            self.assertTrue(np.all(self.populations.get_population(2) == 1))
+            self.assertFalse(np.any(attached.get_population(0)))
+        finally:
+            attached.close()
+
+    def test_get_best_genome(self):
+        self.populations.get_population(0)[1] = [1, 1, 1, 0, 0]
+        self.populations.get_population(2)[3] = [1, 1, 1, 1, 0]
+        best_genome, best_fitness = self.populations.get_best_genome([0, 1])
+        np.testing.assert_array_equal(best_genome, [1, 1, 1, 0, 0])
+        self.assertAlmostEqual(best_fitness, 0.6)
+        best_genome, best_fitness = self.populations.get_best_genome(range(3))
+        np.testing.assert_array_equal(best_genome, [1, 1, 1, 1, 0])
+        self.assertAlmostEqual(best_fitness, 0.8)
+
+    def test_get_best_genome_fitness_function(self):
+        # The all zero genomes of the empty slots are a local optimum of the trap
+        best_genome, best_fitness = self.populations.get_best_genome(range(3), DeceptiveTrap(5, block_size=5))
+        np.testing.assert_array_equal(best_genome, np.zeros(5))
+        self.assertAlmostEqual(best_fitness, 0.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from src import timeit_functions
+from src.timeit_functions import EventLog, Histogram, MetricsRegistry, timeit
+
+
+class TestHistogram(unittest.TestCase):
+    def test_add(self):
+        histogram = Histogram()
+        for duration in [0.001, 0.002, 0.004]:
+            histogram.add(duration)
+        stats = histogram.to_dict()
+        self.assertEqual(stats["count"], 3)
+        self.assertAlmostEqual(stats["total"], 0.007)
+        self.assertAlmostEqual(stats["mean"], 0.007 / 3)
+        self.assertEqual(stats["min"], 0.001)
+        self.assertEqual(stats["max"], 0.004)
+        self.assertEqual(sum(stats["buckets_us"].values()), 3)
+
+    def test_percentiles_are_bucket_upper_bounds(self):
+        histogram = Histogram()
+        for _ in range(99):
+            histogram.add(0.000003)  # 3 us, in the <=4 us bucket
+        histogram.add(1.0)
+        self.assertEqual(histogram.get_percentile(50), 4e-6)
+        self.assertEqual(histogram.get_percentile(100), 1.0)
+
+    def test_empty(self):
+        stats = Histogram().to_dict()
+        self.assertEqual(stats["count"], 0)
+        self.assertEqual(stats["min"], 0.0)
+        self.assertEqual(stats["mean"], 0.0)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_nested_scopes(self):
+        registry = MetricsRegistry()
+        with registry.scope("sweep"):
+            for _ in range(3):
+                with registry.scope("combination"):
+                    pass
+        snapshot = registry.get_snapshot()
+        self.assertEqual(set(snapshot), {"sweep", "sweep/combination"})
+        self.assertEqual(snapshot["sweep/combination"]["count"], 3)
+        self.assertEqual(snapshot["sweep"]["count"], 1)
+        self.assertGreaterEqual(snapshot["sweep"]["total"], snapshot["sweep/combination"]["total"])
+
+    def test_scope_records_on_error(self):
+        registry = MetricsRegistry()
+        with self.assertRaises(ValueError):
+            with registry.scope("failing"):
+                raise ValueError()
+        self.assertEqual(registry.get_snapshot()["failing"]["count"], 1)
+        self.assertEqual(registry.scopes, [])
+
+    def test_timeit_records_into_registry(self):
+        timeit_functions.registry.reset()
+
+        @timeit
+        def timed_function():
+            return 42
+
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(timed_function(), 42)
+            timed_function()
+        self.assertIn("Function timed_function Took", output.getvalue())
+        self.assertEqual(timeit_functions.registry.get_snapshot()["timed_function"]["count"], 2)
+        timeit_functions.registry.reset()
+
+
+class TestEventLog(unittest.TestCase):
+    def test_emit_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.jsonl")
+            event_log = EventLog(path)
+            event_log.emit("combination", score=0.5, worker_ids=[1, 2])
+            event_log.emit("sweep", score=0.5)
+            event_log.close()
+            with open(path) as events_file:
+                events = [json.loads(line) for line in events_file]
+        self.assertEqual([event["event"] for event in events], ["combination", "sweep"])
+        self.assertEqual(events[0]["worker_ids"], [1, 2])
+        self.assertIn("timestamp", events[0])
+
+    def test_emit_to_stdout(self):
+        with redirect_stdout(io.StringIO()) as output:
+            event_log = EventLog("-")
+            event_log.emit("combination", score=1.0)
+            event_log.close()
+        self.assertEqual(json.loads(output.getvalue())["score"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from src.utils import generate_equally_spaced_values
+from src.utils import generate_equally_spaced_values, spawn_seeds
 
 
 class TestGenerateEquallySpacedValues(unittest.TestCase):
@@ -39,5 +39,21 @@ class TestGenerateEquallySpacedValues(unittest.TestCase):
         self.assertEqual(generate_equally_spaced_values(min_val, max_val, length, invert=True), expected_values)
 
 
+class TestSpawnSeeds(unittest.TestCase):
+    def test_same_master_seed_same_seeds(self):
+        self.assertEqual(spawn_seeds(42, 5), spawn_seeds(42, 5))
+        self.assertEqual(spawn_seeds(42, 5, (1, 2)), spawn_seeds(42, 5, (1, 2)))
+
+    def test_seeds_are_distinct(self):
+        seeds = spawn_seeds(42, 8)
+        self.assertEqual(len(set(seeds)), 8)
+        self.assertNotEqual(spawn_seeds(43, 8), seeds)
+        self.assertNotEqual(spawn_seeds(42, 8, (1, 2)), seeds)
+
+    def test_prefix_is_stable(self):
+        # Asking for more runs keeps the seeds of the earlier ones
+        self.assertEqual(spawn_seeds(42, 8)[:3], spawn_seeds(42, 3))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+import os
+import pstats
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src import worker
+from src.one_max_genetic_algorithm_numpy import genetic_algorithm_stream
+from src.shared_populations import SharedPopulations
+from src.worker import (
+    get_backend,
+    get_shared_populations,
+    init_worker,
+    run_genetic_algorithm,
+    run_genetic_algorithm_batch,
+    run_genetic_algorithm_instrumented,
+    run_in_shared_slot,
+    run_with_worker_id,
+)
+
+
+class TestWorker(unittest.TestCase):
+    def tearDown(self):
+        worker.backend = None
+
+    def test_get_backend_not_initialized(self):
+        worker.backend = None
+        with self.assertRaises(RuntimeError):
+            get_backend()
+
+    def test_init_worker_imports_backend(self):
+        init_worker("src.one_max_genetic_algorithm_vanilla")
+        self.assertEqual(get_backend().__name__, "src.one_max_genetic_algorithm_vanilla")
+
+    def test_run_genetic_algorithm(self):
+        init_worker("src.one_max_genetic_algorithm_numpy")
+        results = run_genetic_algorithm(20, 10, 50, 0.01, 0.5, "tournament", 0.9, vectorized=True)
+        self.assertEqual(len(results), 1)
+        generation, generation_fitness, best_fitness = results[0]
+        self.assertLessEqual(generation, 50)
+        self.assertLessEqual(generation_fitness, 1)
+        self.assertLessEqual(best_fitness, 1)
+
+    def test_run_genetic_algorithm_batch(self):
+        init_worker("src.one_max_genetic_algorithm_vanilla_packed")
+        results = run_genetic_algorithm_batch(3, 20, 10, 50, 0.01, 0.5, "tournament", 0.9)
+        self.assertEqual(len(results), 3)
+
+    def test_run_genetic_algorithm_instrumented(self):
+        init_worker("src.one_max_genetic_algorithm_vanilla")
+        params = (20, 10, 50, 0.01, 0.5, "tournament", 0.9)
+        [(result, instrumentation)] = run_genetic_algorithm_instrumented(*params, seed=5)
+        self.assertEqual(result, run_genetic_algorithm(*params, seed=5)[0])
+        self.assertEqual(len(instrumentation["mean_fitness"]), min(result[0] + 1, 50))
+
+    def test_run_with_worker_id(self):
+        init_worker("src.one_max_genetic_algorithm_vanilla")
+        worker_id, results = run_with_worker_id(run_genetic_algorithm, 20, 10, 5, 0.01, 0.5, "tournament", 0.9)
+        self.assertEqual(worker_id, os.getpid())
+        self.assertEqual(len(results), 1)
+
+    def test_run_with_worker_id_profiles_tasks(self):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            init_worker("src.one_max_genetic_algorithm_vanilla", profile_dir)
+            try:
+                run_with_worker_id(run_genetic_algorithm, 20, 10, 5, 0.01, 0.5, "tournament", 0.9)
+                stats = pstats.Stats(os.path.join(profile_dir, f"worker_{os.getpid()}.prof"))
+                function_names = {function_name for _, _, function_name in stats.stats}
+                self.assertIn("genetic_algorithm", function_names)
+            finally:
+                worker.profiler = None
+
+    def test_run_in_shared_slot(self):
+        init_worker("src.one_max_genetic_algorithm_numpy")
+        populations = SharedPopulations(2, 20, 10)
+        try:
+            params = (20, 10, 50, 0.01, 0.5, "tournament", 0.9)
+            [result] = run_in_shared_slot(run_genetic_algorithm, populations.get_handle(), 1, *params, seed=5)
+            self.assertEqual(result, run_genetic_algorithm(*params, seed=5)[0])
+            snapshots = list(genetic_algorithm_stream(*params, seed=5, copy_population=True))
+            np.testing.assert_array_equal(populations.get_population(1), snapshots[-1].population)
+            self.assertFalse(np.any(populations.get_population(0)))
+            # The block stays attached for the next tasks of the worker
+            attached = worker.shared_populations[populations.block.name]
+            self.assertIs(get_shared_populations(populations.get_handle()), attached)
+        finally:
+            worker.shared_populations.pop(populations.block.name).close()
+            populations.unlink()
+
+    def test_run_in_shared_slot_process_pool(self):
+        # Only the result tuples go back through the pipes, the main process reads the populations from the block
+        populations = SharedPopulations(3, 20, 10)
+        try:
+            params = (20, 10, 50, 0.01, 0.5, "tournament", 0.9)
+            with ProcessPoolExecutor(
+                max_workers=2, initializer=init_worker, initargs=("src.one_max_genetic_algorithm_numpy",)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        run_in_shared_slot, run_genetic_algorithm, populations.get_handle(), slot, *params, seed=slot
+                    )
+                    for slot in range(3)
+                ]
+                results = [future.result()[0] for future in futures]
+            init_worker("src.one_max_genetic_algorithm_numpy")
+            for slot, result in enumerate(results):
+                self.assertEqual(result, run_genetic_algorithm(*params, seed=slot)[0])
+                snapshots = list(genetic_algorithm_stream(*params, seed=slot, copy_population=True))
+                np.testing.assert_array_equal(populations.get_population(slot), snapshots[-1].population)
+        finally:
+            populations.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()